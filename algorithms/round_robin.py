@@ -1,184 +1,235 @@
-from typing import List, Optional, Dict, Tuple
+from typing import Iterator, List, Optional, Union
 from collections import deque
 from ..core.scheduler_base import SchedulerStrategy
-from ..core.models import Process, ScheduleResult, ExecSlice
+from ..core.models import Process, Workload, ScheduleEvent, RotationRun
+from ..core.kernel import SimulationKernel, EventEmitter
 
 class RoundRobin(SchedulerStrategy):
     """
     Round Robin que garantiza: un BLOCK solo comienza tras la completa consumición
     del tramo CPU previo. Quantum define cuánto se ejecuta por paso; si no se completa
     el tramo CPU, el proceso se reencola y NO se inicia el BLOCK.
+
+    Avance rápido: si todos los listos tienen CPU de sobra y no hay llegadas ni
+    desbloqueos hasta el próximo evento, la cola rota sin cambios. Esas vueltas
+    completas se saltan analíticamente y quedan en el timeline como un único
+    RotationRun, que se expande a los mismos ExecSlice solo al recorrerlo (con
+    un solo listo, como un único tramo). No se abre un RotationRun pegado a un
+    tramo del mismo proceso que lo encabeza, así el timeline sale ya unido.
     """
 
-    def schedule(self, processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+    uses_quantum = True
+
+    def report_order(self, workload: Workload) -> List[Process]:
+        # Métricas en orden de llegada, igual que la simulación
+        return [workload.processes[pid] for pid in workload.arrival_order]
+
+    def schedule_iter(self, processes: Union[List[Process], Workload], quantum: Optional[int] = None) -> Iterator[ScheduleEvent]:
         if quantum is None or quantum <= 0:
             raise ValueError("Quantum inválido para Round Robin.")
 
-        if not processes:
-            return ScheduleResult()
-
-        # Orden determinista por llegada
-        procs = sorted(processes, key=lambda p: p.arrival)
-        patterns: Dict[str, List[Tuple[str, int]]] = {
-            p.name: (p.pattern.copy() if p.pattern else [("CPU", p.burst)]) for p in procs
-        }
-        arrivals: Dict[str, int] = {p.name: p.arrival for p in procs}
-        n = len(procs)
-
-        # Estado
-        time = min(p.arrival for p in procs)
-        timeline: List[ExecSlice] = []
-        per_proc: Dict[str, List[Tuple[int, int]]] = {p.name: [] for p in procs}
-        completion: Dict[str, int] = {}
-        blocked: Dict[str, int] = {}   # proceso -> tiempo de desbloqueo
+        w = Workload.of(processes)
+        if not w.n:
+            return
+
+        # Tramos codificados de la Workload (solo lectura: CPU d -> d, BLOCK d -> ~d);
+        # cursor aplanado por proceso
+        n = w.n
+        names = w.names
+        segs, offsets = w.segments, w.seg_offsets
+        pos = list(offsets[:n])
+
+        # Estado (llegadas en orden determinista por llegada)
+        time = w.arrivals[w.arrival_order[0]]
+        emit = EventEmitter(w)
+        kernel = SimulationKernel(w)
+        blocked = kernel.blocked       # heap de desbloqueos
         ready = deque()
-        idx = 0                        # puntero para llegadas
-        done = set()
+        in_ready = bytearray(n)        # espejo de 'ready' para pertenencia O(1)
+        done = bytearray(n)
+        completed = 0
 
-        # Remanente del tramo CPU actual por proceso (si existe)
-        rem_cpu: Dict[str, int] = {}
+        # Remanente del tramo CPU actual por proceso (None si no existe)
+        rem_cpu: List[Optional[int]] = [None] * n
+
+        def push_ready(pid: int):
+            ready.append(pid)
+            in_ready[pid] = 1
 
         def enqueue_arrivals(upto: int):
-            nonlocal idx
-            while idx < len(procs) and procs[idx].arrival <= upto:
-                name = procs[idx].name
-                if name not in ready and name not in blocked and name not in done:
-                    ready.append(name)
-                idx += 1
+            for pid in kernel.arrivals.pop_due(upto):
+                push_ready(pid)
+
+        def cpu_left(pid: int) -> int:
+            r = rem_cpu[pid]
+            return segs[pos[pid]] if r is None else r
+
+        def stable_rounds(now: int) -> int:
+            """Vueltas completas que ready puede rotar desde 'now' sin ningún cambio externo."""
+            nu = blocked.peek()
+            if nu is not None and nu <= now:
+                return 0
+            t_next = kernel.next_event_after(now)
+            # La última vuelta debe terminar antes del evento: uno justo en el borde
+            # se encolaría delante del proceso que acaba de usar su quantum.
+            rounds = None if t_next is None else (t_next - now - 1) // (len(ready) * quantum)
+            if rounds is not None and rounds < 1:
+                return 0
+            for pid in ready:
+                if pid in blocked or done[pid] or pos[pid] == offsets[pid + 1] or segs[pos[pid]] < 0:
+                    return 0
+                # Cada vuelta debe dejarle CPU pendiente (si no, se bloquea o termina)
+                r = (cpu_left(pid) - 1) // quantum
+                if rounds is None or r < rounds:
+                    rounds = r
+                if rounds < 1:
+                    return 0
+            return rounds
+
+        # Tras un intento fallido no se reintenta hasta despachar una cola completa,
+        # así el chequeo O(len(ready)) queda amortizado.
+        ff_cooldown = 0
 
         # Inicial: enqueue de llegadas en 'time'
         enqueue_arrivals(time)
 
-        while len(done) < n:
-            # Procesar desbloqueos que terminaron en o antes de 'time'
-            for name in sorted(list(blocked)):
-                if blocked[name] <= time:
-                    blocked.pop(name)
-                    if name not in ready and name not in done:
-                        ready.append(name)
+        while completed < n:
+
+            yield from emit.drain()
+
+            # Procesar desbloqueos que terminaron en o antes de 'time' (orden alfabético)
+            due = blocked.pop_due(time)
+            if len(due) > 1:
+                due.sort(key=lambda e: names[e[0]])
+            for pid, _ in due:
+                if not in_ready[pid] and not done[pid]:
+                    push_ready(pid)
 
             # Aceptar llegadas en 'time'
             enqueue_arrivals(time)
 
             if not ready:
                 # Saltar al siguiente evento real (llegada futura o fin de bloqueo)
-                future = []
-                future.extend(t for t in blocked.values() if t > time)
-                future.extend(p.arrival for p in procs if p.name not in done and p.name not in blocked and p.arrival > time)
-                if not future:
+                t_next = kernel.next_event_after(time)
+                if t_next is None:
                     break
-                time = min(future)
+                time = t_next
                 # loop volverá a procesar desbloqueos/llegadas en la cima
                 continue
 
+            if ff_cooldown > 0:
+                ff_cooldown -= 1
+            else:
+                rounds = stable_rounds(time)
+                if rounds > 0 and len(ready) == 1:
+                    # Un único listo: las vueltas son un solo tramo continuo
+                    pid = ready[0]
+                    emit.dispatch(pid, time, time + rounds * quantum)
+                    rem_cpu[pid] = cpu_left(pid) - rounds * quantum
+                    time += rounds * quantum
+                    continue
+                if rounds > 0 and not emit.continues(ready[0], time):
+                    run = RotationRun([names[pid] for pid in ready], time, quantum, rounds)
+                    emit.rotation(run)
+                    for pid in ready:
+                        rem_cpu[pid] = cpu_left(pid) - rounds * quantum
+                    time = run.end
+                    continue
+                if rounds == 0:
+                    ff_cooldown = len(ready)
+
             current = ready.popleft()
+            in_ready[current] = 0
 
             # Defensa: si cambió su estado mientras tanto, saltarlo
-            if current in blocked or current in done:
+            if current in blocked or done[current]:
                 continue
 
-            pattern = patterns.get(current, [])
+            i = pos[current]
 
             # Si no hay patrón: terminar
-            if not pattern:
-                completion[current] = time
-                done.add(current)
-                rem_cpu.pop(current, None)
+            if i == offsets[current + 1]:
+                emit.complete(current, time)
+                done[current] = 1
+                completed += 1
+                rem_cpu[current] = None
                 continue
 
             # Asegurar rem_cpu para el tramo CPU actual si corresponde
-            kind, duration = pattern[0]
+            code = segs[i]
 
             # Si el primer segmento es BLOCK (caso raro si la entrada lo define así),
             # no lo arrancamos a menos que llegue el momento de comenzar bloqueos.
-            if kind == "BLOCK":
+            if code < 0:
+                duration = ~code
                 # Esto solo puede ocurrir si la definición empieza por BLOCK; respetamos y lo ejecutamos
                 if duration > 0:
-                    timeline.append(ExecSlice(f"{current}_BLOCK", time, time + duration))
-                blocked[current] = time + duration
+                    emit.block(current, time, time + duration)
+                blocked.push(current, time + duration)
                 # consumir ese segmento del patrón
-                pattern.pop(0)
-                rem_cpu.pop(current, None)
+                pos[current] += 1
+                rem_cpu[current] = None
                 # NO avanzar 'time' aquí: permitimos que otros ready usen CPU en el mismo instante
                 continue
 
-            # kind == "CPU": inicializar rem_cpu si no existe
-            if current not in rem_cpu:
-                rem_cpu[current] = duration
+            # Tramo CPU: inicializar rem_cpu si no existe
+            if rem_cpu[current] is None:
+                rem_cpu[current] = code
 
             # Ejecutar min(quantum, rem_cpu)
             run = min(quantum, rem_cpu[current])
             start = time
             end = start + run
-            timeline.append(ExecSlice(current, start, end))
-            per_proc[current].append((start, end))
+            emit.dispatch(current, start, end)
             rem_cpu[current] -= run
             time = end
 
             # Tras ejecutar, procesar llegadas y desbloqueos que ocurrieron hasta 'time'
             enqueue_arrivals(time)
-            # desbloqueos que finalizan <= time
-            for name in list(blocked):
-                if blocked[name] <= time:
-                    blocked.pop(name)
-                    if name not in ready and name not in done and name != current:
-                        ready.append(name)
+            # desbloqueos que finalizan <= time (en el orden en que se bloquearon)
+            for pid, _ in blocked.pop_due(time, order="blocked"):
+                if not in_ready[pid] and not done[pid] and pid != current:
+                    push_ready(pid)
 
             # Si remanente del tramo CPU quedó > 0: tramo no terminado -> reencolar, NO iniciar BLOCK
             if rem_cpu[current] > 0:
-                if current not in ready and current not in blocked and current not in done:
-                    ready.append(current)
+                if not in_ready[current] and current not in blocked and not done[current]:
+                    push_ready(current)
                 continue
 
             # Si rem_cpu == 0: terminamos ese segmento CPU -> avanzamos el patrón
-            pattern.pop(0)
-            rem_cpu.pop(current, None)
+            pos[current] += 1
+            rem_cpu[current] = None
 
             # Ahora mirar siguiente segmento del patrón: si es BLOCK, iniciarlo inmediatamente
-            if pattern:
-                next_kind, next_dur = pattern[0]
-                if next_kind == "BLOCK":
+            i = pos[current]
+            if i < offsets[current + 1]:
+                next_code = segs[i]
+                if next_code < 0:
+                    next_dur = ~next_code
                     # Registrar bloque iniciando en 'time' y marcar desbloqueo
                     if next_dur > 0:
-                        timeline.append(ExecSlice(f"{current}_BLOCK", time, time + next_dur))
-                    blocked[current] = time + next_dur
+                        emit.block(current, time, time + next_dur)
+                    blocked.push(current, time + next_dur)
                     # consumir el segmento BLOCK del patrón
-                    pattern.pop(0)
+                    pos[current] += 1
                     # No reencolar ahora; volverá a ready cuando se desbloquee
                     # Si el proceso quedó sin más segmentos después del BLOCK, lo marcaríamos completado en su desbloqueo
                     # (se completará cuando blocked se procese y make it ready, then pattern empty => completion).
                     continue
                 else:
                     # Siguiente también es CPU: inicializar su remanente y reencolar
-                    rem_cpu[current] = next_dur
-                    if current not in ready and current not in blocked and current not in done:
-                        ready.append(current)
+                    rem_cpu[current] = next_code
+                    if not in_ready[current] and current not in blocked and not done[current]:
+                        push_ready(current)
                     continue
             else:
                 # No quedan segmentos -> proceso completado ahora
-                completion[current] = time
-                done.add(current)
+                emit.complete(current, time)
+                done[current] = 1
+                completed += 1
                 continue
 
         # Métricas
-        turnaround: Dict[str, int] = {}
-        waiting: Dict[str, int] = {}
-        for p in procs:
-            orig_pat = p.pattern if p.pattern else patterns.get(p.name, [("CPU", p.burst)])
-            total_cpu = sum(d for k, d in (orig_pat or []) if k == "CPU")
-            total_block = sum(d for k, d in (orig_pat or []) if k == "BLOCK")
-            fin = completion.get(p.name, time)
-            tr = fin - p.arrival
-            te = tr - total_cpu - total_block
-            turnaround[p.name] = max(0, tr)
-            waiting[p.name] = max(0, te)
-
-        n_effective = max(1, len(procs))
-        return ScheduleResult(
-            timeline=timeline,
-            per_process_slices=per_proc,
-            turnaround=turnaround,
-            waiting=waiting,
-            avg_turnaround=sum(turnaround.values()) / n_effective,
-            avg_waiting=sum(waiting.values()) / n_effective
-        )
+        emit.finish(time)
+        yield from emit.drain()
@@ -1,157 +1,149 @@
-from typing import List, Optional, Dict, Tuple
+from typing import Iterator, List, Optional, Tuple, Union
 import heapq
 
-from ..core.scheduler_base import SchedulerStrategy
-from ..core.models import Process, ScheduleResult, ExecSlice
+from ..core.scheduler_base import SchedulerStrategy, ProgressCallback
+from ..core.models import Process, Workload, ScheduleEvent, ScheduleResult
+from ..core.kernel import SimulationKernel, EventEmitter
+from ..core.closed_form import sjf_plan
 
 class SJF(SchedulerStrategy):
-    def schedule(self, processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+    def _schedule(self, w: Workload, quantum: Optional[int],
+                  progress: Optional[ProgressCallback], spill: bool) -> ScheduleResult:
+        # Sin E/S y con una sola ráfaga por proceso: forma cerrada (ver core/closed_form.py)
+        plan = sjf_plan(w)
+        result = plan.result(spill) if plan is not None else None
+        if result is None:
+            return super()._schedule(w, quantum, progress, spill)
+        if progress is not None:
+            progress(w.n, w.n)
+        return result
+
+    def schedule_iter(self, processes: Union[List[Process], Workload], quantum: Optional[int] = None) -> Iterator[ScheduleEvent]:
         # Orden original y cantidad
-        procs = processes
-        n = len(procs)
+        w = Workload.of(processes)
+        plan = sjf_plan(w)
+        if plan is not None:
+            yield from plan.events()
+            return
+        n = w.n
+        names, arrivals = w.names, w.arrivals
 
         # Reloj, resultados y métricas
         time = 0
-        timeline: List[ExecSlice] = []
-        per_proc: Dict[str, List[Tuple[int, int]]] = {p.name: [] for p in procs}
-        completion: Dict[str, int] = {}
-        turnaround: Dict[str, int] = {}
-        waiting: Dict[str, int] = {}
-
-        # Patrón (CPU/BLOCK) y siguientes índices
-        patterns: Dict[str, List[Tuple[str, int]]] = {
-            p.name: (p.pattern.copy() if p.pattern else [("CPU", p.burst)])
-            for p in procs
-        }
-        next_index: Dict[str, int] = {p.name: 0 for p in procs}
-        arrivals: Dict[str, int] = {p.name: p.arrival for p in procs}
-
-        # 1) Calcular CPU total fijo por proceso (criterio puro SJF)
-        total_cpu: Dict[str, int] = {
-            p.name: sum(d for k, d in patterns[p.name] if k == "CPU")
-            for p in procs
-        }
-
-        # 2) Ready como min-heap de (total_cpu, arrival, name)
-        ready_heap: List[Tuple[int, int, str]] = []
-        ready_set = set()       # Para evitar duplicados
-        blocked: Dict[str, int] = {}  # nombre -> tiempo de desbloqueo
-        done = set()                 # procesos completos
-        last_end: Dict[str, int] = {p.name: p.arrival for p in procs}
+        emit = EventEmitter(w)
+
+        # Tramos codificados de la Workload (CPU d -> d, BLOCK d -> ~d) y
+        # siguiente índice aplanado por proceso
+        segs, offsets = w.segments, w.seg_offsets
+        next_index = list(offsets[:n])
+
+        # 1) CPU total fijo por proceso (criterio puro SJF), por sumas prefijas
+        total_cpu = [w.total_cpu(pid) for pid in range(n)]
+
+        # 2) Ready como min-heap de (total_cpu, arrival, name, pid)
+        ready_heap: List[Tuple[int, int, str, int]] = []
+        in_ready = bytearray(n)      # Para evitar duplicados
+        kernel = SimulationKernel(w)
+        blocked = kernel.blocked     # heap de desbloqueos
+        done = bytearray(n)          # procesos completos
+        completed = 0
+        last_end = list(arrivals)
+
+        def push_ready(pid: int):
+            heapq.heappush(ready_heap, (total_cpu[pid], arrivals[pid], names[pid], pid))
+            in_ready[pid] = 1
 
         def enqueue_arrivals(t: int):
-            for p in procs:
-                name = p.name
-                if name in done or name in blocked or name in ready_set:
-                    continue
-                if next_index[name] == 0 and arrivals[name] <= t:
-                    heapq.heappush(ready_heap, (total_cpu[name], arrivals[name], name))
-                    ready_set.add(name)
+            # El cursor entrega cada llegada una sola vez
+            for pid in kernel.arrivals.pop_due(t):
+                push_ready(pid)
 
         def unblock_at(t: int):
-            to_unblock = [name for name, unb in blocked.items() if unb <= t]
-            for name in to_unblock:
-                blocked.pop(name)
-                if name in done or name in ready_set:
+            for pid, _ in blocked.pop_due(t):
+                if done[pid] or in_ready[pid]:
                     continue
-                heapq.heappush(ready_heap, (total_cpu[name], arrivals[name], name))
-                ready_set.add(name)
+                push_ready(pid)
+
+        def finish(pid: int):
+            nonlocal completed
+            emit.complete(pid, last_end[pid])
+            done[pid] = 1
+            completed += 1
 
         # Primeros arribos en t=0
         enqueue_arrivals(time)
 
-        while len(done) < n:
+        while completed < n:
+
+            yield from emit.drain()
+
             unblock_at(time)
             enqueue_arrivals(time)
 
             if not ready_heap:
                 # Saltar al próximo evento (llegada o desbloqueo)
-                future_arr = [
-                    arrivals[p.name]
-                    for p in procs
-                    if next_index[p.name] == 0 and p.name not in done and arrivals[p.name] > time
-                ]
-                future_unb = [u for u in blocked.values() if u > time]
-                future = future_arr + future_unb
-                if not future:
+                t_next = kernel.next_event_after(time)
+                if t_next is None:
                     break
-                time = min(future)
+                time = t_next
                 continue
 
             # Selección no-preemptiva por CPU total inmutable
-            _, _, selected = heapq.heappop(ready_heap)
-            ready_set.remove(selected)
+            selected = heapq.heappop(ready_heap)[3]
+            in_ready[selected] = 0
 
             idx = next_index[selected]
+            end_idx = offsets[selected + 1]
             # Si ya acabó todos sus tramos:
-            if idx >= len(patterns[selected]):
-                completion[selected] = last_end[selected]
-                done.add(selected)
+            if idx >= end_idx:
+                finish(selected)
                 continue
 
-            kind, dur = patterns[selected][idx]
+            code = segs[idx]
 
-            if kind == "BLOCK":
+            if code < 0:
+                dur = ~code
                 start, end = time, time + dur
                 if dur > 0:
-                    timeline.append(ExecSlice(f"{selected}_BLOCK", start, end))
+                    emit.block(selected, start, end)
                 last_end[selected] = max(last_end[selected], end)
-                blocked[selected] = end
+                blocked.push(selected, end)
                 next_index[selected] += 1
 
-                if next_index[selected] >= len(patterns[selected]):
-                    completion[selected] = last_end[selected]
-                    done.add(selected)
+                if next_index[selected] >= end_idx:
+                    finish(selected)
                 # El reloj no avanza aquí
                 continue
 
             # Ejecutar tramo CPU completo
-            start, end = time, time + dur
-            timeline.append(ExecSlice(selected, start, end))
-            per_proc[selected].append((start, end))
+            start, end = time, time + code
+            emit.dispatch(selected, start, end)
             last_end[selected] = max(last_end[selected], end)
             time = end
             next_index[selected] += 1
 
             # Tras CPU, chequear siguiente tramo inmediato
-            if next_index[selected] < len(patterns[selected]):
-                nk, nd = patterns[selected][next_index[selected]]
-                if nk == "BLOCK":
+            if next_index[selected] < end_idx:
+                nc = segs[next_index[selected]]
+                if nc < 0:
+                    nd = ~nc
                     bstart, bend = time, time + nd
                     if nd > 0:
-                        timeline.append(ExecSlice(f"{selected}_BLOCK", bstart, bend))
+                        emit.block(selected, bstart, bend)
                     last_end[selected] = max(last_end[selected], bend)
-                    blocked[selected] = bend
+                    blocked.push(selected, bend)
                     next_index[selected] += 1
-                    if next_index[selected] >= len(patterns[selected]):
-                        completion[selected] = last_end[selected]
-                        done.add(selected)
+                    if next_index[selected] >= end_idx:
+                        finish(selected)
                 else:
                     # Sigue CPU: volver a entrar a ready con misma prioridad
-                    heapq.heappush(ready_heap, (total_cpu[selected], arrivals[selected], selected))
-                    ready_set.add(selected)
+                    push_ready(selected)
             else:
                 # Patrón completo
-                completion[selected] = last_end[selected]
-                done.add(selected)
+                finish(selected)
 
         # Cálculo final de turnaround y waiting
-        for p in procs:
-            pat = patterns[p.name]
-            cpu_sum = sum(d for k, d in pat if k == "CPU")
-            block_sum = sum(d for k, d in pat if k == "BLOCK")
-            fin = completion.get(p.name, last_end[p.name])
-            tr = fin - p.arrival
-            wt = tr - cpu_sum - block_sum
-            turnaround[p.name] = max(0, tr)
-            waiting[p.name] = max(0, wt)
-
-        # Resultado
-        return ScheduleResult(
-            timeline=timeline,
-            per_process_slices=per_proc,
-            turnaround=turnaround,
-            waiting=waiting,
-            avg_turnaround=sum(turnaround.values()) / max(1, n),
-            avg_waiting=sum(waiting.values()) / max(1, n)
-        )
+        for pid in range(n):
+            emit.complete(pid, last_end[pid])
+        emit.finish(time)
+        yield from emit.drain()
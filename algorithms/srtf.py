@@ -1,6 +1,7 @@
-from typing import List, Optional, Dict, Tuple
+from typing import Iterator, List, Optional, Tuple, Union
 from ..core.scheduler_base import SchedulerStrategy
-from ..core.models import Process, ScheduleResult, ExecSlice
+from ..core.models import Process, Workload, ScheduleEvent
+from ..core.kernel import SimulationKernel, IndexedMinHeap, EventEmitter
 
 class SRTF(SchedulerStrategy):
     """
@@ -14,123 +15,115 @@ class SRTF(SchedulerStrategy):
     - La métrica de selección es el tiempo CPU total restante (suma de todos
       los tramos CPU pendientes). En caso de empate se aplica orden por llegada
       (arrival menor), luego por orden de entrada en la lista 'processes'.
+      Ready es un min-heap direccionable con esa clave; el remanente se obtiene
+      en O(1) con las sumas prefijas de CPU de la Workload.
     - Si un nuevo proceso llega exactamente en t y su remanente es menor que el
       remanente del activo, se preemite inmediatamente (es decir, preempción en
       el punto temporal exacto).
     - Un tramo BLOCK nunca se inicia hasta que el tramo CPU anterior haya sido
       completado. Cuando un proceso entra en BLOCK se marca su desbloqueo y no
       está en ready hasta entonces.
-    - Se representan los tramos BLOCK como ExecSlice("{name}_BLOCK", start, end).
+    - Los tramos BLOCK se registran con tipo SLICE_BLOCK (vista legada: ExecSlice("{name}_BLOCK", start, end)).
     - Se evita avanzar el reloj mientras existan listos; el reloj avanza al próximo
       evento (llegada futura o unblock) solo cuando ready está vacío.
     """
 
-    def schedule(self, processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
-        if not processes:
-            return ScheduleResult()
-
-        # Normalizar patrones y construir estructuras iniciales
-        patterns: Dict[str, List[Tuple[str, int]]] = {
-            p.name: (p.pattern.copy() if p.pattern else [("CPU", p.burst)]) for p in processes
-        }
-        arrivals: Dict[str, int] = {p.name: p.arrival for p in processes}
-        index_by_name = {p.name: i for i, p in enumerate(processes)}
-        n = len(processes)
-
-        # Estado por proceso
-        next_idx: Dict[str, int] = {p.name: 0 for p in processes}    # índice dentro del patrón
-        rem_cpu_seg: Dict[str, int] = {}                             # remanente del tramo CPU en curso
-        blocked_until: Dict[str, int] = {}                           # proceso -> tiempo de desbloqueo
-        ready: List[str] = []                                        # lista de nombres listos
-        timeline: List[ExecSlice] = []
-        per_proc: Dict[str, List[Tuple[int, int]]] = {p.name: [] for p in processes}
-        completion: Dict[str, int] = {}
-        done = set()
-
-        def curr_seg(name: str):
-            i = next_idx[name]
-            pat = patterns[name]
-            return pat[i] if i < len(pat) else None
-
-        def total_cpu_remaining(name: str) -> int:
+    def schedule_iter(self, processes: Union[List[Process], Workload], quantum: Optional[int] = None) -> Iterator[ScheduleEvent]:
+        w = Workload.of(processes)
+        if not w.n:
+            return
+
+        # Estructuras compartidas de la Workload (solo lectura)
+        n = w.n
+        arrivals = w.arrivals
+        segs, offsets = w.segments, w.seg_offsets                    # CPU d -> d, BLOCK d -> ~d
+
+        # Estado por proceso (el pid es el orden de entrada en 'processes')
+        next_idx = list(offsets[:n])                                 # índice aplanado del tramo actual
+        rem_cpu_seg: List[Optional[int]] = [None] * n                # remanente del tramo CPU en curso
+        kernel = SimulationKernel(w)                                 # llegadas (cursor) y desbloqueos (heap)
+        blocked_until = kernel.blocked                               # proceso -> tiempo de desbloqueo
+        ready = IndexedMinHeap()                                     # (restante, llegada, orden) -> pid
+        emit = EventEmitter(w)
+        done = bytearray(n)
+        completed = 0
+
+        def curr_seg(pid: int) -> Optional[int]:
+            """Código del tramo actual (ver encode_pattern) o None si no quedan."""
+            i = next_idx[pid]
+            return segs[i] if i < offsets[pid + 1] else None
+
+        def total_cpu_remaining(pid: int) -> int:
             """Suma de todos los tramos CPU desde next_idx en adelante (incluye rem_cpu_seg)."""
-            pat = patterns[name]
-            idx = next_idx[name]
-            rem = 0
-            # si hay remanente del segmento actual, usarlo
-            if name in rem_cpu_seg:
-                rem += rem_cpu_seg[name]
-                idx += 1  # ya contamos el tramo actual
-            # sumar futuros tramos CPU
-            rem += sum(d for k, d in pat[idx:] if k == "CPU")
-            return rem
-
-        def make_ready_if_cpu(name: str, now: int):
+            idx = next_idx[pid]
+            # si hay remanente del segmento actual, usarlo en lugar del tramo completo
+            if rem_cpu_seg[pid] is not None:
+                return rem_cpu_seg[pid] + w.cpu_from(pid, idx + 1)
+            return w.cpu_from(pid, idx)
+
+        def ready_key(pid: int) -> Tuple[int, int, int]:
+            return (total_cpu_remaining(pid), arrivals[pid], pid)
+
+        def complete(pid: int, now: int):
+            nonlocal completed
+            emit.complete(pid, now)
+            if not done[pid]:
+                done[pid] = 1
+                completed += 1
+            rem_cpu_seg[pid] = None
+
+        def make_ready_if_cpu(pid: int, now: int):
             """Pone en ready si el siguiente segmento es CPU; si es BLOCK lo registra."""
-            if name in done or name in blocked_until:
+            if done[pid] or pid in blocked_until:
                 return
-            seg = curr_seg(name)
+            seg = curr_seg(pid)
+            # Los tramos CPU de duración 0 no ocupan la CPU: se consumen ya, sin esperar turno
+            while seg == 0 and rem_cpu_seg[pid] is None:
+                next_idx[pid] += 1
+                seg = curr_seg(pid)
             if seg is None:
                 # completado
-                completion[name] = now
-                done.add(name)
-                rem_cpu_seg.pop(name, None)
+                complete(pid, now)
                 return
-            kind, dur = seg
-            if kind == "BLOCK":
+            if seg < 0:
+                dur = ~seg
                 # iniciar bloqueos inmediatamente (no consumen CPU) y programar desbloqueo
                 if dur > 0:
-                    timeline.append(ExecSlice(f"{name}_BLOCK", now, now + dur))
-                blocked_until[name] = now + dur
-                next_idx[name] += 1
-                rem_cpu_seg.pop(name, None)
+                    emit.block(pid, now, now + dur)
+                blocked_until.push(pid, now + dur)
+                next_idx[pid] += 1
+                rem_cpu_seg[pid] = None
                 return
             # CPU
-            if name not in rem_cpu_seg:
-                rem_cpu_seg[name] = dur
-            if name not in ready:
-                ready.append(name)
+            if rem_cpu_seg[pid] is None:
+                rem_cpu_seg[pid] = seg
+            if pid not in ready:
+                ready.push(pid, ready_key(pid))
 
         # Inicializar tiempo en la mínima llegada
-        time = min(p.arrival for p in processes)
+        time = kernel.arrivals.peek()
         # Aceptar llegadas iniciales y posibles bloques que comenzaran en t=time
-        for p in processes:
-            if p.arrival <= time:
-                make_ready_if_cpu(p.name, time)
+        for pid in kernel.arrivals.pop_due(time):
+            make_ready_if_cpu(pid, time)
 
         def process_unblocks_and_arrivals(t: int):
-            # 1) desbloqueos cuyo tiempo <= t
-            for name in sorted(list(blocked_until), key=lambda k: blocked_until[k]):
-                if blocked_until[name] <= t:
-                    unblock_time = blocked_until.pop(name)
-                    make_ready_if_cpu(name, unblock_time)
-            # 2) llegadas con arrival <= t que aún no empezaron (next_idx==0)
-            for p in processes:
-                if p.name in done or p.name in blocked_until:
-                    continue
-                if next_idx[p.name] == 0 and arrivals[p.name] <= t and p.name not in ready:
-                    make_ready_if_cpu(p.name, t)
-
-        def next_future_event_after(t: int) -> Optional[int]:
-            events = []
-            # próximas llegadas de procesos no iniciados
-            for p in processes:
-                if p.name in done or p.name in blocked_until:
-                    continue
-                if next_idx[p.name] == 0 and arrivals[p.name] > t:
-                    events.append(arrivals[p.name])
-            # próximos desbloqueos
-            events.extend(v for v in blocked_until.values() if v > t)
-            return min(events) if events else None
+            # 1) desbloqueos cuyo tiempo <= t (por tiempo de desbloqueo, luego orden de bloqueo)
+            for pid, unblock_time in blocked_until.pop_due(t):
+                make_ready_if_cpu(pid, unblock_time)
+            # 2) llegadas con arrival <= t (el cursor respeta el orden de entrada en empates)
+            for pid in kernel.arrivals.pop_due(t):
+                make_ready_if_cpu(pid, t)
 
         # Bucle principal
-        while len(done) < n:
+        while completed < n:
+            yield from emit.drain()
+
             # Procesar desbloqueos y llegadas exactamente en 'time' (orden: unblocks then arrivals)
             process_unblocks_and_arrivals(time)
 
             # Si no hay listos, saltamos al siguiente evento relevante
             if not ready:
-                t_next = next_future_event_after(time)
+                t_next = kernel.next_event_after(time)
                 if t_next is None:
                     # puede haber procesos que ya terminaron o estamos al final
                     break
@@ -138,19 +131,15 @@ class SRTF(SchedulerStrategy):
                 process_unblocks_and_arrivals(time)
                 continue
 
-            # Selección determinista: ordenar ready por (total_remaining, arrival, input_order)
-            ready.sort(key=lambda nm: (total_cpu_remaining(nm), arrivals[nm], index_by_name[nm]))
-            active = ready.pop(0)
+            # Selección determinista: mínimo de ready por (total_remaining, arrival, input_order)
+            active = ready.pop()
 
             # Validación: si el siguiente segmento no es CPU, tratarlo (race)
             seg = curr_seg(active)
             if seg is None:
-                completion[active] = time
-                done.add(active)
-                rem_cpu_seg.pop(active, None)
+                complete(active, time)
                 continue
-            kind, _ = seg
-            if kind != "CPU":
+            if seg < 0:
                 # si por alguna razón el siguiente es BLOCK, procesarlo
                 make_ready_if_cpu(active, time)
                 continue
@@ -158,20 +147,20 @@ class SRTF(SchedulerStrategy):
             # Calcular próximo evento que puede preemptar al activo:
             # - llegada futura de proceso no iniciado (arrival > time)
             # - desbloqueo futuro (blocked_until)
-            seg_rem = rem_cpu_seg.get(active, 0)
+            seg_rem = rem_cpu_seg[active] or 0
             if seg_rem <= 0:
-                # nada que correr (defensa)
+                if seg == 0 and not done[active] and active not in blocked_until:
+                    # Tramo CPU de duración 0: se consume sin ocupar la CPU y el proceso
+                    # sigue en este mismo instante (completa, bloquea o vuelve a ready)
+                    next_idx[active] += 1
+                    rem_cpu_seg[active] = None
+                    make_ready_if_cpu(active, time)
+                # si no, entrada vieja de ready (ya bloqueado o terminado): nada que correr
                 continue
 
-            # Próxima llegada de procesos no iniciados
-            next_arrival_times = [
-                arrivals[p.name] for p in processes
-                if p.name not in done and p.name not in blocked_until and next_idx[p.name] == 0 and arrivals[p.name] > time
-            ]
-            next_arrival = min(next_arrival_times) if next_arrival_times else None
-            # Próximo desbloqueo
-            next_unblock_times = [t for t in blocked_until.values() if t > time]
-            next_unblock = min(next_unblock_times) if next_unblock_times else None
+            # Próxima llegada de procesos no iniciados y próximo desbloqueo
+            next_arrival = kernel.next_arrival_after(time)
+            next_unblock = blocked_until.next_after(time)
 
             seg_end = time + seg_rem
             candidates = [seg_end]
@@ -183,67 +172,57 @@ class SRTF(SchedulerStrategy):
 
             # Ejecutar desde time hasta t_next (posible preempción en t_next)
             if t_next > time:
-                timeline.append(ExecSlice(active, time, t_next))
-                per_proc[active].append((time, t_next))
+                emit.dispatch(active, time, t_next)
                 run = t_next - time
                 rem_cpu_seg[active] -= run
                 time = t_next
 
             # En el instante 'time' procesamos primero desbloqueos y llegadas
             process_unblocks_and_arrivals(time)
+            # Mientras no consume su primer tramo (next_idx == 0) el activo cuenta
+            # como llegada pendiente y vuelve a ready en el mismo instante.
+            if next_idx[active] == offsets[active] and active not in ready:
+                ready.push(active, ready_key(active))
 
             # Si el segmento CPU actual terminó exactamente en 'time'
-            if rem_cpu_seg.get(active, 0) == 0:
+            if not rem_cpu_seg[active]:
                 # consumir el segmento actual (avanzar índice)
                 seg_now = curr_seg(active)
-                if seg_now and seg_now[0] == "CPU":
+                if seg_now is not None and seg_now >= 0:
                     next_idx[active] += 1
                 # Ver el siguiente segmento después de consumir
                 nxt = curr_seg(active)
                 if nxt is None:
-                    completion[active] = time
-                    done.add(active)
-                    rem_cpu_seg.pop(active, None)
+                    complete(active, time)
                 else:
-                    if nxt[0] == "BLOCK":
+                    if nxt < 0:
                         # iniciar bloqueo inmediatamente
-                        bdur = nxt[1]
+                        bdur = ~nxt
                         if bdur > 0:
-                            timeline.append(ExecSlice(f"{active}_BLOCK", time, time + bdur))
-                        blocked_until[active] = time + bdur
+                            emit.block(active, time, time + bdur)
+                        blocked_until.push(active, time + bdur)
                         next_idx[active] += 1
-                        rem_cpu_seg.pop(active, None)
+                        rem_cpu_seg[active] = None
+                    elif nxt == 0:
+                        # CPU de duración 0: make_ready_if_cpu lo consume y sigue con lo que venga
+                        rem_cpu_seg[active] = None
+                        make_ready_if_cpu(active, time)
                     else:
                         # siguiente es CPU: inicializar remanente y volver a ready
-                        rem_cpu_seg[active] = nxt[1]
-                        if active not in ready and active not in blocked_until and active not in done:
-                            ready.append(active)
+                        rem_cpu_seg[active] = nxt
+                        if active not in ready and active not in blocked_until and not done[active]:
+                            ready.push(active, ready_key(active))
             else:
                 # Aún queda remanente: fue preemptado en 'time'. Reencolar respetando orden determinista.
-                if active not in ready and active not in blocked_until and active not in done:
-                    ready.append(active)
+                if active not in ready and active not in blocked_until and not done[active]:
+                    ready.push(active, ready_key(active))
+
+            # Si el activo quedó en ready, su clave cambió al ejecutar: decrease-key.
+            if active in ready:
+                ready.update(active, ready_key(active))
 
             # Nota: al reentrar al while se procesarán desbloqueos/arrivas en el mismo 'time' antes de decidir.
 
         # Cálculo de métricas finales (turnaround y waiting)
-        turnaround: Dict[str, int] = {}
-        waiting: Dict[str, int] = {}
-        for p in processes:
-            pat = patterns[p.name]
-            total_cpu = sum(d for k, d in pat if k == "CPU")
-            total_block = sum(d for k, d in pat if k == "BLOCK")
-            fin = completion.get(p.name, time)
-            tr = fin - p.arrival
-            te = tr - total_cpu - total_block
-            turnaround[p.name] = max(0, tr)
-            waiting[p.name] = max(0, te)
-
-        n_effective = max(1, len(processes))
-        return ScheduleResult(
-            timeline=timeline,
-            per_process_slices=per_proc,
-            turnaround=turnaround,
-            waiting=waiting,
-            avg_turnaround=sum(turnaround.values()) / n_effective,
-            avg_waiting=sum(waiting.values()) / n_effective
-        )
+        emit.finish(time)
+        yield from emit.drain()
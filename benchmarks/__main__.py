@@ -0,0 +1,85 @@
+"""
+Benchmarks de las estrategias de SchedulerFactory.
+
+    python -m app.benchmarks                          # 10 .. 10^6 procesos, reporte en bench_report.json
+    python -m app.benchmarks --max-size 10000 --baseline benchmarks/baseline.json
+    python -m app.benchmarks --save-baseline benchmarks/baseline.json
+
+Sale con código 1 si hay regresiones respecto del baseline (ver runner.compare).
+"""
+import argparse
+import os
+import sys
+
+from .runner import (
+    BenchConfig, DEFAULT_SIZES, DEFAULT_QUANTA,
+    run_cases, build_report, compare, load_report, save_report
+)
+
+
+def _int_list(text: str):
+    return [int(float(x)) for x in text.split(",") if x.strip()]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m app.benchmarks", description="Benchmarks de planificadores")
+    ap.add_argument("--sizes", type=_int_list, default=DEFAULT_SIZES,
+                    help="tamaños separados por coma (admite 1e5)")
+    ap.add_argument("--max-size", type=int, default=None, help="descarta tamaños mayores")
+    ap.add_argument("--quanta", type=_int_list, default=DEFAULT_QUANTA, help="quantums para las estrategias que lo usan")
+    ap.add_argument("--algorithms", default=None, help="subconjunto separado por coma (por defecto, todos)")
+    ap.add_argument("--io", choices=["both", "with", "without"], default="both", help="cargas con/sin E/S")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--budget", type=float, default=60.0,
+                    help="segundos por corrida; una serie deja de crecer al superarlo")
+    ap.add_argument("--no-memory", action="store_true", help="no medir memoria pico (tracemalloc)")
+    ap.add_argument("--output", default="bench_report.json")
+    ap.add_argument("--baseline", default=None, help="reporte contra el cual buscar regresiones")
+    ap.add_argument("--save-baseline", default=None, help="guardar además el reporte como baseline")
+    ap.add_argument("--threshold", type=float, default=0.25, help="regresión relativa tolerada (0.25 = 25%%)")
+    ap.add_argument("--exponent-tolerance", type=float, default=0.2)
+    ap.add_argument("--min-time", type=float, default=5e-3,
+                    help="casos del baseline más rápidos que esto no se comparan por tiempo")
+    ap.add_argument("-q", "--quiet", action="store_true")
+    args = ap.parse_args(argv)
+
+    sizes = [n for n in args.sizes if args.max_size is None or n <= args.max_size]
+    config = BenchConfig(
+        sizes=sizes,
+        quanta=args.quanta,
+        algorithms=[a.strip() for a in args.algorithms.split(",")] if args.algorithms else None,
+        io_modes={"both": (False, True), "with": (True,), "without": (False,)}[args.io],
+        repeat=args.repeat,
+        seed=args.seed,
+        budget=args.budget,
+        measure_memory=not args.no_memory,
+    )
+
+    log = None if args.quiet else (lambda line: print(line, file=sys.stderr))
+    cases = run_cases(config, log=log)
+    report = build_report(cases, config)
+
+    problems = []
+    if args.baseline:
+        if os.path.exists(args.baseline):
+            problems = compare(report, load_report(args.baseline), args.threshold,
+                               args.exponent_tolerance, args.min_time)
+            report["regressions"] = problems
+        else:
+            print(f"Baseline no encontrado: {args.baseline}", file=sys.stderr)
+
+    save_report(report, args.output)
+    if args.save_baseline:
+        save_report(report, args.save_baseline)
+
+    for algorithm, entry in report["scaling"].items():
+        k = entry["exponent"]
+        print(f"{algorithm:<12} exponente {'-' if k is None else f'{k:.2f}'}")
+    for p in problems:
+        print(f"REGRESIÓN {p}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+import gc
+import json
+import math
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..core.scheduler_factory import SchedulerFactory
+from .workloads import synthetic_workload
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_QUANTA = [1, 4, 16]
+
+
+@dataclass
+class BenchCase:
+    algorithm: str
+    io: bool
+    quantum: Optional[int]
+    n: int
+    wall_time: Optional[float] = None     # segundos (mejor de las repeticiones)
+    peak_memory: Optional[int] = None     # bytes (tracemalloc)
+    slices: Optional[int] = None          # len(result.timeline)
+    skipped: bool = False                 # fuera del presupuesto de tiempo
+
+    @property
+    def series(self) -> str:
+        return series_key(self.algorithm, self.io, self.quantum)
+
+
+@dataclass
+class BenchConfig:
+    sizes: List[int] = field(default_factory=lambda: list(DEFAULT_SIZES))
+    quanta: List[int] = field(default_factory=lambda: list(DEFAULT_QUANTA))
+    algorithms: Optional[List[str]] = None   # None = SchedulerFactory.list_algorithms()
+    io_modes: Tuple[bool, ...] = (False, True)
+    repeat: int = 3
+    seed: int = 0
+    budget: float = 60.0                     # s por corrida; los tamaños mayores se saltan
+    measure_memory: bool = True
+
+
+def series_key(algorithm: str, io: bool, quantum: Optional[int]) -> str:
+    key = f"{algorithm}|{'io' if io else 'cpu'}"
+    return key if quantum is None else f"{key}|q={quantum}"
+
+
+def _timed(strategy, procs, quantum, repeat: int) -> Tuple[float, int]:
+    """Mejor tiempo de pared de 'repeat' corridas (una sola si la primera supera 1 s)."""
+    best = math.inf
+    slices = 0
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        t0 = time.perf_counter()
+        result = strategy.schedule(procs, quantum=quantum)
+        elapsed = time.perf_counter() - t0
+        slices = len(result.timeline)
+        del result
+        best = min(best, elapsed)
+        if elapsed > 1.0:
+            break
+    return best, slices
+
+
+def _peak_memory(strategy, procs, quantum) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = strategy.schedule(procs, quantum=quantum)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def run_cases(config: BenchConfig, log=None) -> List[BenchCase]:
+    """
+    Corre cada estrategia sobre cargas sintéticas de tamaño creciente (una sola
+    carga en memoria a la vez, compartida por todas las estrategias).
+    Por serie (algoritmo, con/sin E/S, quantum), si el tiempo extrapolado
+    linealmente desde el tamaño anterior supera 'budget', ese tamaño y los
+    siguientes se marcan como salteados.
+    """
+    series: List[Tuple[str, object, Optional[int]]] = []
+    for algorithm in config.algorithms or SchedulerFactory.list_algorithms():
+        strategy = SchedulerFactory.create(algorithm, cache=False)   # se mide cada corrida
+        if strategy is None:
+            raise ValueError(f"Algoritmo desconocido: {algorithm}")
+        for quantum in (config.quanta if strategy.uses_quantum else [None]):
+            series.append((algorithm, strategy, quantum))
+
+    cases: List[BenchCase] = []
+    for io in config.io_modes:
+        prev: Dict[str, BenchCase] = {}
+        for n in sorted(config.sizes):
+            procs = None
+            for algorithm, strategy, quantum in series:
+                case = BenchCase(algorithm, io, quantum, n)
+                cases.append(case)
+                last = prev.get(case.series)
+                prev[case.series] = case
+                if last is not None and (last.skipped or last.wall_time * n / last.n > config.budget):
+                    case.skipped = True
+                    continue
+                if procs is None:
+                    procs = synthetic_workload(n, seed=config.seed + n, io=io)
+                case.wall_time, case.slices = _timed(strategy, procs, quantum, config.repeat)
+                if config.measure_memory:
+                    case.peak_memory = _peak_memory(strategy, procs, quantum)
+                if log:
+                    log(f"{case.series:<24} n={n:<8} {case.wall_time:9.4f} s  slices={case.slices}")
+    return cases
+
+
+def fit_exponent(points: Sequence[Tuple[int, float]], min_time: float = 1e-3) -> Optional[float]:
+    """
+    Pendiente de log(tiempo) contra log(n) por mínimos cuadrados (tiempo ~ n^k).
+    Ignora los puntos por debajo de 'min_time', dominados por costos fijos.
+    """
+    pts = [(math.log(n), math.log(t)) for n, t in points if t is not None and t >= min_time and n > 0]
+    if len(pts) < 2:
+        return None
+    mx = sum(x for x, _ in pts) / len(pts)
+    my = sum(y for _, y in pts) / len(pts)
+    sxx = sum((x - mx) ** 2 for x, _ in pts)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in pts) / sxx
+
+
+def scaling(cases: Sequence[BenchCase], min_time: float = 1e-3) -> Dict[str, dict]:
+    """Exponente por serie y, por estrategia, el peor (mayor) de sus series."""
+    by_series: Dict[str, List[BenchCase]] = {}
+    for c in cases:
+        if not c.skipped:
+            by_series.setdefault(c.series, []).append(c)
+    out: Dict[str, dict] = {}
+    for key, series in by_series.items():
+        k = fit_exponent([(c.n, c.wall_time) for c in series], min_time)
+        entry = out.setdefault(series[0].algorithm, {"exponent": None, "series": {}})
+        entry["series"][key] = k
+        if k is not None and (entry["exponent"] is None or k > entry["exponent"]):
+            entry["exponent"] = k
+    return out
+
+
+def build_report(cases: Sequence[BenchCase], config: BenchConfig, min_time: float = 1e-3) -> dict:
+    try:
+        import numpy  # noqa: F401
+        has_numpy = True
+    except ImportError:
+        has_numpy = False
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": has_numpy,
+            "seed": config.seed,
+            "repeat": config.repeat,
+            "budget": config.budget,
+        },
+        "cases": [asdict(c) for c in cases],
+        "scaling": scaling(cases, min_time),
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.25,
+            exponent_tolerance: float = 0.2, min_time: float = 5e-3) -> List[str]:
+    """
+    Regresiones de 'report' respecto de 'baseline':
+    - tiempo > base * (1 + threshold), solo en casos con base >= min_time;
+    - slices > base * (1 + threshold) (determinístico: no depende de la máquina);
+    - exponente de escala de una serie > base + exponent_tolerance;
+    - casos medidos en la base que ahora se saltearon por presupuesto (una
+      regresión grande convierte los tamaños mayores en salteados).
+    """
+    def key(c: dict):
+        return (c["algorithm"], c["io"], c["quantum"], c["n"])
+
+    base_cases = {key(c): c for c in baseline.get("cases", []) if not c.get("skipped")}
+    problems: List[str] = []
+    for c in report.get("cases", []):
+        b = base_cases.get(key(c))
+        if b is None:
+            continue
+        name = f"{series_key(c['algorithm'], c['io'], c['quantum'])} n={c['n']}"
+        if c.get("skipped"):
+            problems.append(f"{name}: salteado por presupuesto, base {b['wall_time']:.4f} s")
+            continue
+        if b["wall_time"] >= min_time and c["wall_time"] > b["wall_time"] * (1 + threshold):
+            problems.append(f"{name}: tiempo {c['wall_time']:.4f} s vs {b['wall_time']:.4f} s")
+        if b.get("slices") and c["slices"] > b["slices"] * (1 + threshold):
+            problems.append(f"{name}: slices {c['slices']} vs {b['slices']}")
+
+    for algorithm, entry in report.get("scaling", {}).items():
+        base_series = baseline.get("scaling", {}).get(algorithm, {}).get("series", {})
+        for series, k in entry["series"].items():
+            kb = base_series.get(series)
+            if k is not None and kb is not None and k > kb + exponent_tolerance:
+                problems.append(f"{series}: exponente {k:.2f} vs {kb:.2f}")
+    return problems
+
+
+def load_report(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_report(report: dict, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,31 @@
+from typing import List
+from ..core.generator import GeneratorConfig, WorkloadGenerator
+from ..core.models import Process
+
+NUMPY_MIN_SIZE = 10_000   # desde este tamaño se genera con NumPy, si está instalado
+
+# Configuraciones fijas: cambiarlas invalida los baselines guardados
+CPU_CONFIG = GeneratorConfig(rate=2 / 3, cpu_mean=10.0, max_duration=40)
+IO_CONFIG = GeneratorConfig(rate=2 / 3, cpu_mean=6.0, io_mean=4.0, min_phases=2, max_phases=3, max_duration=40)
+
+
+def synthetic_workload(n: int, seed: int = 0, io: bool = True) -> List[Process]:
+    """
+    Carga sintética reproducible de 'n' procesos para los benchmarks, hecha con
+    WorkloadGenerator (llegadas de Poisson, duraciones exponenciales acotadas).
+    - Sin E/S: una ráfaga CPU (CPU_CONFIG).
+    - Con E/S: CPU / BLOCK / CPU, con una tercera fase CPU en parte de los
+      procesos (IO_CONFIG).
+    Los tamaños chicos usan siempre el backend de Python puro; desde
+    NUMPY_MIN_SIZE, NumPy si está instalado (el reporte lo indica en meta).
+    """
+    backend = "numpy" if n >= NUMPY_MIN_SIZE and _has_numpy() else "python"
+    return WorkloadGenerator(IO_CONFIG if io else CPU_CONFIG, seed=seed, backend=backend).generate(n)
+
+
+def _has_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
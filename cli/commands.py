@@ -0,0 +1,298 @@
+"""
+chronomind: planificación por línea de comandos, sin interfaz gráfica.
+
+    chronomind run -a SJF procesos.csv                    # métricas por proceso (JSON)
+    chronomind run -a rr -q 2 carga.jsonl -o salida.csv
+    chronomind compare -q 2 carga.json                    # todas las estrategias
+    chronomind sweep -q 1-8 carga.json                    # Round Robin por quantum
+    chronomind export -a FIFO carga.csv -o gantt.xlsx     # Excel o imagen (.png/.svg/.pdf)
+    chronomind export -a SRTF carga.csv -o tramos.parquet --metrics metricas.parquet
+    cat carga.jsonl | chronomind run -a FIFO -
+
+'chronomind' es 'python main.py' (o 'python -m app.cli'). Tk, matplotlib y
+openpyxl se importan solo para 'export' y 'gui'.
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from ..core.models import Process, Workload, ScheduleResult, as_timeline, SLICE_BLOCK
+from ..core.scheduler_factory import SchedulerFactory
+from ..exportacion.exportador_columnar import EXTENSIONES as TABLE_EXTENSIONS
+from .formats import INPUT_FORMATS, OUTPUT_FORMATS, read_processes, output_format, write_output
+
+PLOT_EXTENSIONS = (".png", ".svg", ".pdf")
+_ALIASES = {"rr": "Round Robin"}
+
+
+class CliError(Exception):
+    """Error de uso o de datos: se informa en una línea y sale con código 2."""
+
+
+def _algorithm(name: str) -> str:
+    """Nombre de SchedulerFactory a partir de uno sin distinguir mayúsculas ("rr", "round-robin")."""
+    key = name.strip().lower().replace("-", " ").replace("_", " ")
+    if key in _ALIASES:
+        return _ALIASES[key]
+    for known in SchedulerFactory.list_algorithms():
+        if known.lower() == key:
+            return known
+    raise CliError(f"Algoritmo desconocido: {name} (disponibles: {', '.join(SchedulerFactory.list_algorithms())})")
+
+
+def _quanta(text: str) -> List[int]:
+    """'1,2,4' o rangos '1-8' (combinables: '1-4,8,16')."""
+    out: List[int] = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                lo, hi = (int(x) for x in part.split("-", 1))
+                out.extend(range(lo, hi + 1))
+            else:
+                out.append(int(part))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"quantum inválido: {part}")
+    if not out or min(out) <= 0:
+        raise argparse.ArgumentTypeError("los quantums deben ser enteros positivos")
+    return out
+
+
+def _quantum_for(algorithm: str, quantum: Optional[int]) -> Optional[int]:
+    """El quantum solo se informa (y se exige) en las estrategias que lo usan."""
+    return quantum if SchedulerFactory.create(algorithm).uses_quantum else None
+
+
+def _schedule(algorithm: str, processes, quantum: Optional[int]) -> ScheduleResult:
+    strategy = SchedulerFactory.create(algorithm)
+    if strategy.uses_quantum and quantum is None:
+        raise CliError(f"{algorithm} requiere --quantum.")
+    return strategy.schedule(processes, quantum=quantum)
+
+
+def _summary(algorithm: str, quantum: Optional[int], result: ScheduleResult) -> Dict[str, Any]:
+    timeline = as_timeline(result.timeline)
+    return {
+        "algorithm": algorithm,
+        "quantum": quantum,
+        "avg_turnaround": result.avg_turnaround,
+        "avg_waiting": result.avg_waiting,
+        "makespan": timeline.end_time,
+        "slices": len(timeline),
+    }
+
+
+def _process_rows(processes: List[Process], result: ScheduleResult) -> List[Dict[str, Any]]:
+    return [{
+        "name": p.name,
+        "arrival": p.arrival,
+        "burst": p.burst,
+        "turnaround": result.turnaround.get(p.name),
+        "waiting": result.waiting.get(p.name),
+    } for p in processes]
+
+
+def _timeline_rows(result: ScheduleResult) -> List[Dict[str, Any]]:
+    return [{"process": name, "kind": "BLOCK" if kind == SLICE_BLOCK else "CPU", "start": s, "end": e}
+            for name, kind, s, e in as_timeline(result.timeline).rows()]
+
+
+# --- Subcomandos ---
+
+def cmd_run(args) -> int:
+    processes = read_processes(args.input, args.input_format)
+    algorithm = _algorithm(args.algorithm)
+    quantum = _quantum_for(algorithm, args.quantum)
+    result = _schedule(algorithm, processes, quantum)
+    data = _summary(algorithm, quantum, result)
+    data["processes"] = _process_rows(processes, result)
+    if args.timeline:
+        data["timeline"] = _timeline_rows(result)
+    rows = data["timeline"] if args.timeline else data["processes"]
+    write_output(data, rows, args.output, output_format(args.output, args.output_format))
+    return 0
+
+
+def cmd_compare(args) -> int:
+    workload = Workload.of(read_processes(args.input, args.input_format))
+    algorithms = [_algorithm(a) for a in args.algorithms.split(",")] if args.algorithms \
+        else SchedulerFactory.list_algorithms()
+    rows = []
+    for algorithm in algorithms:
+        quantum = _quantum_for(algorithm, args.quantum)
+        rows.append(_summary(algorithm, quantum, _schedule(algorithm, workload, quantum)))
+    write_output({"results": rows}, rows, args.output, output_format(args.output, args.output_format))
+    return 0
+
+
+def cmd_sweep(args) -> int:
+    workload = Workload.of(read_processes(args.input, args.input_format))
+    algorithm = _algorithm(args.algorithm)
+    if not SchedulerFactory.create(algorithm).uses_quantum:
+        raise CliError(f"{algorithm} no usa quantum; no hay nada que barrer.")
+    rows = [_summary(algorithm, q, _schedule(algorithm, workload, q)) for q in args.quanta]
+    write_output({"results": rows}, rows, args.output, output_format(args.output, args.output_format))
+    return 0
+
+
+def cmd_export(args) -> int:
+    processes = read_processes(args.input, args.input_format)
+    algorithm = _algorithm(args.algorithm)
+    quantum = _quantum_for(algorithm, args.quantum)
+    ext = os.path.splitext(args.output)[1].lower()
+    if ext != ".xlsx" and ext not in PLOT_EXTENSIONS and ext not in TABLE_EXTENSIONS:
+        raise CliError(f"Extensión no soportada para export: {ext or args.output} "
+                       f"(.xlsx, {', '.join(PLOT_EXTENSIONS)}, {', '.join(TABLE_EXTENSIONS)})")
+    if args.metrics and os.path.splitext(args.metrics)[1].lower() not in TABLE_EXTENSIONS:
+        raise CliError(f"Extensión no soportada para --metrics: {args.metrics} ({', '.join(TABLE_EXTENSIONS)})")
+    result = _schedule(algorithm, processes, quantum)
+    if ext in TABLE_EXTENSIONS or args.metrics:
+        from ..exportacion.exportador_columnar import ExportadorColumnar
+        exp = ExportadorColumnar()
+        if args.metrics:
+            exp.exportar_metricas(args.metrics, result, processes)
+        if ext in TABLE_EXTENSIONS:
+            exp.exportar_timeline(args.output, result)
+            return 0
+    if ext == ".xlsx":
+        opciones = {"ticks_por_columna": args.ticks_per_column, "columnas_por_hoja": args.columns_per_sheet,
+                    "celdas": "leyenda" if args.cell_legend else "dominante"}
+        _export_excel(args.output, processes, result, opciones)
+    else:
+        _export_plot(args.output, processes, result, algorithm if quantum is None else f"{algorithm} (q={quantum})")
+    return 0
+
+
+def cmd_gui(args) -> int:
+    if args.startup_profile:
+        from ..gui import startup
+        startup.enable()
+    from ..gui.app import SchedulerApp
+    SchedulerApp().mainloop()
+    return 0
+
+
+def _rounded(value: Optional[float]):
+    return "" if value is None else round(value, 2)
+
+
+def _export_excel(path: str, processes: List[Process], result: ScheduleResult, opciones: Optional[dict] = None):
+    from ..exportacion.exportador_excel import ExportadorExcel
+    procesos = [{"Proceso": p.name, "Llegada": p.arrival, "Burst": p.burst, "Patrón": str(p.pattern)}
+                for p in processes]
+    procesos.append({"Proceso": "TOTAL CPU", "Llegada": "", "Burst": sum(p.burst for p in processes), "Patrón": ""})
+    metricas = [{"Proceso": name, "Turnaround": result.turnaround.get(name, ""), "Waiting": result.waiting.get(name, "")}
+                for name in result.turnaround.keys()]
+    # Sin procesos los promedios son None: la fila queda vacía
+    metricas.append({"Proceso": "PROMEDIO", "Turnaround": _rounded(result.avg_turnaround),
+                     "Waiting": _rounded(result.avg_waiting)})
+    ExportadorExcel().exportar_con_gantt(path, resultado=result, procesos=processes, opciones=opciones,
+                                        hojas=[("Procesos", procesos), ("Métricas", metricas)])
+
+
+def _export_plot(path: str, processes: List[Process], result: ScheduleResult, title: str):
+    """Gantt estático con matplotlib sin backend interactivo (no requiere pantalla)."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    names = list(dict.fromkeys(p.name for p in processes))
+    lane = {name: i for i, name in enumerate(names)}
+    cpu = [[] for _ in names]
+    io = [[] for _ in names]
+    for name, kind, s, e in as_timeline(result.timeline).rows():
+        if name in lane:
+            (io if kind == SLICE_BLOCK else cpu)[lane[name]].append((s, e - s))
+
+    fig = Figure(figsize=(12, max(2.0, 0.4 * len(names) + 1)))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    for i in range(len(names)):
+        if cpu[i]:
+            ax.broken_barh(cpu[i], (i - 0.4, 0.8), facecolors="#1F77B4")
+        if io[i]:
+            ax.broken_barh(io[i], (i - 0.4, 0.8), facecolors="#1F77B4", alpha=0.35, hatch="//")
+    ax.set_yticks(range(len(names)))
+    ax.set_yticklabels(names)
+    ax.invert_yaxis()
+    ax.set_xlabel("Tiempo")
+    ax.set_title(title)
+    ax.grid(axis="x", alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+# --- Argumentos ---
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="chronomind", description="Planificación de procesos sin interfaz gráfica")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    def common(p, output_required=False):
+        p.add_argument("input", nargs="?", default="-", help="carga CSV/JSON/JSONL ('-' o vacío = stdin)")
+        p.add_argument("-f", "--input-format", choices=INPUT_FORMATS, default=None,
+                       help="formato de entrada (por defecto, según la extensión o el contenido)")
+        p.add_argument("-o", "--output", required=output_required, default=None,
+                       help="archivo de salida (por defecto, stdout)")
+
+    def output_fmt(p):
+        p.add_argument("-F", "--output-format", choices=OUTPUT_FORMATS, default=None,
+                       help="formato de salida (por defecto, según la extensión de -o o JSON)")
+
+    p = sub.add_parser("run", help="una estrategia: métricas por proceso")
+    common(p)
+    output_fmt(p)
+    p.add_argument("-a", "--algorithm", required=True)
+    p.add_argument("-q", "--quantum", type=int, default=None)
+    p.add_argument("--timeline", action="store_true",
+                   help="incluir los tramos (en CSV, la tabla pasa a ser el timeline)")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("compare", help="varias estrategias sobre la misma carga")
+    common(p)
+    output_fmt(p)
+    p.add_argument("-a", "--algorithms", default=None, help="separadas por coma (por defecto, todas)")
+    p.add_argument("-q", "--quantum", type=int, default=None, help="para las estrategias que lo usan")
+    p.set_defaults(func=cmd_compare)
+
+    p = sub.add_parser("sweep", help="una estrategia con quantum, barriendo quantums")
+    common(p)
+    output_fmt(p)
+    p.add_argument("-a", "--algorithm", default="Round Robin")
+    p.add_argument("-q", "--quanta", type=_quanta, required=True, help="p. ej. 1-8 o 1,2,4,8")
+    p.set_defaults(func=cmd_sweep)
+
+    p = sub.add_parser("export", help="Gantt a Excel (.xlsx) o imagen (.png/.svg/.pdf), "
+                                      "o el timeline como tabla (.csv/.arrow/.parquet)")
+    common(p, output_required=True)
+    p.add_argument("-a", "--algorithm", required=True)
+    p.add_argument("-q", "--quantum", type=int, default=None)
+    p.add_argument("--metrics", default=None,
+                   help="además, métricas por proceso en una tabla (.csv/.arrow/.parquet)")
+    p.add_argument("--ticks-per-column", type=int, default=None,
+                   help="Excel: ticks que agrupa cada columna del Gantt (por defecto 1, o lo que haga falta "
+                        "para no pasar el límite de columnas)")
+    p.add_argument("--columns-per-sheet", type=int, default=None,
+                   help="Excel: repartir el Gantt en hojas de a lo sumo N columnas, con una hoja índice")
+    p.add_argument("--cell-legend", action="store_true",
+                   help="Excel: con columnas agrupadas, mostrar los ticks de CPU y E/S en vez del estado dominante")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("gui", help="abrir la interfaz gráfica")
+    p.add_argument("--startup-profile", action="store_true",
+                   help="informar en stderr los tiempos de importes y construcción de widgets")
+    p.set_defaults(func=cmd_gui)
+    return ap
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        return 0
+    except (CliError, ValueError, OSError, ImportError) as ex:
+        print(f"chronomind: error: {ex}", file=sys.stderr)
+        return 2
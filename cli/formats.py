@@ -0,0 +1,153 @@
+"""
+Lectura de cargas y escritura de resultados para la línea de comandos.
+
+Entrada: CSV, JSON o JSONL (archivo o '-' para stdin). Cada proceso tiene
+'name', 'arrival' y 'pattern', este último como texto ("3,(2),4", la misma
+sintaxis de la tabla de la interfaz) o como lista de pares [["CPU", 3], ...].
+Sin 'pattern' se usa 'burst' como un único tramo CPU. En JSON se acepta una
+lista de procesos o un objeto con la clave "processes".
+"""
+import csv
+import io
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..core.models import Process, parse_pattern
+
+INPUT_FORMATS = ("csv", "json", "jsonl")
+OUTPUT_FORMATS = ("json", "csv")
+
+
+def _format_from_path(path: str, known: Sequence[str]) -> Optional[str]:
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext == "ndjson":
+        ext = "jsonl"
+    return ext if ext in known else None
+
+
+def _sniff(text: str) -> str:
+    """Formato de un texto sin extensión: JSON si abre con '[' o es un único objeto, JSONL si son varios."""
+    head = text.lstrip()
+    if head.startswith("["):
+        return "json"
+    if head.startswith("{"):
+        try:
+            json.loads(text)
+            return "json"
+        except ValueError:
+            return "jsonl"
+    return "csv"
+
+
+def _to_process(raw: Dict[str, Any], where: str) -> Process:
+    name = str(raw.get("name") or "").strip()
+    if not name:
+        raise ValueError(f"{where}: proceso sin nombre.")
+    try:
+        arrival = int(raw.get("arrival") or 0)
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: llegada inválida en {name}.")
+
+    pattern = raw.get("pattern")
+    if isinstance(pattern, str):
+        text = pattern.strip()
+        pattern = parse_pattern(text) if text else None
+        if pattern is None and text:
+            raise ValueError(f"{where}: patrón inválido en {name}: {text!r}.")
+    elif pattern is not None:
+        try:
+            pattern = [(str(kind).upper(), int(d)) for kind, d in pattern]
+        except (TypeError, ValueError):
+            raise ValueError(f"{where}: patrón inválido en {name}.")
+        if any(kind not in ("CPU", "BLOCK") for kind, _ in pattern):
+            raise ValueError(f"{where}: tipo de tramo desconocido en {name}.")
+
+    if not pattern:
+        try:
+            burst = int(raw.get("burst") or 0)
+        except (TypeError, ValueError):
+            burst = 0
+        if burst <= 0:
+            raise ValueError(f"{where}: patrón inválido o vacío en {name}. Escribe algo como: 3,(2),4 o 5.")
+        pattern = [("CPU", burst)]
+
+    burst = sum(d for kind, d in pattern if kind == "CPU")
+    return Process(name=name, arrival=arrival, burst=burst, pattern=pattern)
+
+
+def _unique(procs: Iterable[Process], wheres: Iterable[str]) -> List[Process]:
+    """Los resultados se informan por nombre: dos procesos con el mismo nombre se pisarían."""
+    seen: Dict[str, str] = {}
+    out = []
+    for proc, where in zip(procs, wheres):
+        first = seen.setdefault(proc.name, where)
+        if first != where:
+            raise ValueError(f"{where}: nombre repetido {proc.name!r} (ya usado en {first}).")
+        out.append(proc)
+    return out
+
+
+def parse_processes(text: str, fmt: Optional[str] = None, source: str = "<stdin>") -> List[Process]:
+    fmt = fmt or _sniff(text)
+    if fmt == "csv":
+        rows: Iterable[Dict[str, Any]] = csv.DictReader(io.StringIO(text))
+        items = [(row, f"{source}:{i}") for i, row in enumerate(rows, 2)]
+    elif fmt == "jsonl":
+        items = []
+        for i, line in enumerate(text.splitlines(), 1):
+            if line.strip():
+                try:
+                    raw = json.loads(line)
+                except ValueError as ex:
+                    raise ValueError(f"{source}:{i}: JSON inválido ({ex}).")
+                items.append((raw, f"{source}:{i}"))
+    elif fmt == "json":
+        try:
+            data = json.loads(text)
+        except ValueError as ex:
+            raise ValueError(f"{source}: JSON inválido ({ex}).")
+        if isinstance(data, dict):
+            data = data.get("processes", [])
+        items = [(raw, f"{source}[{i}]") for i, raw in enumerate(data)]
+    else:
+        raise ValueError(f"Formato de entrada desconocido: {fmt}")
+    wheres = [where for _, where in items]
+    return _unique((_to_process(raw, where) for raw, where in items), wheres)
+
+
+def read_processes(path: str, fmt: Optional[str] = None) -> List[Process]:
+    """Procesos de 'path' ('-' = stdin); el formato sale de la extensión si no se indica."""
+    if path == "-":
+        return parse_processes(sys.stdin.read(), fmt)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        text = f.read()
+    return parse_processes(text, fmt or _format_from_path(path, INPUT_FORMATS), path)
+
+
+def output_format(path: Optional[str], fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return (path and path != "-" and _format_from_path(path, OUTPUT_FORMATS)) or "json"
+
+
+def write_output(data: Any, rows: Optional[List[Dict[str, Any]]], path: Optional[str], fmt: str):
+    """
+    JSON escribe 'data' completo; CSV escribe la tabla 'rows' (una fila por dict,
+    columnas tomadas de la primera fila). Sin 'path' (o con '-') va a stdout.
+    """
+    to_stdout = not path or path == "-"
+    f = sys.stdout if to_stdout else open(path, "w", encoding="utf-8", newline="")
+    try:
+        if fmt == "json":
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        else:
+            rows = rows or []
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else [], lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if not to_stdout:
+            f.close()
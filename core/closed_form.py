@@ -0,0 +1,216 @@
+"""
+Camino rápido en forma cerrada para FIFO y SJF cuando la carga no tiene E/S.
+
+Sin tramos BLOCK ambos algoritmos se reducen a un orden de despacho más sumas
+prefijas de ráfagas. Dado ese orden, cada proceso termina en
+    fin[k] = max(fin[k - 1], llegada[k]) + ráfaga[k]
+que se resuelve sin bucle como
+    fin = B + max.accumulate(llegada - B_prev)
+con B las sumas prefijas de las ráfagas (y B_prev = B - ráfaga).
+Con cargas grandes se usa NumPy si está instalado; si no, el mismo cálculo en
+Python puro.
+"""
+import heapq
+from array import array
+from typing import Iterator, List, Optional
+
+# NumPy es opcional y se importa recién con la primera carga grande: su import
+# cuesta más que resolver unos miles de procesos en Python puro, y así la línea
+# de comandos arranca sin pagarlo.
+NUMPY_MIN_SIZE = 4096
+np = None
+_numpy_checked = False
+
+from .models import Workload, ScheduleResult, ScheduleEvent, Timeline, PerProcessSlices, ProcessValues
+from .kernel import EventEmitter
+from .timeline_store import SpilledTimeline
+
+
+class ClosedFormPlan:
+    """
+    Resultado en forma cerrada: orden de despacho (pids) y el único tramo CPU
+    [start, end) de cada proceso, alineados con ese orden.
+    """
+
+    def __init__(self, workload: Workload, order: array, start: array, end: array):
+        self.workload = workload
+        self.order = order
+        self.start = start
+        self.end = end
+
+    def events(self) -> Iterator[ScheduleEvent]:
+        """Los mismos eventos que el bucle general: dispatch y complete por proceso."""
+        emit = EventEmitter(self.workload)
+        for pid, start, end in zip(self.order, self.start, self.end):
+            emit.dispatch(pid, start, end)
+            emit.complete(pid, end)
+            yield from emit.drain()
+        emit.finish(self.end[-1])
+        yield from emit.drain()
+
+    def result(self, spill: bool = False) -> Optional[ScheduleResult]:
+        """
+        ScheduleResult armado en bloque, con TR y TE en el orden de la Workload.
+        Devuelve None si hay nombres repetidos (queda para el camino general).
+        Con spill=True el timeline va a disco (SpilledTimeline).
+        """
+        w = self.workload
+        timeline = SpilledTimeline(names=w.names) if spill else Timeline(names=w.names)
+        if len(timeline.names) != w.n:
+            timeline.seal()
+            return None
+        timeline.extend_cpu(self.order, self.start, self.end)
+        timeline.seal()
+
+        bursts = _bursts(w)
+        if _numpy(w) is not None:
+            finish = np.empty(w.n, dtype=np.int64)
+            finish[np.frombuffer(self.order, dtype=np.int32)] = np.frombuffer(self.end, dtype=np.int64)
+            tr = np.maximum(finish - np.frombuffer(w.arrivals, dtype=np.int64), 0)
+            te = np.maximum(tr - bursts, 0)
+            tr, te = tr.tolist(), te.tolist()
+        else:
+            finish = [0] * w.n
+            for pid, end in zip(self.order, self.end):
+                finish[pid] = end
+            tr = [max(0, f - a) for f, a in zip(finish, w.arrivals)]
+            te = [max(0, t - b) for t, b in zip(tr, bursts)]
+
+        return ScheduleResult(
+            timeline=timeline,
+            per_process_slices=PerProcessSlices(timeline, w.names),
+            turnaround=ProcessValues(timeline.name_index, tr),
+            waiting=ProcessValues(timeline.name_index, te),
+            avg_turnaround=sum(tr) / w.n,
+            avg_waiting=sum(te) / w.n
+        )
+
+
+def _numpy(workload: Workload):
+    """El módulo numpy si conviene usarlo para 'workload' (None si no o si no está instalado)."""
+    global np, _numpy_checked
+    if workload.n < NUMPY_MIN_SIZE:
+        return None
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+    return np
+
+
+def _cpu_only(workload: Workload) -> bool:
+    """Sin tramos BLOCK ni tramos CPU de duración 0 (esos quedan para el bucle general)."""
+    return workload.n > 0 and not workload.has_block and min(workload.segments) > 0
+
+
+def _bursts(workload: Workload):
+    """CPU total por pid (ndarray con NumPy, lista o array en Python puro)."""
+    w = workload
+    if _numpy(w) is not None:
+        cpu = np.frombuffer(w.cpu_prefix, dtype=np.int64)
+        offsets = np.frombuffer(w.seg_offsets, dtype=np.int64)
+        return cpu[offsets[1:]] - cpu[offsets[:-1]]
+    if len(w.segments) == w.n:
+        return w.segments
+    return [w.total_cpu(pid) for pid in range(w.n)]
+
+
+def _finish_times(arrivals, bursts):
+    """fin[k] = max(fin[k - 1], llegada[k]) + ráfaga[k], con el reloj empezando en 0."""
+    total = np.cumsum(bursts)
+    return total + np.maximum.accumulate(np.maximum(arrivals, 0) - (total - bursts))
+
+
+def _plan(workload: Workload, order: List[int], start: List[int], end: List[int]) -> ClosedFormPlan:
+    return ClosedFormPlan(workload, array("i", order), array("q", start), array("q", end))
+
+
+def _np_plan(workload: Workload, order, start, end) -> ClosedFormPlan:
+    return ClosedFormPlan(
+        workload,
+        array("i", order.astype(np.int32).tobytes()),
+        array("q", start.astype(np.int64).tobytes()),
+        array("q", end.astype(np.int64).tobytes())
+    )
+
+
+def fifo_plan(workload: Workload) -> Optional[ClosedFormPlan]:
+    """
+    FIFO sin E/S: las llegadas se admiten en el orden de la lista, así que los
+    procesos se despachan exactamente en ese orden. None si la carga tiene E/S.
+    """
+    if not _cpu_only(workload):
+        return None
+    w = workload
+    bursts = _bursts(w)
+    if _numpy(w) is not None:
+        end = _finish_times(np.frombuffer(w.arrivals, dtype=np.int64), bursts)
+        return _np_plan(w, np.arange(w.n), end - bursts, end)
+
+    start, end = [], []
+    time = 0
+    for arrival, burst in zip(w.arrivals, bursts):
+        if arrival > time:
+            time = arrival
+        start.append(time)
+        time += burst
+        end.append(time)
+    return _plan(w, range(w.n), start, end)
+
+
+def sjf_plan(workload: Workload) -> Optional[ClosedFormPlan]:
+    """
+    SJF sin E/S y con un único tramo CPU por proceso (con varios tramos, otro
+    proceso puede colarse entre ellos). None si no aplica.
+
+    Se ordena una vez por clave (ráfaga, llegada, nombre, pid). Ese orden
+    global es el de la simulación si cada proceso ya llegó cuando le toca, lo
+    que se verifica vectorialmente; si no, se resuelve el orden con un heap de
+    rangos enteros sobre las llegadas, sin la maquinaria de eventos.
+    """
+    w = workload
+    if not _cpu_only(w) or len(w.segments) != w.n:
+        return None
+
+    if _numpy(w) is not None:
+        arrivals = np.frombuffer(w.arrivals, dtype=np.int64)
+        bursts = np.frombuffer(w.segments, dtype=np.int64)
+        by_key = np.lexsort((np.arange(w.n), np.array(w.names), arrivals, bursts))
+        arr = arrivals[by_key]
+        end = _finish_times(arr, bursts[by_key])
+        if arr[0] <= max(0, int(arrivals.min())) and bool(np.all(arr[1:] <= end[:-1])):
+            return _np_plan(w, by_key, end - bursts[by_key], end)
+        rank = np.empty(w.n, dtype=np.int64)
+        rank[by_key] = np.arange(w.n)
+        rank, by_key = rank.tolist(), by_key.tolist()
+    else:
+        arrivals, names, bursts = w.arrivals, w.names, w.segments
+        by_key = sorted(range(w.n), key=lambda pid: (bursts[pid], arrivals[pid], names[pid], pid))
+        rank = [0] * w.n
+        for r, pid in enumerate(by_key):
+            rank[pid] = r
+
+    # Llegadas y rangos ya permutados por orden de llegada
+    arrivals, bursts = w.arrivals.tolist(), w.segments.tolist()
+    by_arrival = w.arrival_order.tolist()
+    arrival_seq = [arrivals[pid] for pid in by_arrival]
+    rank_seq = [rank[pid] for pid in by_arrival]
+    push, pop = heapq.heappush, heapq.heappop
+    heap: List[int] = []
+    order, end = [], []
+    n, i, time = w.n, 0, 0
+    for _ in range(n):
+        if not heap and arrival_seq[i] > time:
+            time = arrival_seq[i]
+        while i < n and arrival_seq[i] <= time:
+            push(heap, rank_seq[i])
+            i += 1
+        pid = by_key[pop(heap)]
+        time += bursts[pid]
+        order.append(pid)
+        end.append(time)
+    start = [e - bursts[pid] for pid, e in zip(order, end)]
+    return _plan(w, order, start, end)
@@ -0,0 +1,226 @@
+"""
+Generador de cargas sintéticas con semilla, sin interfaz gráfica.
+
+Cada proceso alterna fases CPU y BLOCK (CPU, BLOCK, CPU, ..., CPU) con una
+cantidad de fases CPU uniforme en [min_phases, max_phases]. Las distribuciones:
+- llegadas: "poisson" (separaciones exponenciales) o "bursty" (grupos de
+  tamaño medio 'burst_size' que llegan juntos, con la misma tasa media);
+- duraciones CPU/E/S: "exponential" o "pareto" (cola pesada, forma 'tail'),
+  ambas con la media pedida, redondeadas a enteros >= 1.
+
+Con NumPy la generación es vectorizada por bloques; sin NumPy se usa el mismo
+modelo en Python puro. Las dos implementaciones no producen los mismos números:
+una carga queda determinada por (seed, config, backend, n, chunk_size).
+"""
+import hashlib
+import math
+import random
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+# NumPy es opcional y se importa al crear el primer generador que lo usa
+np = None
+
+from .models import Process
+
+ARRIVALS = ("poisson", "bursty")
+DISTRIBUTIONS = ("exponential", "pareto")
+DEFAULT_CHUNK = 65536
+
+
+@dataclass
+class GeneratorConfig:
+    arrivals: str = "poisson"
+    rate: float = 1.0                  # llegadas por unidad de tiempo (media)
+    burst_size: float = 4.0            # "bursty": procesos por grupo (media)
+    start: int = 0                     # llegada del primer proceso
+    cpu: str = "exponential"
+    cpu_mean: float = 5.0
+    io: str = "exponential"
+    io_mean: float = 3.0
+    tail: float = 1.5                  # forma de "pareto" (> 1 para que exista la media)
+    min_phases: int = 1                # fases CPU por proceso; entre cada par, un BLOCK
+    max_phases: int = 1
+    max_duration: Optional[int] = None # tope de cada fase (útil con colas pesadas)
+    name_prefix: str = "P"
+
+    def __post_init__(self):
+        if self.arrivals not in ARRIVALS:
+            raise ValueError(f"Distribución de llegadas desconocida: {self.arrivals}")
+        for dist in (self.cpu, self.io):
+            if dist not in DISTRIBUTIONS:
+                raise ValueError(f"Distribución de duraciones desconocida: {dist}")
+        if self.rate <= 0 or self.burst_size < 1:
+            raise ValueError("La tasa debe ser positiva y burst_size >= 1.")
+        if self.cpu_mean < 1 or self.io_mean < 1:
+            raise ValueError("Las duraciones medias deben ser >= 1.")
+        if self.tail <= 1:
+            raise ValueError("La forma de Pareto debe ser > 1.")
+        if not 1 <= self.min_phases <= self.max_phases:
+            raise ValueError("Se requiere 1 <= min_phases <= max_phases.")
+        if self.max_duration is not None and self.max_duration < 1:
+            raise ValueError("max_duration debe ser >= 1.")
+
+
+def _load_numpy() -> bool:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return False
+        np = numpy
+    return True
+
+
+class WorkloadGenerator:
+    """
+    Fuente reproducible de procesos. Es un flujo con estado: llamadas sucesivas
+    a generate/stream continúan el reloj de llegadas y la numeración de nombres.
+
+    spawn(k) deriva k generadores independientes y reproducibles (misma config
+    y backend) para corridas en paralelo; sin semilla se elige una al azar, que
+    queda en 'seed' para poder repetir la corrida.
+    """
+
+    def __init__(self, config: Optional[GeneratorConfig] = None, seed: Optional[int] = None,
+                 backend: Optional[str] = None, _path: Tuple[int, ...] = ()):
+        if backend is None:
+            backend = "numpy" if _load_numpy() else "python"
+        if backend not in ("numpy", "python"):
+            raise ValueError(f"Backend desconocido: {backend}")
+        if backend == "numpy" and not _load_numpy():
+            raise RuntimeError("NumPy no está instalado.")
+        self.config = config or GeneratorConfig()
+        self.seed = random.SystemRandom().getrandbits(63) if seed is None else seed
+        self.backend = backend
+        self._path = _path
+        self._spawned = 0
+        self._count = 0                              # procesos ya emitidos
+        self._clock = float(self.config.start)       # llegada (continua) del último
+        if backend == "numpy":
+            self._rng = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=_path))
+        else:
+            digest = hashlib.sha256(repr((self.seed, _path)).encode()).digest()
+            self._rng = random.Random(int.from_bytes(digest[:8], "little"))
+
+    def spawn(self, k: int) -> List["WorkloadGenerator"]:
+        """k generadores hijos; llamadas sucesivas dan hijos distintos."""
+        first = self._spawned
+        self._spawned += k
+        return [WorkloadGenerator(self.config, self.seed, self.backend, self._path + (first + i,))
+                for i in range(k)]
+
+    def generate(self, n: int, chunk_size: int = DEFAULT_CHUNK) -> List[Process]:
+        return list(self.stream(n, chunk_size))
+
+    def stream(self, n: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK) -> Iterator[Process]:
+        """Procesos de a bloques de 'chunk_size' (memoria acotada); infinito si n es None."""
+        left = math.inf if n is None else n
+        chunk = self._np_chunk if self.backend == "numpy" else self._py_chunk
+        while left > 0:
+            m = int(min(chunk_size, left))
+            yield from chunk(m)
+            left -= m
+
+    # --- Armado común ---
+
+    def _build(self, arrivals: List[int], phases: List[int], bursts: List[int],
+               cpu: List[int], io: List[int]) -> List[Process]:
+        start = self._count
+        self._count += len(arrivals)
+        prefix = self.config.name_prefix
+        names = [f"{prefix}{i}" for i in range(start, self._count)]
+        cpu_phases = [("CPU", d) for d in cpu]
+        if self.config.max_phases == 1:
+            patterns = [[seg] for seg in cpu_phases]
+        else:
+            # Intercala las fases: CPU en posiciones pares, BLOCK en impares
+            io_phases = [("BLOCK", d) for d in io]
+            patterns = []
+            c = b = 0
+            for k in phases:
+                pattern = [None] * (2 * k - 1)
+                pattern[::2] = cpu_phases[c:c + k]
+                pattern[1::2] = io_phases[b:b + k - 1]
+                patterns.append(pattern)
+                c += k
+                b += k - 1
+        return list(map(Process, names, arrivals, bursts, patterns))
+
+    def _pareto_scale(self, mean: float) -> float:
+        # Pareto de forma a y mínimo xm tiene media a * xm / (a - 1)
+        a = self.config.tail
+        return mean * (a - 1) / a
+
+    # --- NumPy ---
+
+    def _np_durations(self, dist: str, mean: float, size: int):
+        rng = self._rng
+        if dist == "exponential":
+            x = rng.exponential(mean, size)
+        else:
+            x = (rng.pareto(self.config.tail, size) + 1.0) * self._pareto_scale(mean)
+        d = np.maximum(np.rint(x), 1)
+        if self.config.max_duration is not None:
+            np.minimum(d, self.config.max_duration, out=d)
+        return d.astype(np.int64)
+
+    def _np_chunk(self, m: int) -> List[Process]:
+        cfg, rng = self.config, self._rng
+        if cfg.arrivals == "poisson":
+            gaps = rng.exponential(1.0 / cfg.rate, m)
+        else:
+            new_group = rng.random(m) < 1.0 / cfg.burst_size
+            gaps = np.where(new_group, rng.exponential(cfg.burst_size / cfg.rate, m), 0.0)
+        if self._count == 0:
+            gaps[0] = 0.0
+        clock = self._clock + np.cumsum(gaps)
+        self._clock = float(clock[-1])
+        phases = rng.integers(cfg.min_phases, cfg.max_phases + 1, m)
+        total = int(phases.sum())
+        cpu = self._np_durations(cfg.cpu, cfg.cpu_mean, total)
+        io = self._np_durations(cfg.io, cfg.io_mean, total - m)
+        first = np.cumsum(phases) - phases
+        bursts = np.add.reduceat(cpu, first)
+        return self._build(np.floor(clock).astype(np.int64).tolist(), phases.tolist(),
+                           bursts.tolist(), cpu.tolist(), io.tolist())
+
+    # --- Python puro ---
+
+    def _py_duration(self, dist: str, mean: float) -> int:
+        if dist == "exponential":
+            x = self._rng.expovariate(1.0 / mean)
+        else:
+            x = self._rng.paretovariate(self.config.tail) * self._pareto_scale(mean)
+        d = max(round(x), 1)
+        cap = self.config.max_duration
+        return d if cap is None else min(d, cap)
+
+    def _py_chunk(self, m: int) -> List[Process]:
+        cfg, rng = self.config, self._rng
+        arrivals: List[int] = []
+        phases: List[int] = []
+        bursts: List[int] = []
+        cpu: List[int] = []
+        io: List[int] = []
+        for i in range(m):
+            if self._count + i > 0:
+                if cfg.arrivals == "poisson":
+                    self._clock += rng.expovariate(cfg.rate)
+                elif rng.random() < 1.0 / cfg.burst_size:
+                    self._clock += rng.expovariate(cfg.rate / cfg.burst_size)
+            arrivals.append(math.floor(self._clock))
+            k = rng.randint(cfg.min_phases, cfg.max_phases)
+            phases.append(k)
+            ds = [self._py_duration(cfg.cpu, cfg.cpu_mean) for _ in range(k)]
+            cpu.extend(ds)
+            bursts.append(sum(ds))
+            io.extend(self._py_duration(cfg.io, cfg.io_mean) for _ in range(k - 1))
+        return self._build(arrivals, phases, bursts, cpu, io)
+
+
+def generate_workload(n: int, seed: Optional[int] = 0, config: Optional[GeneratorConfig] = None,
+                      backend: Optional[str] = None) -> List[Process]:
+    """Atajo: n procesos de un generador nuevo."""
+    return WorkloadGenerator(config, seed, backend).generate(n)
@@ -0,0 +1,348 @@
+import heapq
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+from .models import (
+    Process, Workload, ScheduleResult, Timeline, PerProcessSlices, RotationRun, ScheduleEvent, OnlineMetrics,
+    SLICE_BLOCK, EVENT_DISPATCH, EVENT_BLOCK, EVENT_ROTATION, EVENT_COMPLETE
+)
+from .timeline_store import SpilledTimeline
+
+
+class ArrivalCursor:
+    """
+    Cursor sobre los pids de una Workload ordenados por llegada.
+    Cada proceso se entrega una sola vez, sin volver a recorrer la lista.
+
+    - Por defecto usa workload.arrival_order (orden estable por 'arrival',
+      empates por orden de entrada en la lista original).
+    - Con presorted=True respeta el orden de la lista tal cual: el cursor se
+      detiene en el primer proceso que aún no llegó (comportamiento de FIFO).
+    """
+
+    def __init__(self, workload: Workload, presorted: bool = False):
+        self._order: Sequence[int] = range(workload.n) if presorted else workload.arrival_order
+        self._arrivals = workload.arrivals
+        self._idx = 0
+
+    def __len__(self) -> int:
+        return len(self._order) - self._idx
+
+    def peek(self) -> Optional[int]:
+        """Llegada del próximo proceso pendiente (None si no quedan)."""
+        return self._arrivals[self._order[self._idx]] if self._idx < len(self._order) else None
+
+    def pop_due(self, t: int) -> Sequence[int]:
+        """Entrega, en orden, los pids pendientes con arrival <= t."""
+        start = self._idx
+        order, arrivals = self._order, self._arrivals
+        while self._idx < len(order) and arrivals[order[self._idx]] <= t:
+            self._idx += 1
+        return order[start:self._idx]
+
+
+class EventQueue:
+    """
+    Heap binario de desbloqueos pendientes: entradas (until, seq, pid).
+    'seq' crece con cada bloqueo, por lo que los empates en 'until' se
+    resuelven por orden de bloqueo (igual que recorrer un dict por inserción).
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, int]] = []
+        self._until: Dict[int, int] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._until
+
+    def push(self, pid: int, until: int):
+        heapq.heappush(self._heap, (until, self._seq, pid))
+        self._until[pid] = until
+        self._seq += 1
+
+    def peek(self) -> Optional[int]:
+        return self._heap[0][0] if self._heap else None
+
+    def next_after(self, t: int) -> Optional[int]:
+        """
+        Menor desbloqueo estrictamente posterior a t.
+        Solo recorre los nodos del heap con until <= t (los ya vencidos que aún
+        no se extrajeron), así que el costo es proporcional a esos vencidos.
+        """
+        heap = self._heap
+        best: Optional[int] = None
+        stack = [0] if heap else []
+        while stack:
+            i = stack.pop()
+            until = heap[i][0]
+            if until > t:
+                if best is None or until < best:
+                    best = until
+                continue
+            for j in (2 * i + 1, 2 * i + 2):
+                if j < len(heap):
+                    stack.append(j)
+        return best
+
+    def pop_due(self, t: int, order: str = "time") -> List[Tuple[int, int]]:
+        """
+        Extrae los desbloqueos con until <= t como pares (pid, until).
+        Se extraen todos antes de devolverlos: los bloqueos que se registren
+        mientras el llamador procesa la lista quedan para la siguiente pasada.
+
+        order:
+          - "time":    por tiempo de desbloqueo y luego orden de bloqueo.
+          - "blocked": por orden de bloqueo.
+        """
+        heap = self._heap
+        due: List[Tuple[int, int, int]] = []
+        while heap and heap[0][0] <= t:
+            due.append(heapq.heappop(heap))
+        if order == "blocked":
+            due.sort(key=lambda e: e[1])
+        out = []
+        for until, _, pid in due:
+            self._until.pop(pid, None)
+            out.append((pid, until))
+        return out
+
+
+class IndexedMinHeap:
+    """
+    Min-heap direccionable: cada pid aparece a lo sumo una vez y su clave
+    puede actualizarse (decrease/increase-key) o eliminarse en O(log n).
+    """
+
+    def __init__(self):
+        self._keys: List[tuple] = []
+        self._names: List[str] = []
+        self._pos: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __bool__(self) -> bool:
+        return bool(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._pos
+
+    def push(self, name: str, key: tuple):
+        if name in self._pos:
+            self.update(name, key)
+            return
+        self._keys.append(key)
+        self._names.append(name)
+        self._pos[name] = len(self._names) - 1
+        self._sift_up(len(self._names) - 1)
+
+    def update(self, name: str, key: tuple):
+        i = self._pos[name]
+        old = self._keys[i]
+        self._keys[i] = key
+        if key < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def peek(self) -> Optional[str]:
+        return self._names[0] if self._names else None
+
+    def pop(self) -> str:
+        name = self._names[0]
+        self._remove_at(0)
+        return name
+
+    def discard(self, name: str):
+        i = self._pos.get(name)
+        if i is not None:
+            self._remove_at(i)
+
+    def _remove_at(self, i: int):
+        keys, names = self._keys, self._names
+        del self._pos[names[i]]
+        last_key = keys.pop()
+        last_name = names.pop()
+        if i < len(names):
+            keys[i] = last_key
+            names[i] = last_name
+            self._pos[last_name] = i
+            self._sift_up(i)
+            self._sift_down(self._pos[last_name])
+
+    # Los sift mueven un "hueco" en lugar de intercambiar en cada nivel.
+    def _sift_up(self, i: int):
+        keys, names, pos = self._keys, self._names, self._pos
+        key, name = keys[i], names[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if key < keys[parent]:
+                keys[i] = keys[parent]
+                names[i] = names[parent]
+                pos[names[i]] = i
+                i = parent
+            else:
+                break
+        keys[i] = key
+        names[i] = name
+        pos[name] = i
+
+    def _sift_down(self, i: int):
+        keys, names, pos = self._keys, self._names, self._pos
+        n = len(keys)
+        key, name = keys[i], names[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[child + 1] < keys[child]:
+                child += 1
+            if keys[child] < key:
+                keys[i] = keys[child]
+                names[i] = names[child]
+                pos[names[i]] = i
+                i = child
+            else:
+                break
+        keys[i] = key
+        names[i] = name
+        pos[name] = i
+
+
+class SimulationKernel:
+    """
+    Núcleo de eventos discretos compartido por las estrategias: llegadas vía
+    ArrivalCursor y desbloqueos vía EventQueue. Cada estrategia conserva su
+    propia cola de listos y decide cuándo consultar cada fuente, de modo que
+    el orden de desempate de cada algoritmo no cambia.
+    """
+
+    def __init__(self, workload: Workload, presorted: bool = False):
+        self.arrivals = ArrivalCursor(workload, presorted=presorted)
+        self.blocked = EventQueue()
+
+    def next_arrival_after(self, t: int) -> Optional[int]:
+        na = self.arrivals.peek()
+        return na if na is not None and na > t else None
+
+    def next_event_after(self, t: int) -> Optional[int]:
+        """Próximo instante > t con una llegada o un desbloqueo (None si no hay)."""
+        na = self.next_arrival_after(t)
+        nu = self.blocked.next_after(t)
+        if na is None:
+            return nu
+        if nu is None:
+            return na
+        return min(na, nu)
+
+
+class EventEmitter:
+    """
+    Buffer de eventos que la estrategia llena durante un paso de simulación y
+    que schedule_iter vacía con drain() antes del siguiente paso.
+
+    Los tramos de CPU salen ya unidos: un dispatch contiguo al último del mismo
+    proceso lo extiende en lugar de agregar otro. Por eso el último dispatch
+    queda "abierto" y drain() no entrega nada a partir de él hasta que se
+    cierra (dispatch de otro proceso, rotation, un block o complete del mismo
+    proceso, o finish), sin alterar el orden.
+
+    Al completar un proceso calcula su TR y TE; completar dos veces el mismo
+    proceso no tiene efecto (vale la primera finalización).
+    """
+
+    def __init__(self, workload: Workload):
+        self._buffer: Deque[ScheduleEvent] = deque()
+        self._names = workload.names
+        self._arrivals = workload.arrivals
+        self._workload = workload
+        self._completed = bytearray(workload.n)
+        self._open: Optional[ScheduleEvent] = None
+        self._open_pid = -1
+
+    def dispatch(self, pid: int, start: int, end: int):
+        if self._open is not None and self._open_pid == pid and self._open.end == start:
+            self._open.end = end
+            return
+        self._open = ScheduleEvent(EVENT_DISPATCH, self._names[pid], start, end)
+        self._open_pid = pid
+        self._buffer.append(self._open)
+
+    def block(self, pid: int, start: int, end: int):
+        if pid == self._open_pid:
+            self._open = None   # el tramo abierto no puede pasar por encima de su propio bloqueo
+        self._buffer.append(ScheduleEvent(EVENT_BLOCK, self._names[pid], start, end))
+
+    def rotation(self, run: RotationRun):
+        self._open = None
+        self._buffer.append(ScheduleEvent(EVENT_ROTATION, None, run.start, run.end, run=run))
+
+    def continues(self, pid: int, t: int) -> bool:
+        """True si un dispatch de 'pid' en 't' extendería el último tramo emitido."""
+        return self._open is not None and self._open_pid == pid and self._open.end == t
+
+    def complete(self, pid: int, t: int):
+        if self._completed[pid]:
+            return
+        self._completed[pid] = 1
+        if pid == self._open_pid:
+            self._open = None
+        w = self._workload
+        tr = t - self._arrivals[pid]
+        te = tr - (w.total_cpu(pid) + w.total_block(pid))   # CPU + BLOCK total
+        self._buffer.append(ScheduleEvent(EVENT_COMPLETE, self._names[pid], t, t, max(0, tr), max(0, te)))
+
+    def finish(self, end_time: int):
+        """Completa en 'end_time' los procesos sin finalización registrada y cierra el último tramo."""
+        for pid in range(len(self._completed)):
+            self.complete(pid, end_time)
+        self._open = None
+
+    def drain(self) -> Iterator[ScheduleEvent]:
+        buffer = self._buffer
+        while buffer and buffer[0] is not self._open:
+            yield buffer.popleft()
+
+
+class ResultCollector:
+    """
+    Reconstruye un ScheduleResult a partir de los eventos de schedule_iter.
+    TR y TE se informan en el orden de 'processes'; per_process_slices es una
+    vista perezosa sobre el timeline. Con spill=True el timeline se vuelca a
+    disco a medida que crece (ver core/timeline_store.py).
+    """
+
+    def __init__(self, processes: Sequence[Process], spill: bool = False):
+        self._names = [p.name for p in processes]
+        self.timeline = SpilledTimeline(names=self._names) if spill else Timeline(names=self._names)
+        self.metrics = OnlineMetrics()
+        self._turnaround: Dict[str, int] = {}
+        self._waiting: Dict[str, int] = {}
+
+    def observe(self, event: ScheduleEvent):
+        kind = event.kind
+        if kind == EVENT_DISPATCH:
+            self.timeline.add(event.process, event.start, event.end)
+        elif kind == EVENT_BLOCK:
+            self.timeline.add(event.process, event.start, event.end, SLICE_BLOCK)
+        elif kind == EVENT_ROTATION:
+            self.timeline.append_run(event.run)
+        elif kind == EVENT_COMPLETE:
+            self._turnaround[event.process] = event.turnaround
+            self._waiting[event.process] = event.waiting
+            self.metrics.observe(event)
+
+    def result(self) -> ScheduleResult:
+        order = [name for name in self._names if name in self._turnaround]
+        self.timeline.seal()
+        return ScheduleResult(
+            timeline=self.timeline,
+            per_process_slices=PerProcessSlices(self.timeline, self._names),
+            turnaround={name: self._turnaround[name] for name in order},
+            waiting={name: self._waiting[name] for name in order},
+            avg_turnaround=self.metrics.avg_turnaround,
+            avg_waiting=self.metrics.avg_waiting
+        )
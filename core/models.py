@@ -1,5 +1,10 @@
+import re
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from functools import cached_property
+from itertools import accumulate
+from typing import List, Dict, Optional, Tuple, Iterator, Iterable, Sequence, Mapping, Union
 
 @dataclass
 class ExecSlice:
@@ -7,15 +12,339 @@ class ExecSlice:
     start: int
     end: int
 
+@dataclass
+class RotationRun:
+    """
+    'rounds' vueltas completas de Round Robin sobre 'order' a partir de 'start':
+    en cada vuelta cada proceso ejecuta exactamente 'quantum' unidades, en ese orden.
+    Se expande a los ExecSlice equivalentes solo cuando se lo pide.
+    """
+    order: List[str]
+    start: int
+    quantum: int
+    rounds: int
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.order) * self.quantum * self.rounds
+
+    def __len__(self) -> int:
+        return len(self.order) * self.rounds
+
+    def slice_at(self, i: int) -> ExecSlice:
+        start = self.start + i * self.quantum
+        return ExecSlice(self.order[i % len(self.order)], start, start + self.quantum)
+
+    def slices(self) -> Iterator[ExecSlice]:
+        t = self.start
+        q = self.quantum
+        for _ in range(self.rounds):
+            for name in self.order:
+                yield ExecSlice(name, t, t + q)
+                t += q
+
+# Tipo de cada fila del timeline columnar
+SLICE_CPU = 0
+SLICE_BLOCK = 1
+SLICE_RUN = 2    # fila que representa un RotationRun completo (forma compacta)
+
+class Timeline(Sequence):
+    """
+    Timeline columnar: columnas paralelas array() de inicio, fin, índice de
+    proceso y tipo (SLICE_CPU / SLICE_BLOCK / SLICE_RUN), más una tabla de
+    nombres internados. Ocupa unos pocos bytes por tramo en lugar de un
+    ExecSlice y un string nuevo por cada uno.
+
+    Se usa como una lista de ExecSlice (vista perezosa: los objetos se crean al
+    iterar o indexar, con el nombre legado "{name}_BLOCK" para los bloqueos).
+    Quien pueda debe leer rows(), que entrega (name, kind, start, end) sin
+    construir objetos ni parsear nombres. Los RotationRun se expanden al vuelo
+    y runs() permite recorrer la forma compacta.
+    """
+
+    def __init__(self, slices: Iterable[ExecSlice] = (), names: Iterable[str] = ()):
+        self._start = array("q")
+        self._end = array("q")
+        self._proc = array("i")
+        self._kind = array("b")
+        self.names: List[str] = []              # índice de proceso -> nombre
+        self._index: Dict[str, int] = {}
+        self._block_names: List[str] = []       # nombres legados "{name}_BLOCK", se completan al leer
+        self._runs: List[RotationRun] = []
+        self._run_rows: List[int] = []          # fila de cada RotationRun
+        self._run_offsets: List[int] = []       # índice expandido donde empieza cada RotationRun
+        self._len = 0
+        names = list(names)
+        index = dict(zip(names, range(len(names))))
+        if len(index) == len(names):
+            # Caso habitual (nombres únicos): internado en bloque
+            self.names, self._index = names, index
+        else:
+            for name in names:
+                self.intern(name)
+        for sl in slices:
+            self.append(sl)
+
+    # --- Escritura ---
+
+    def intern(self, name: str) -> int:
+        idx = self._index.get(name)
+        if idx is None:
+            idx = len(self.names)
+            self._index[name] = idx
+            self.names.append(name)
+        return idx
+
+    @property
+    def name_index(self) -> Mapping[str, int]:
+        """Nombre -> índice de proceso, en orden de internado (solo lectura)."""
+        return self._index
+
+    def _legacy_block_names(self) -> List[str]:
+        block_names = self._block_names
+        if len(block_names) < len(self.names):
+            block_names.extend(f"{name}_BLOCK" for name in self.names[len(block_names):])
+        return block_names
+
+    def add(self, name: str, start: int, end: int, kind: int = SLICE_CPU):
+        self._start.append(start)
+        self._end.append(end)
+        self._proc.append(self.intern(name))
+        self._kind.append(kind)
+        self._len += 1
+
+    def extend_cpu(self, procs: array, starts: array, ends: array):
+        """Agrega en bloque tramos CPU; 'procs' (array 'i') son índices de self.names."""
+        self._start.extend(starts)
+        self._end.extend(ends)
+        self._proc.extend(procs)
+        self._kind.frombytes(bytes(len(procs)))
+        self._len += len(procs)
+
+    def append(self, sl: ExecSlice):
+        """Compatibilidad con el timeline de ExecSlice: interpreta el sufijo "_BLOCK"."""
+        if sl.process.endswith("_BLOCK"):
+            self.add(sl.process[:-len("_BLOCK")], sl.start, sl.end, SLICE_BLOCK)
+        else:
+            self.add(sl.process, sl.start, sl.end)
+
+    def append_run(self, run: RotationRun):
+        if len(run) == 0:
+            return
+        for name in run.order:
+            self.intern(name)
+        self._run_rows.append(len(self._kind))
+        self._run_offsets.append(self._len)
+        self._start.append(run.start)
+        self._end.append(run.end)
+        self._proc.append(len(self._runs))
+        self._kind.append(SLICE_RUN)
+        self._runs.append(run)
+        self._len += len(run)
+
+    def seal(self):
+        """Fin de la escritura. En memoria no hace nada (ver SpilledTimeline)."""
+
+    @classmethod
+    def from_columns(cls, names: Iterable[str], columns: Tuple[array, array, array, array],
+                     runs: Iterable[RotationRun] = ()) -> "Timeline":
+        """
+        Inverso de columns(): arma el Timeline sobre columnas ya hechas (sin
+        copiarlas). 'runs' son los RotationRun de las filas SLICE_RUN, en orden.
+        """
+        timeline = cls(names=names)
+        timeline._start, timeline._end, timeline._proc, timeline._kind = columns
+        timeline._runs = list(runs)
+        kinds = timeline._kind.tobytes()
+        marker = bytes([SLICE_RUN])
+        extra = 0   # tramos que los RotationRun anteriores agregan al expandirse
+        row = kinds.find(marker)
+        while row >= 0:
+            run = timeline._runs[len(timeline._run_rows)]
+            timeline._run_rows.append(row)
+            timeline._run_offsets.append(row + extra)
+            extra += len(run) - 1
+            row = kinds.find(marker, row + 1)
+        timeline._len = len(kinds) + extra
+        return timeline
+
+    # --- Lectura ---
+
+    def columns(self) -> Tuple[array, array, array, array]:
+        """Columnas crudas (start, end, proc, kind); las filas SLICE_RUN apuntan a un RotationRun."""
+        return self._start, self._end, self._proc, self._kind
+
+    def rows(self) -> Iterator[Tuple[str, int, int, int]]:
+        """Tramos expandidos como (name, kind, start, end)."""
+        names = self.names
+        for s, e, p, k in zip(self._start, self._end, self._proc, self._kind):
+            if k == SLICE_RUN:
+                run = self._runs[p]
+                t, q = run.start, run.quantum
+                for _ in range(run.rounds):
+                    for name in run.order:
+                        yield name, SLICE_CPU, t, t + q
+                        t += q
+            else:
+                yield names[p], k, s, e
+
+    def run(self, row: int) -> RotationRun:
+        """El RotationRun de una fila SLICE_RUN de columns()."""
+        return self._runs[self._proc[row]]
+
+    def runs(self) -> Iterator[Union[ExecSlice, RotationRun]]:
+        for i, k in enumerate(self._kind):
+            yield self._runs[self._proc[i]] if k == SLICE_RUN else self._row_slice(i)
+
+    @property
+    def end_time(self) -> int:
+        return max(self._end, default=0)
+
+    def _row_slice(self, row: int) -> ExecSlice:
+        p = self._proc[row]
+        name = self._legacy_block_names()[p] if self._kind[row] == SLICE_BLOCK else self.names[p]
+        return ExecSlice(name, self._start[row], self._end[row])
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[ExecSlice]:
+        names, block_names = self.names, self._legacy_block_names()
+        for s, e, p, k in zip(self._start, self._end, self._proc, self._kind):
+            if k == SLICE_RUN:
+                yield from self._runs[p].slices()
+            else:
+                yield ExecSlice(block_names[p] if k == SLICE_BLOCK else names[p], s, e)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._len))]
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("Timeline index out of range")
+        k = bisect_right(self._run_offsets, i) - 1
+        if k < 0:
+            return self._row_slice(i)
+        offset, run = self._run_offsets[k], self._runs[k]
+        if i < offset + len(run):
+            return run.slice_at(i - offset)
+        return self._row_slice(self._run_rows[k] + 1 + (i - offset - len(run)))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Timeline, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Timeline({list(self)!r})"
+
+def as_timeline(timeline: Sequence[ExecSlice]) -> Timeline:
+    """Devuelve el Timeline tal cual, o convierte una lista legada de ExecSlice."""
+    return timeline if isinstance(timeline, Timeline) else Timeline(timeline)
+
+class PerProcessSlices(Mapping):
+    """
+    Vista perezosa nombre -> intervalos CPU [(start, end), ...] sobre un Timeline.
+    Se materializa en el primer acceso a partir de las columnas.
+    """
+
+    def __init__(self, timeline: Timeline, names: Iterable[str]):
+        self._timeline = timeline
+        self._names = list(names)
+        self._data: Optional[Dict[str, List[Tuple[int, int]]]] = None
+
+    def _materialize(self) -> Dict[str, List[Tuple[int, int]]]:
+        if self._data is None:
+            data: Dict[str, List[Tuple[int, int]]] = {name: [] for name in self._names}
+            for name, kind, start, end in self._timeline.rows():
+                if kind == SLICE_CPU:
+                    data.setdefault(name, []).append((start, end))
+            self._data = data
+        return self._data
+
+    def __getitem__(self, name: str) -> List[Tuple[int, int]]:
+        return self._materialize()[name]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+class ProcessValues(Mapping):
+    """
+    Vista nombre -> valor sobre una lista alineada con un índice nombre -> posición.
+    Permite publicar métricas de muchos procesos sin construir un dict por métrica.
+    """
+
+    def __init__(self, index: Mapping[str, int], values: Sequence[int]):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, name: str) -> int:
+        return self._values[self._index[name]]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def values(self):
+        # Ya alineados con el índice: sin buscar nombre por nombre
+        return self._values if len(self._values) == len(self._index) else super().values()
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+# Tipos de evento del modo streaming (SchedulerStrategy.schedule_iter)
+EVENT_DISPATCH = "dispatch"    # tramo de CPU [start, end)
+EVENT_BLOCK = "block"          # tramo de E/S [start, end)
+EVENT_ROTATION = "rotation"    # vueltas completas de Round Robin (ver 'run')
+EVENT_COMPLETE = "complete"    # fin del proceso en 'end', con su TR y TE
+
+@dataclass
+class ScheduleEvent:
+    kind: str
+    process: Optional[str]
+    start: int
+    end: int
+    turnaround: Optional[int] = None   # solo EVENT_COMPLETE
+    waiting: Optional[int] = None      # solo EVENT_COMPLETE
+    run: Optional[RotationRun] = None  # solo EVENT_ROTATION
+
+class OnlineMetrics:
+    """Totales de TR y TE acumulados evento a evento, en memoria constante."""
+
+    def __init__(self):
+        self.completed = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+
+    def observe(self, event: ScheduleEvent):
+        if event.kind == EVENT_COMPLETE:
+            self.completed += 1
+            self.total_turnaround += event.turnaround
+            self.total_waiting += event.waiting
+
+    @property
+    def avg_turnaround(self) -> Optional[float]:
+        return self.total_turnaround / self.completed if self.completed else None
+
+    @property
+    def avg_waiting(self) -> Optional[float]:
+        return self.total_waiting / self.completed if self.completed else None
+
 @dataclass
 class ScheduleResult:
     # Secuencia de ejecución en el tiempo (para Gantt global si se desea)
-    timeline: List[ExecSlice] = field(default_factory=list)
+    timeline: Sequence[ExecSlice] = field(default_factory=Timeline)
     # Para cada proceso: lista de intervalos de ejecución
-    per_process_slices: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)
+    per_process_slices: Mapping[str, List[Tuple[int, int]]] = field(default_factory=dict)
     # Métricas
-    turnaround: Dict[str, int] = field(default_factory=dict)  # TR
-    waiting: Dict[str, int] = field(default_factory=dict)     # TE
+    turnaround: Mapping[str, int] = field(default_factory=dict)  # TR
+    waiting: Mapping[str, int] = field(default_factory=dict)     # TE
     avg_turnaround: Optional[float] = None
     avg_waiting: Optional[float] = None
 
@@ -25,3 +354,138 @@ class Process:
     arrival: int
     burst: int  # Este puede mantenerse como suma total si querés compatibilidad
     pattern: Optional[List[Tuple[str, int]]] = None  # Ej: [("CPU", 3), ("BLOCK", 2), ("CPU", 4)]
+
+def encode_pattern(pattern: Iterable[Tuple[str, int]]) -> array:
+    """
+    Codificación compacta de un patrón: un entero con signo por tramo.
+    CPU de duración d -> d; BLOCK de duración d -> ~d (= -d - 1), de modo que
+    el signo distingue el tipo incluso para bloqueos de duración 0.
+    """
+    return array("q", (dur if kind == "CPU" else ~dur for kind, dur in pattern))
+
+
+def decode_pattern(codes: Iterable[int]) -> List[Tuple[str, int]]:
+    """Inversa de encode_pattern."""
+    return [("CPU", c) if c >= 0 else ("BLOCK", ~c) for c in codes]
+
+
+def parse_pattern(raw: str) -> Optional[List[Tuple[str, int]]]:
+    """
+    Convierte una cadena como "2, 1, 3, (2), 4, 5" en
+    [("CPU", 6), ("BLOCK", 2), ("CPU", 9)].
+    Agrupa todos los segmentos CPU consecutivos sumando sus duraciones.
+    Devuelve None si la cadena está vacía o no tiene tramos.
+    """
+    if not raw:
+        return None
+
+    tokens = re.findall(r'\(?\d+\)?', raw)
+    if not tokens:
+        return None
+
+    pattern = []
+    cpu_accum = 0
+
+    try:
+        for tok in tokens:
+            # Si es bloqueo, primero vuelca el CPU acumulado
+            if tok.startswith('(') and tok.endswith(')'):
+                if cpu_accum > 0:
+                    pattern.append(("CPU", cpu_accum))
+                    cpu_accum = 0
+                pattern.append(("BLOCK", int(tok[1:-1])))
+            else:
+                # Acumula CPU
+                cpu_accum += int(tok)
+
+        # Al final, si quedó CPU acumulado, agregarlo
+        if cpu_accum > 0:
+            pattern.append(("CPU", cpu_accum))
+
+    except ValueError:
+        return None
+
+    return pattern
+
+
+def format_pattern(pattern: Iterable[Tuple[str, int]]) -> str:
+    """Inversa de parse_pattern: [("CPU", 3), ("BLOCK", 2), ("CPU", 4)] -> "3,(2),4"."""
+    return ",".join(str(d) if kind == "CPU" else f"({d})" for kind, d in pattern)
+
+
+class Workload:
+    """
+    Carga de trabajo compilada una sola vez a partir de List[Process] y
+    compartida, sin copias, entre estrategias y corridas (comparar algoritmos,
+    barrer quantums de RR, etc.). Las estrategias solo la leen.
+
+    - Cada proceso se identifica por su índice en la lista original (pid).
+    - arrival_order: pids ordenados de forma estable por llegada.
+    - segments: patrones aplanados con la codificación de encode_pattern; los
+      tramos del pid están en [seg_offsets[pid], seg_offsets[pid + 1]).
+      Las estrategias los consumen avanzando un índice, sin mutar nada.
+    - cpu_prefix / block_prefix: sumas prefijas sobre esos tramos aplanados.
+    - has_block: si algún proceso tiene tramos BLOCK.
+    Un proceso sin patrón se compila como un único tramo CPU de 'burst'.
+    """
+
+    def __init__(self, processes: Iterable[Process]):
+        self.processes: Tuple[Process, ...] = tuple(processes)
+        self.n = n = len(self.processes)
+        self.names: Tuple[str, ...] = tuple([p.name for p in self.processes])
+        self.arrivals = array("q", [p.arrival for p in self.processes])
+
+        # Listas y comprensiones en lugar de appends sobre array(): con cientos de
+        # miles de procesos la compilación no debe pesar más que la simulación.
+        if any([p.pattern for p in self.processes]):
+            segments: List[int] = []
+            offsets = [0]
+            for p in self.processes:
+                if p.pattern:
+                    segments.extend([dur if kind == "CPU" else ~dur for kind, dur in p.pattern])
+                else:
+                    segments.append(p.burst)
+                offsets.append(len(segments))
+        else:
+            segments = [p.burst for p in self.processes]
+            offsets = range(n + 1)
+        self.segments = array("q", segments)
+        self.seg_offsets = array("q", offsets)
+        self.has_block = min(segments, default=0) < 0
+
+    # El resto se calcula una sola vez, la primera vez que alguna estrategia lo pide.
+
+    @cached_property
+    def arrival_order(self) -> array:
+        arrivals = self.arrivals.tolist()
+        return array("i", sorted(range(self.n), key=arrivals.__getitem__))
+
+    @cached_property
+    def cpu_prefix(self) -> array:
+        if not self.has_block:
+            return array("q", accumulate(self.segments, initial=0))
+        return array("q", accumulate([c if c >= 0 else 0 for c in self.segments], initial=0))
+
+    @cached_property
+    def block_prefix(self) -> array:
+        if not self.has_block:
+            return array("q", bytes(8 * (len(self.segments) + 1)))
+        return array("q", accumulate([~c if c < 0 else 0 for c in self.segments], initial=0))
+
+    @classmethod
+    def of(cls, processes: Union["Workload", Iterable[Process]]) -> "Workload":
+        """Devuelve la Workload tal cual, o la compila desde una lista de Process."""
+        return processes if isinstance(processes, Workload) else cls(processes)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def total_cpu(self, pid: int) -> int:
+        return self.cpu_prefix[self.seg_offsets[pid + 1]] - self.cpu_prefix[self.seg_offsets[pid]]
+
+    def total_block(self, pid: int) -> int:
+        return self.block_prefix[self.seg_offsets[pid + 1]] - self.block_prefix[self.seg_offsets[pid]]
+
+    def cpu_from(self, pid: int, seg: int) -> int:
+        """CPU total de los tramos del pid desde el índice aplanado 'seg' hasta el final."""
+        return self.cpu_prefix[self.seg_offsets[pid + 1]] - self.cpu_prefix[seg]
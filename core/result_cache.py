@@ -0,0 +1,298 @@
+"""
+Caché de resultados de planificación, direccionada por contenido.
+
+La clave es un SHA-256 de (algoritmo, quantum, carga normalizada): la carga se
+toma ya compilada como Workload (nombres, llegadas y tramos codificados), así
+un proceso sin patrón y uno con el patrón [("CPU", burst)] dan la misma clave.
+El quantum solo entra si la estrategia lo usa.
+
+Dos niveles:
+- memoria: LRU acotado por cantidad de entradas y por bytes estimados. Entrega
+  el mismo ScheduleResult a todos los que piden la misma clave: es de solo
+  lectura, como la Workload.
+- disco (opcional): un archivo por clave con las columnas del timeline y las
+  métricas (sin pickle), con desalojo de los menos usados cuando el
+  directorio supera 'disk_bytes'. Sirve entre procesos (p. ej. varias
+  invocaciones de la línea de comandos).
+
+SchedulerFactory la asigna a las estrategias que crea y
+SchedulerStrategy.schedule la consulta antes de planificar. Los resultados con
+spill=True no se guardan. CACHE_VERSION cambia la clave de todo lo anterior:
+hay que subirlo cuando cambia lo que produce algún algoritmo.
+"""
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Optional
+
+from .models import Workload, ScheduleResult, Timeline, RotationRun, PerProcessSlices, ProcessValues, SLICE_RUN
+
+CACHE_VERSION = 3
+MEMORY_ENTRIES = 32                  # resultados en memoria
+MEMORY_BYTES = 256 * 1024 * 1024     # bytes estimados en memoria
+DISK_BYTES = 1024 * 1024 * 1024      # tamaño máximo del directorio en disco
+CACHE_DIR_ENV = "CHRONOMIND_CACHE_DIR"
+
+_MAGIC = b"CMRC"
+_HEADER = struct.Struct("<4sII")     # magic, versión, largo del encabezado JSON
+_SUFFIX = ".result"
+_TYPECODES = ("q", "q", "i", "b")    # start, end, proc, kind (como Timeline.columns())
+_RUN = bytes([SLICE_RUN])
+
+
+def cache_key(algorithm: str, quantum: Optional[int], workload: Workload) -> str:
+    """Hash hexadecimal de (algoritmo, quantum, carga normalizada)."""
+    h = hashlib.sha256()
+    h.update(json.dumps([CACHE_VERSION, sys.byteorder, algorithm, quantum, workload.n]).encode())
+    h.update(json.dumps(workload.names, ensure_ascii=False).encode())
+    h.update(workload.arrivals)
+    h.update(workload.seg_offsets)
+    h.update(workload.segments)
+    return h.hexdigest()
+
+
+def estimate_bytes(result: ScheduleResult) -> int:
+    """Memoria aproximada de un resultado: columnas del timeline y métricas por proceso."""
+    timeline = result.timeline
+    if isinstance(timeline, Timeline):
+        rows = sum(len(c) * c.itemsize for c in timeline.columns())
+    else:
+        rows = 64 * len(timeline)
+    return rows + 200 * len(result.turnaround)
+
+
+class ResultCache:
+    def __init__(self, max_entries: int = MEMORY_ENTRIES, max_bytes: int = MEMORY_BYTES,
+                 disk_dir: Optional[str] = None, disk_bytes: int = DISK_BYTES):
+        if max_entries < 0 or max_bytes < 0 or disk_bytes < 0:
+            raise ValueError("Los límites de la caché no pueden ser negativos.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_bytes = disk_bytes
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()   # clave -> (resultado, bytes)
+        self._memory_bytes = 0
+        self._disk_total: Optional[int] = None   # bytes en el directorio (None = sin contar aún)
+        self._lock = threading.Lock()   # Calcular planifica en otro hilo
+        self.hits = 0
+        self.misses = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> "ResultCache":
+        """Caché en memoria, más el nivel en disco si CHRONOMIND_CACHE_DIR indica un directorio."""
+        return cls(disk_dir=os.environ.get(CACHE_DIR_ENV) or None)
+
+    # --- Consulta ---
+
+    def get(self, key: str) -> Optional[ScheduleResult]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        result = self._load(key) if self.disk_dir else None
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: ScheduleResult):
+        if not isinstance(result.timeline, Timeline):
+            return   # lista legada de ExecSlice: no hay columnas que guardar
+        self._remember(key, result)
+        if self.disk_dir:
+            self._store(key, result)
+
+    def clear(self, disk: bool = False):
+        """Vacía la memoria (y, con disk=True, borra los archivos del directorio)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if disk and self.disk_dir:
+            for path, _, _ in self._disk_entries():
+                _remove(path)
+            self._disk_total = 0
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    # --- Nivel en memoria (LRU) ---
+
+    def _remember(self, key: str, result: ScheduleResult):
+        size = estimate_bytes(result)
+        if not self.max_entries or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old[1]
+            self._memory[key] = (result, size)
+            self._memory_bytes += size
+            while len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes:
+                _, (_, freed) = self._memory.popitem(last=False)
+                self._memory_bytes -= freed
+
+    # --- Nivel en disco ---
+    #
+    # Archivo: _HEADER, encabezado JSON (nombres, RotationRun, métricas) y a
+    # continuación, crudas, las cuatro columnas del timeline y TR y TE ('q').
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + _SUFFIX)
+
+    def _store(self, key: str, result: ScheduleResult):
+        timeline = result.timeline
+        columns = timeline.columns()
+        kinds = columns[3].tobytes()
+        runs = []
+        row = kinds.find(_RUN)
+        while row >= 0:
+            runs.append(timeline.run(row))
+            row = kinds.find(_RUN, row + 1)
+        index = timeline.name_index
+        metric_names = list(result.turnaround)
+        header = json.dumps({
+            "names": timeline.names,
+            "rows": len(kinds),
+            "runs": [[[index[name] for name in r.order], r.start, r.quantum, r.rounds] for r in runs],
+            # null: TR y TE siguen el orden de 'names' (lo habitual)
+            "metrics": None if metric_names == timeline.names else metric_names,
+            "avg": [result.avg_turnaround, result.avg_waiting],
+        }, ensure_ascii=False).encode()
+        size = _HEADER.size + len(header) + sum(len(c) * c.itemsize for c in columns) + 16 * len(metric_names)
+        if size > self.disk_bytes:
+            return
+        tr = array("q", result.turnaround.values())
+        te = array("q", result.waiting.values())
+        if len(te) != len(tr):
+            return
+
+        fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=self.disk_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, CACHE_VERSION, len(header)))
+                f.write(header)
+                for column in (*columns, tr, te):
+                    f.write(column)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            _remove(tmp)
+            return
+        # El directorio se recorre solo al empezar y al pasarse del límite
+        if self._disk_total is None:
+            self._disk_total = sum(entry[2] for entry in self._disk_entries())
+        else:
+            self._disk_total += size
+        if self._disk_total > self.disk_bytes:
+            self._evict_disk()
+
+    def _load(self, key: str) -> Optional[ScheduleResult]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            result = _decode(data)
+        except (ValueError, KeyError, IndexError, struct.error):
+            result = None
+        if result is None:
+            _remove(path)   # archivo dañado o de otra versión
+            return None
+        try:
+            os.utime(path)   # la fecha de modificación ordena el desalojo
+        except OSError:
+            pass
+        return result
+
+    def _disk_entries(self):
+        try:
+            names = os.listdir(self.disk_dir)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.disk_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_mtime, st.st_size))
+        return entries
+
+    def _evict_disk(self):
+        entries = self._disk_entries()
+        total = sum(size for _, _, size in entries)
+        for path, _, size in sorted(entries, key=lambda e: e[1]):
+            if total <= self.disk_bytes:
+                break
+            _remove(path)
+            total -= size
+        self._disk_total = total
+
+
+def _decode(data: bytes) -> Optional[ScheduleResult]:
+    magic, version, header_len = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != CACHE_VERSION:
+        return None
+    pos = _HEADER.size
+    header = json.loads(data[pos:pos + header_len].decode())
+    pos += header_len
+    names, rows = header["names"], header["rows"]
+    metric_names = header["metrics"]
+    metrics = len(names) if metric_names is None else len(metric_names)
+
+    def take(typecode: str, n: int) -> array:
+        nonlocal pos
+        column = array(typecode)
+        column.frombytes(data[pos:pos + n * column.itemsize])
+        if len(column) != n:
+            raise ValueError("archivo truncado")
+        pos += n * column.itemsize
+        return column
+
+    columns = tuple(take(typecode, rows) for typecode in _TYPECODES)
+    tr, te = take("q", metrics), take("q", metrics)
+    if pos != len(data):
+        raise ValueError("largo inesperado")
+
+    runs = [RotationRun([names[i] for i in order], start, quantum, rounds)
+            for order, start, quantum, rounds in header["runs"]]
+    timeline = Timeline.from_columns(names, columns, runs)
+    if metric_names is None and len(timeline.names) == metrics:
+        turnaround = ProcessValues(timeline.name_index, tr)
+        waiting = ProcessValues(timeline.name_index, te)
+    else:
+        metric_names = names if metric_names is None else metric_names
+        turnaround, waiting = dict(zip(metric_names, tr)), dict(zip(metric_names, te))
+    avg_tr, avg_te = header["avg"]
+    return ScheduleResult(
+        timeline=timeline,
+        per_process_slices=PerProcessSlices(timeline, names),
+        turnaround=turnaround,
+        waiting=waiting,
+        avg_turnaround=avg_tr,
+        avg_waiting=avg_te
+    )
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,8 +1,83 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from .models import Process, ScheduleResult
+from typing import Callable, Iterator, List, Optional, Union
+from .models import Process, Workload, ScheduleResult, ScheduleEvent, EVENT_COMPLETE
+from .kernel import ResultCollector
+from .result_cache import ResultCache, cache_key
+
+# Eventos entre dos llamadas a 'progress' en SchedulerStrategy.schedule
+PROGRESS_EVERY = 4096
+
+# progress(procesos terminados, total)
+ProgressCallback = Callable[[int, int], None]
 
 class SchedulerStrategy(ABC):
+    """
+    Las estrategias reciben una List[Process] o una Workload ya compilada
+    (Workload.of la compila solo si hace falta). La Workload es de solo
+    lectura: puede reutilizarse entre algoritmos y corridas sin copiarla.
+    """
+
+    # True si la estrategia usa el parámetro 'quantum'
+    uses_quantum: bool = False
+    # Caché de resultados y nombre con el que se la consulta (los asigna SchedulerFactory.create)
+    cache: Optional[ResultCache] = None
+    name: str = ""
+
     @abstractmethod
-    def schedule(self, processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+    def schedule_iter(self, processes: Union[List[Process], Workload], quantum: Optional[int] = None) -> Iterator[ScheduleEvent]:
+        """
+        Genera los eventos (dispatch / block / rotation / complete) a medida que
+        avanza la simulación, sin acumular el resultado en memoria. Cada evento
+        'complete' trae el TR y TE del proceso (ver OnlineMetrics).
+        """
         ...
+
+    def report_order(self, workload: Workload) -> List[Process]:
+        """Orden en que el resultado informa TR y TE por proceso."""
+        return list(workload.processes)
+
+    def schedule(self, processes: Union[List[Process], Workload], quantum: Optional[int] = None,
+                 progress: Optional[ProgressCallback] = None, spill: bool = False) -> ScheduleResult:
+        """
+        Con 'progress', se llama progress(terminados, total) cada PROGRESS_EVERY
+        eventos y al final. Si levanta una excepción, la corrida se abandona con
+        ella: así se cancela desde otro hilo (ver gui/worker.py).
+
+        Con spill=True el timeline del resultado es un SpilledTimeline: la
+        memoria queda acotada y los tramos se leen desde un archivo mapeado.
+
+        Con 'cache', una carga ya planificada con el mismo algoritmo y quantum
+        devuelve el resultado guardado (ver core/result_cache.py); no lo modifiquen.
+        """
+        workload = Workload.of(processes)
+        cache = self.cache
+        if cache is None or spill:
+            return self._schedule(workload, quantum, progress, spill)
+        key = cache_key(self.name or type(self).__qualname__, quantum if self.uses_quantum else None, workload)
+        result = cache.get(key)
+        if result is not None:
+            if progress is not None:
+                progress(workload.n, workload.n)
+            return result
+        result = self._schedule(workload, quantum, progress, spill)
+        cache.put(key, result)
+        return result
+
+    def _schedule(self, workload: Workload, quantum: Optional[int],
+                  progress: Optional[ProgressCallback], spill: bool) -> ScheduleResult:
+        """Planifica sin caché: recorre schedule_iter (las estrategias con atajos lo redefinen)."""
+        collector = ResultCollector(self.report_order(workload), spill=spill)
+        if progress is None:
+            for event in self.schedule_iter(workload, quantum):
+                collector.observe(event)
+            return collector.result()
+
+        total, done = workload.n, 0
+        for i, event in enumerate(self.schedule_iter(workload, quantum), 1):
+            collector.observe(event)
+            if event.kind == EVENT_COMPLETE:
+                done += 1
+            if not i % PROGRESS_EVERY:
+                progress(done, total)
+        progress(total, total)
+        return collector.result()
@@ -1,22 +1,52 @@
-from typing import Dict, Type, Optional
+from importlib import import_module
+from typing import Dict, Type, Optional, Tuple
 from .scheduler_base import SchedulerStrategy
-from ..algorithms.fifo import FIFO
-from ..algorithms.sjf import SJF
-from ..algorithms.srtf import SRTF
-from ..algorithms.round_robin import RoundRobin
+from .result_cache import ResultCache
 
 class SchedulerFactory:
-    _strategies: Dict[str, Type[SchedulerStrategy]] = {
-        "FIFO": FIFO,
-        "SJF": SJF,
-        "SRTF": SRTF,
-        "Round Robin": RoundRobin,
+    # Nombre -> (módulo relativo al paquete, clase). Los algoritmos se importan
+    # al crearlos por primera vez, así listar nombres no carga ninguno.
+    _strategies: Dict[str, Tuple[str, str]] = {
+        "FIFO": ("..algorithms.fifo", "FIFO"),
+        "SJF": ("..algorithms.sjf", "SJF"),
+        "SRTF": ("..algorithms.srtf", "SRTF"),
+        "Round Robin": ("..algorithms.round_robin", "RoundRobin"),
     }
+    _loaded: Dict[str, Type[SchedulerStrategy]] = {}
+    # Compartida por todas las estrategias creadas acá (None la desactiva)
+    cache: Optional[ResultCache] = ResultCache.from_env()
 
     @classmethod
-    def create(cls, name: str) -> Optional[SchedulerStrategy]:
-        strategy_cls = cls._strategies.get(name)
-        return strategy_cls() if strategy_cls else None
+    def strategy_class(cls, name: str) -> Optional[Type[SchedulerStrategy]]:
+        strategy_cls = cls._loaded.get(name)
+        if strategy_cls is None and name in cls._strategies:
+            module, attr = cls._strategies[name]
+            strategy_cls = getattr(import_module(module, __package__), attr)
+            cls._loaded[name] = strategy_cls
+        return strategy_cls
+
+    @classmethod
+    def create(cls, name: str, cache: bool = True) -> Optional[SchedulerStrategy]:
+        """Con cache=False la estrategia planifica siempre de cero (p. ej. para medir tiempos)."""
+        strategy_cls = cls.strategy_class(name)
+        if strategy_cls is None:
+            return None
+        strategy = strategy_cls()
+        strategy.name = name
+        if cache:
+            strategy.cache = cls.cache
+        return strategy
+
+    @classmethod
+    def configure_cache(cls, cache: Optional[ResultCache]):
+        """Reemplaza la caché de resultados de las estrategias que se creen desde ahora."""
+        cls.cache = cache
+
+    @classmethod
+    def preload(cls):
+        """Importa todas las estrategias (p. ej. en segundo plano tras abrir la ventana)."""
+        for name in cls._strategies:
+            cls.strategy_class(name)
 
     @classmethod
     def list_algorithms(cls):
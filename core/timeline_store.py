@@ -0,0 +1,130 @@
+"""
+Timeline con memoria acotada: las filas se acumulan en un buffer de
+SPILL_BUFFER_ROWS filas y, al llenarse, se vuelcan a disco como registros de
+ancho fijo (un archivo temporal por columna: start 'q', end 'q', proc 'i',
+kind 'b'). Al cerrar la escritura (seal) cada archivo se mapea en memoria y
+las columnas pasan a ser memoryview sobre ese mapeo: rows(), columns(),
+indexado y el resto de la lectura de Timeline funcionan igual, y el sistema
+operativo pagina solo lo que se lee.
+
+En memoria quedan los nombres internados y los RotationRun (uno por vuelta
+compacta de Round Robin, no por tramo). Se activa con
+SchedulerStrategy.schedule(..., spill=True).
+"""
+import mmap
+import tempfile
+from array import array
+from typing import Iterable, List
+
+from .models import Timeline, RotationRun, SLICE_CPU, SLICE_RUN
+
+SPILL_BUFFER_ROWS = 1 << 16   # filas en memoria antes de volcar a disco
+
+_TYPECODES = ("q", "q", "i", "b")   # start, end, proc, kind
+
+
+class SpilledTimeline(Timeline):
+    def __init__(self, names: Iterable[str] = (), buffer_rows: int = SPILL_BUFFER_ROWS):
+        if buffer_rows < 1:
+            raise ValueError("buffer_rows debe ser positivo.")
+        self._buffer_rows = buffer_rows
+        self._files = [tempfile.TemporaryFile(prefix="chronomind-timeline-") for _ in _TYPECODES]
+        self._maps: List[mmap.mmap] = []
+        self._spilled = 0        # filas ya volcadas a disco
+        self._end_max = 0
+        self._sealed = False
+        super().__init__(names=names)
+
+    # --- Escritura ---
+
+    def add(self, name: str, start: int, end: int, kind: int = SLICE_CPU):
+        self._check_open()
+        super().add(name, start, end, kind)
+        if end > self._end_max:
+            self._end_max = end
+        if len(self._kind) >= self._buffer_rows:
+            self._spill()
+
+    def extend_cpu(self, procs: array, starts: array, ends: array):
+        self._check_open()
+        super().extend_cpu(procs, starts, ends)
+        if len(ends):
+            self._end_max = max(self._end_max, max(ends))
+        if len(self._kind) >= self._buffer_rows:
+            self._spill()
+
+    def append_run(self, run: RotationRun):
+        # Como Timeline.append_run, pero la fila del run cuenta lo ya volcado
+        self._check_open()
+        if len(run) == 0:
+            return
+        for name in run.order:
+            self.intern(name)
+        self._run_rows.append(self._spilled + len(self._kind))
+        self._run_offsets.append(self._len)
+        self._start.append(run.start)
+        self._end.append(run.end)
+        self._proc.append(len(self._runs))
+        self._kind.append(SLICE_RUN)
+        self._runs.append(run)
+        self._len += len(run)
+        self._end_max = max(self._end_max, run.end)
+        if len(self._kind) >= self._buffer_rows:
+            self._spill()
+
+    def _check_open(self):
+        if self._sealed:
+            raise RuntimeError("El timeline ya está cerrado: no admite más tramos.")
+
+    def _spill(self):
+        n = len(self._kind)
+        if not n:
+            return
+        for f, column in zip(self._files, self.columns()):
+            column.tofile(f)
+            del column[:]
+        self._spilled += n
+
+    def seal(self):
+        """Vuelca el buffer y mapea los archivos; desde acá las columnas son de solo lectura."""
+        if self._sealed:
+            return
+        self._spill()
+        self._sealed = True
+        if not self._spilled:
+            return
+        views = []
+        for f, typecode in zip(self._files, _TYPECODES):
+            f.flush()
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mm)
+            views.append(memoryview(mm).cast(typecode))
+        self._start, self._end, self._proc, self._kind = views
+
+    def close(self):
+        """Libera los mapeos y borra los archivos temporales; el timeline queda vacío."""
+        self._start, self._end, self._proc, self._kind = (array(t) for t in _TYPECODES)
+        self._runs, self._run_rows, self._run_offsets = [], [], []
+        self._len = self._spilled = self._end_max = 0
+        for mm in self._maps:
+            try:
+                mm.close()
+            except BufferError:
+                pass   # alguien conserva una vista: el mapeo se libera con ella
+        self._maps = []
+        for f in self._files:
+            f.close()
+
+    # --- Lectura ---
+
+    @property
+    def spilled_rows(self) -> int:
+        """Filas en disco (todas, una vez cerrado)."""
+        return self._spilled
+
+    @property
+    def end_time(self) -> int:
+        return self._end_max
+
+    def __repr__(self) -> str:
+        return f"SpilledTimeline({self._len} tramos, {self._spilled} filas en disco)"
@@ -0,0 +1,201 @@
+"""
+Exportación columnar del timeline y de las métricas: CSV, Arrow IPC o Parquet.
+
+Una fila por tramo con las columnas process, kind ("CPU" / "BLOCK"), start y
+end (las mismas de 'chronomind run --timeline'). El timeline se lee directo
+de sus columnas array() y se escribe por bloques de BLOQUE filas, así un
+millón de tramos no pasa por ExecSlice ni por una lista en memoria; los
+RotationRun se expanden bloque a bloque.
+
+Arrow y Parquet requieren pyarrow (opcional): process y kind van como
+columnas diccionario y los enteros se pasan sin copiar desde los array().
+"""
+from __future__ import annotations
+
+import csv
+import os
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..core.models import ScheduleResult, Process, Timeline, as_timeline, SLICE_RUN
+
+FORMATOS = ("csv", "arrow", "parquet")
+EXTENSIONES = {".csv": "csv", ".arrow": "arrow", ".ipc": "arrow", ".feather": "arrow", ".parquet": "parquet"}
+BLOQUE = 262_144           # filas por bloque (y por row group en Parquet)
+TIPOS = ("CPU", "BLOCK")   # índice = SLICE_CPU / SLICE_BLOCK
+
+_pa = None
+
+
+def _pyarrow():
+    global _pa
+    if _pa is None:
+        try:
+            import pyarrow
+            import pyarrow.ipc  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise ImportError("Para exportar a Arrow o Parquet hace falta pyarrow (pip install pyarrow).")
+        _pa = pyarrow
+    return _pa
+
+
+def formato_de(ruta: str, formato: Optional[str] = None) -> str:
+    """Formato indicado o, si no, el de la extensión de 'ruta'."""
+    if formato is None:
+        formato = EXTENSIONES.get(os.path.splitext(ruta)[1].lower())
+        if formato is None:
+            raise ValueError(f"Extensión no soportada: {ruta} ({', '.join(EXTENSIONES)})")
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido: {formato} ({', '.join(FORMATOS)})")
+    return formato
+
+
+Bloque = Tuple[array, array, array, array]   # (proc 'i', kind 'b', start 'q', end 'q')
+
+
+def bloques(timeline: Timeline, tamano: int = BLOQUE) -> Iterator[Bloque]:
+    """
+    Tramos expandidos en bloques de a lo sumo 'tamano' filas. 'proc' indexa
+    timeline.names. Los tramos comunes se copian en rebanadas de las columnas;
+    solo los RotationRun se recorren en Python.
+    """
+    start, end, proc, kind = timeline.columns()
+    tipos = kind.tobytes()
+    n = len(kind)
+    i = 0
+    while i < n:
+        j = tipos.find(bytes([SLICE_RUN]), i)
+        if j < 0:
+            j = n
+        for k in range(i, j, tamano):
+            h = min(k + tamano, j)
+            yield proc[k:h], kind[k:h], start[k:h], end[k:h]
+        if j < n:
+            yield from _bloques_run(timeline, timeline.run(j), tamano)
+        i = j + 1
+
+
+def _bloques_run(timeline: Timeline, run, tamano: int) -> Iterator[Bloque]:
+    indice = timeline.name_index
+    orden = [indice[name] for name in run.order]
+    q = run.quantum
+    total = len(run)
+    hecho = 0
+    while hecho < total:
+        m = min(tamano, total - hecho)
+        procs = array("i", (orden[(hecho + x) % len(orden)] for x in range(m)))
+        inicios = array("q", range(run.start + hecho * q, run.start + (hecho + m) * q, q))
+        fines = array("q", range(run.start + (hecho + 1) * q, run.start + (hecho + m + 1) * q, q))
+        yield procs, array("b", bytes(m)), inicios, fines
+        hecho += m
+
+
+class ExportadorColumnar:
+    def __init__(self, tamano_bloque: int = BLOQUE):
+        if tamano_bloque < 1:
+            raise ValueError("tamano_bloque debe ser positivo.")
+        self.tamano_bloque = tamano_bloque
+
+    # ================== Timeline ==================
+    def exportar_timeline(self, ruta: str, resultado: ScheduleResult, formato: Optional[str] = None) -> int:
+        """Escribe el timeline de 'resultado' en 'ruta'; devuelve la cantidad de tramos."""
+        formato = formato_de(ruta, formato)
+        timeline = as_timeline(resultado.timeline)
+        partes = bloques(timeline, self.tamano_bloque)
+        if formato == "csv":
+            return self._timeline_csv(ruta, timeline.names, partes)
+        return self._timeline_arrow(ruta, timeline.names, partes, formato)
+
+    def _timeline_csv(self, ruta: str, names: List[str], partes: Iterator[Bloque]) -> int:
+        filas = 0
+        with open(ruta, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(("process", "kind", "start", "end"))
+            for procs, kinds, inicios, fines in partes:
+                writer.writerows(zip(map(names.__getitem__, procs), map(TIPOS.__getitem__, kinds), inicios, fines))
+                filas += len(procs)
+        return filas
+
+    def _timeline_arrow(self, ruta: str, names: List[str], partes: Iterator[Bloque], formato: str) -> int:
+        pa = _pyarrow()
+        esquema = pa.schema([
+            ("process", pa.dictionary(pa.int32(), pa.string())),
+            ("kind", pa.dictionary(pa.int8(), pa.string())),
+            ("start", pa.int64()),
+            ("end", pa.int64()),
+        ])
+        # Los diccionarios son los mismos en todos los lotes (lo exige el formato de archivo IPC)
+        nombres = pa.array(names, pa.string())
+        tipos = pa.array(TIPOS, pa.string())
+
+        def lote(procs, kinds, inicios, fines):
+            m = len(procs)
+            return pa.RecordBatch.from_arrays([
+                pa.DictionaryArray.from_arrays(self._arrow(pa, pa.int32(), procs, m), nombres),
+                pa.DictionaryArray.from_arrays(self._arrow(pa, pa.int8(), kinds, m), tipos),
+                self._arrow(pa, pa.int64(), inicios, m),
+                self._arrow(pa, pa.int64(), fines, m),
+            ], schema=esquema)
+
+        filas = 0
+        with self._escritor(pa, ruta, esquema, formato) as escritor:
+            for parte in partes:
+                escritor.write_batch(lote(*parte))
+                filas += len(parte[0])
+        return filas
+
+    @staticmethod
+    def _arrow(pa, tipo, datos: array, m: int):
+        # Sin copia: el buffer del array() pasa tal cual a Arrow
+        return pa.Array.from_buffers(tipo, m, [None, pa.py_buffer(datos)])
+
+    @staticmethod
+    def _escritor(pa, ruta: str, esquema, formato: str):
+        if formato == "parquet":
+            return pa.parquet.ParquetWriter(ruta, esquema)
+        return pa.ipc.new_file(ruta, esquema)
+
+    # ================== Métricas ==================
+    def exportar_metricas(
+        self,
+        ruta: str,
+        resultado: ScheduleResult,
+        procesos: Optional[List[Process]] = None,
+        formato: Optional[str] = None,
+    ) -> int:
+        """
+        Una fila por proceso: name, arrival, burst, turnaround y waiting (sin
+        'procesos', solo name, turnaround y waiting). Devuelve la cantidad de filas.
+        """
+        formato = formato_de(ruta, formato)
+        columnas = self._metricas(resultado, procesos)
+        if formato == "csv":
+            with open(ruta, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(list(columnas))
+                writer.writerows(zip(*columnas.values()))
+        else:
+            pa = _pyarrow()
+            tabla = pa.table(columnas)
+            with self._escritor(pa, ruta, tabla.schema, formato) as escritor:
+                escritor.write_table(tabla)
+        return len(columnas["name"])
+
+    @staticmethod
+    def _metricas(resultado: ScheduleResult, procesos: Optional[List[Process]]) -> Dict[str, List[Any]]:
+        tr, te = resultado.turnaround, resultado.waiting
+        if procesos:
+            return {
+                "name": [p.name for p in procesos],
+                "arrival": [p.arrival for p in procesos],
+                "burst": [p.burst for p in procesos],
+                "turnaround": [tr.get(p.name) for p in procesos],
+                "waiting": [te.get(p.name) for p in procesos],
+            }
+        nombres = list(tr.keys())
+        return {
+            "name": nombres,
+            "turnaround": [tr[name] for name in nombres],
+            "waiting": [te.get(name) for name in nombres],
+        }
@@ -1,30 +1,80 @@
 from __future__ import annotations
 from typing import List, Dict, Tuple, Optional, Any
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Alignment, Font, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import PatternFill, Alignment, Font, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
-from ..core.models import ScheduleResult, Process
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.dimensions import ColumnDimension
+from openpyxl.worksheet.hyperlink import Hyperlink
+from ..core.models import ScheduleResult, Process, as_timeline, SLICE_BLOCK
+
+# A partir de este tamaño de grilla (procesos × ticks) exportar_con_gantt usa el
+# modo streaming (Workbook write_only): las filas se escriben a medida que se
+# generan y la memoria no crece con la grilla.
+CELDAS_STREAMING = 20_000
+
+# Columnas de tiempo que entran en una hoja (la A es la de nombres)
+COLUMNAS_EXCEL = 16_383
+
+COLOR_LLEGADA = "A6A6A6"
+RESUMEN = ("PROMEDIO", "TOTAL CPU")
+
+_THIN = Side(style="thin", color="000000")
+_BORDE = Border(top=_THIN, bottom=_THIN, left=_THIN, right=_THIN)
+_CENTRO = Alignment(horizontal="center", vertical="center")
+
 
 class ExportadorExcel:
+    # =============== Estilos compartidos =================
+    def _registrar_estilos(self, wb: Workbook, op: Optional[dict] = None):
+        """
+        Registra una sola vez los estilos con nombre del libro; las celdas solo
+        guardan la referencia (nada de Border/Alignment nuevos por celda).
+        """
+        op = op or {}
+        color_io = op.get("color_io", "000000")
+        estilos = [
+            NamedStyle("tabla", border=_BORDE, alignment=_CENTRO),
+            NamedStyle("tabla_resumen", border=_BORDE, alignment=_CENTRO, font=Font(bold=True)),
+            NamedStyle("gantt_titulo", alignment=_CENTRO, font=Font(bold=True)),
+            NamedStyle("gantt_nombre", border=Border(right=_THIN), alignment=_CENTRO),
+            NamedStyle("gantt_celda", border=_BORDE, alignment=_CENTRO),
+            NamedStyle("gantt_eje_inicio", border=_BORDE,
+                       alignment=Alignment(horizontal="left", vertical="center")),
+            NamedStyle("gantt_eje", border=_BORDE,
+                       alignment=Alignment(horizontal="right", vertical="center")),
+            NamedStyle("gantt_llegada", border=_BORDE, alignment=_CENTRO,
+                       fill=PatternFill(start_color=COLOR_LLEGADA, end_color=COLOR_LLEGADA, fill_type="solid")),
+            NamedStyle("gantt_io", border=_BORDE, alignment=_CENTRO, font=Font(color="FFFFFF", size=8),
+                       fill=PatternFill(start_color=color_io, end_color=color_io,
+                                        fill_type=op.get("pattern_io", "solid"))),
+        ]
+        for estilo in estilos:
+            wb.add_named_style(estilo)
+
+    def _estilo_cpu(self, wb: Workbook, cache: Dict[str, str], color: str, pattern: str) -> str:
+        """Un estilo con nombre por color de CPU (no por proceso ni por celda)."""
+        nombre = cache.get(color)
+        if nombre is None:
+            nombre = f"gantt_cpu_{len(cache)}"
+            wb.add_named_style(NamedStyle(
+                nombre, border=_BORDE, alignment=_CENTRO, font=Font(bold=True, color="FFFFFF"),
+                fill=PatternFill(start_color=color, end_color=color, fill_type=pattern),
+            ))
+            cache[color] = nombre
+        return nombre
+
     # =============== Utilidades internas para tablas =================
     def _escribir_tabla(self, ws, filas: List[Any]):
         if not filas:
             return
 
-        thin = Side(style="thin", color="000000")
-        border_thin = Border(top=thin, bottom=thin, left=thin, right=thin)
+        for fila in self._filas_tabla(filas):
+            ws.append(fila)
 
-        primera = filas[0]
-        if isinstance(primera, dict):
-            headers = list(primera.keys())
-            ws.append(headers)
-            for fila in filas:
-                ws.append([fila.get(h, "") for h in headers])
-        else:
-            for fila in filas:
-                ws.append(list(fila))
-
-        # Aplicar bordes a todas las celdas con datos
+        # Bordes y alineación en una sola pasada; negrita si es fila de resumen
         for row in ws.iter_rows(
             min_row=1,
             max_row=ws.max_row,
@@ -32,23 +82,47 @@ class ExportadorExcel:
             max_col=ws.max_column
         ):
             for cell in row:
-                cell.border = border_thin
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+                cell.style = self._estilo_tabla(cell.value)
 
-        # Aplicar bordes y alineación
-        for row in ws.iter_rows(
-            min_row=1,
-            max_row=ws.max_row,
-            min_col=1,
-            max_col=ws.max_column
-        ):
-            for cell in row:
-                cell.border = border_thin
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+    def _escribir_tabla_streaming(self, ws, filas: List[Any]):
+        """Igual que _escribir_tabla + _auto_ajustar_ancho, para hojas write_only."""
+        if not filas:
+            return
+        filas = self._filas_tabla(filas)
+        columnas = max(len(f) for f in filas)
+
+        # En write_only los anchos tienen que fijarse antes de la primera fila
+        anchos = [0] * columnas
+        for fila in filas:
+            for j, v in enumerate(fila):
+                if v is not None:
+                    anchos[j] = max(anchos[j], len(str(v)))
+        for j, ancho in enumerate(anchos):
+            ws.column_dimensions[get_column_letter(j + 1)].width = min(ancho + 2, 60)
+
+        for fila in filas:
+            celdas = []
+            for j in range(columnas):
+                v = fila[j] if j < len(fila) else None
+                celdas.append(self._celda(ws, v, self._estilo_tabla(v)))
+            ws.append(celdas)
+
+    def _filas_tabla(self, filas: List[Any]) -> List[list]:
+        primera = filas[0]
+        if isinstance(primera, dict):
+            headers = list(primera.keys())
+            return [headers] + [[fila.get(h, "") for h in headers] for fila in filas]
+        return [list(fila) for fila in filas]
+
+    @staticmethod
+    def _estilo_tabla(valor) -> str:
+        return "tabla_resumen" if str(valor).strip().upper() in RESUMEN else "tabla"
 
-                # Negrita si es fila de resumen
-                if str(cell.value).strip().upper() in ("PROMEDIO", "TOTAL CPU"):
-                    cell.font = Font(bold=True)
+    @staticmethod
+    def _celda(ws, valor, estilo: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=valor)
+        cell.style = estilo
+        return cell
 
     def _auto_ajustar_ancho(self, ws):
         for col in ws.columns:
@@ -68,6 +142,7 @@ class ExportadorExcel:
     def exportar(self, nombre_archivo: str, hojas: List[tuple[str, List[Any]]]):
         wb = Workbook()
         wb.remove(wb.active)
+        self._registrar_estilos(wb)
         for nombre, datos in hojas:
             ws = wb.create_sheet(title=str(nombre)[:31])
             self._escribir_tabla(ws, datos)
@@ -82,42 +157,86 @@ class ExportadorExcel:
         hojas: Optional[List[tuple[str, List[Any]]]] = None,
         procesos: Optional[List[Process]] = None,
         opciones: Optional[dict] = None,
+        streaming: Optional[bool] = None,
     ):
         """
         Crea primero la hoja 'Gantt (grilla)' (activa) y luego las tablas opcionales.
+
+        streaming=None elige solo: las grillas de más de CELDAS_STREAMING celdas
+        se escriben con un Workbook write_only.
+
+        Opciones del eje (siempre en modo streaming):
+        - ticks_por_columna: ticks que agrupa cada columna (por defecto 1, o lo
+          necesario para no pasar el límite de columnas de Excel).
+        - columnas_por_hoja: si hay más columnas, el horizonte se reparte en
+          varias hojas con una hoja índice (por defecto, el límite de Excel).
+        - celdas: "dominante" (estado dominante) o "leyenda" (ticks de CPU y E/S).
         """
-        wb = Workbook()
-        wb.remove(wb.active)
+        op = opciones or {}
+        orden_canvas, cpu, io = self._recorrer_timeline(resultado)
+        tiempo_total = int(as_timeline(resultado.timeline).end_time)
+        ancho, por_hoja, _ = self._eje_comprimido(tiempo_total, op)
+        if ancho > 1 or tiempo_total > por_hoja:
+            streaming = True
+        elif streaming is None:
+            streaming = len(orden_canvas) * tiempo_total > CELDAS_STREAMING
+
+        wb = Workbook(write_only=streaming)
+        if not streaming:
+            wb.remove(wb.active)
+        self._registrar_estilos(wb, op)
 
         # 1) Gantt primero y dejarlo activo
-        ws_gantt = self._crear_hoja_gantt_grilla(wb, resultado, procesos, opciones or {})
+        datos = (orden_canvas, cpu, io if procesos else {}, tiempo_total)
+        if streaming:
+            ws_gantt = self._crear_hojas_gantt_streaming(wb, datos, procesos, op)
+        else:
+            ws_gantt = self._crear_hoja_gantt_grilla(wb, resultado, procesos, op, datos)
         wb.active = wb.worksheets.index(ws_gantt)
 
         # 2) Hojas tabulares
         if hojas:
-            for nombre, datos in hojas:
+            for nombre, filas in hojas:
                 ws = wb.create_sheet(title=str(nombre)[:31])
-                self._escribir_tabla(ws, datos)
-                self._auto_ajustar_ancho(ws)
+                if streaming:
+                    self._escribir_tabla_streaming(ws, filas)
+                else:
+                    self._escribir_tabla(ws, filas)
+                    self._auto_ajustar_ancho(ws)
 
         wb.save(nombre_archivo)
 
     # ------------------- Helpers de Gantt -------------------
+    def _recorrer_timeline(
+        self, resultado: ScheduleResult
+    ) -> Tuple[List[str], Dict[str, List[Tuple[int, int]]], Dict[str, List[Tuple[int, int]]]]:
+        """
+        Una sola pasada por el timeline: orden de aparición (ver
+        _orden_por_aparicion) y tramos de CPU y de E/S por proceso, ordenados.
+        """
+        orden: Dict[str, None] = {}
+        cpu: Dict[str, List[Tuple[int, int]]] = {}
+        io: Dict[str, List[Tuple[int, int]]] = {}
+        for base, kind, start, end in as_timeline(resultado.timeline).rows():
+            orden[base] = None
+            (io if kind == SLICE_BLOCK else cpu).setdefault(base, []).append((int(start), int(end)))
+        # fallback: por métricas
+        for pid in resultado.turnaround.keys():
+            orden.setdefault(pid)
+        for segs in cpu.values():
+            segs.sort()
+        return list(orden), cpu, io
+
     def _orden_por_aparicion(self, resultado: ScheduleResult):
         """
         Orden base: por primera aparición en el timeline.
         Este orden lo usa el canvas para dibujar *de abajo hacia arriba*.
         """
-        orden = []
-        for sl in resultado.timeline:
-            base = sl.process.replace("_BLOCK", "")
-            if base not in orden:
-                orden.append(base)
+        orden = dict.fromkeys(base for base, _, _, _ in as_timeline(resultado.timeline).rows())
         # fallback: por métricas
-        for pid in list(resultado.turnaround.keys()):
-            if pid not in orden:
-                orden.append(pid)
-        return orden
+        for pid in resultado.turnaround.keys():
+            orden.setdefault(pid)
+        return list(orden)
 
     def _paleta(self):
         # hex sin '#'
@@ -127,22 +246,21 @@ class ExportadorExcel:
             "255E91", "43682B",
         ]
 
-    def _io_intervals_precisos(
-        self, resultado: ScheduleResult, procesos: List[Process]
-    ) -> Dict[str, List[Tuple[int, int]]]:
-        """
-        Reconstrucción de E/S desde timeline:
-        - Un ExecSlice con process terminando en "_BLOCK" representa un bloqueo.
-        """
-        io: Dict[str, List[Tuple[int, int]]] = {}
-        for sl in resultado.timeline:
-            if sl.process.endswith("_BLOCK"):
-                base = sl.process.replace("_BLOCK", "")
-                io.setdefault(base, []).append((int(sl.start), int(sl.end)))
-        return io
+    def _colores_y_llegadas(self, orden_canvas: List[str], procesos: Optional[List[Process]], op: dict):
+        # mapping de colores (copia: no se toca el dict de quien llama)
+        paleta = self._paleta()
+        colores: Dict[str, str] = dict(op.get("color_cpu_por_pid", {}))
+        for i, pid in enumerate(orden_canvas):
+            colores.setdefault(pid, paleta[i % len(paleta)])
+        # Llegada por nombre (el primero gana, como antes con next())
+        llegadas: Dict[str, int] = {}
+        for p in procesos or ():
+            llegadas.setdefault(p.name, p.arrival)
+        return colores, llegadas
 
     def _crear_hoja_gantt_grilla(
-        self, wb: Workbook, resultado: ScheduleResult, procesos: Optional[List[Process]], op: dict
+        self, wb: Workbook, resultado: ScheduleResult, procesos: Optional[List[Process]], op: dict,
+        datos: Optional[tuple] = None
     ):
         """
         Dibuja la grilla con el mismo orden visual que el canvas.
@@ -150,37 +268,28 @@ class ExportadorExcel:
         ws = wb.create_sheet(title="Gantt (grilla)")
 
         # Config
-        tiempo_total = int(max((sl.end for sl in resultado.timeline), default=0))
+        if datos is None:
+            orden_canvas, segs_por_pid, io_por_pid = self._recorrer_timeline(resultado)
+            io_por_pid = io_por_pid if procesos else {}
+            tiempo_total = int(as_timeline(resultado.timeline).end_time)
+        else:
+            orden_canvas, segs_por_pid, io_por_pid, tiempo_total = datos
 
         # === Orden igual al canvas ===
-        orden_canvas = self._orden_por_aparicion(resultado)  # bottom-up en canvas
         orden = list(reversed(orden_canvas))                 # top-down en Excel
 
-        paleta = self._paleta()
-        color_cpu_por_pid: Dict[str, str] = op.get("color_cpu_por_pid", {})
+        color_cpu_por_pid, llegadas = self._colores_y_llegadas(orden_canvas, procesos, op)
         pattern_cpu = op.get("pattern_cpu", "solid")
-        color_io = op.get("color_io", "000000")
-        pattern_io = op.get("pattern_io", "solid")
-        fuente_cpu = Font(bold=True, color="FFFFFF")
-        fuente_io = Font(color="FFFFFF", size=8)
-
-        # mapping de colores
-        for i, pid in enumerate(orden_canvas):
-            color_cpu_por_pid.setdefault(pid, paleta[i % len(paleta)])
+        estilos_cpu: Dict[str, str] = {}
 
         # Encabezado
         ws["A1"] = "Proceso"
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        ws["A1"].font = Font(bold=True)
+        ws["A1"].style = "gantt_titulo"
 
         primera_fila_barras = 2
         ultima_fila_barras = primera_fila_barras + len(orden) - 1
         fila_tiempo = max(primera_fila_barras, ultima_fila_barras) + 1
 
-        # Estilos
-        thin = Side(style="thin", color="000000")
-        border_thin = Border(top=thin, bottom=thin, left=thin, right=thin)
-
         # Anchos/altos
         ws.column_dimensions["A"].width = 12
         max_digits = len(str(tiempo_total))
@@ -188,107 +297,34 @@ class ExportadorExcel:
         for t in range(tiempo_total):
             ws.column_dimensions[get_column_letter(2 + t)].width = col_width
 
-        # Segmentos CPU ordenados
-        segs_por_pid: Dict[str, List[Tuple[int, int]]] = {}
-        for sl in resultado.timeline:
-            if not sl.process.endswith("_BLOCK"):
-                segs_por_pid.setdefault(sl.process, []).append((int(sl.start), int(sl.end)))
-        for pid in segs_por_pid:
-            segs_por_pid[pid].sort()
-
-        # E/S
-        io_por_pid = self._io_intervals_precisos(resultado, procesos) if procesos else {}
-
-        # Llenar grilla vacía con bordes
+        # Grilla vacía con bordes y columna A (borde derecho)
         for r in range(primera_fila_barras, fila_tiempo + 1):
+            ws.cell(row=r, column=1).style = "gantt_nombre"
             for c in range(2, 2 + tiempo_total):
-                cell = ws.cell(row=r, column=c)
-                cell.border = border_thin
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+                ws.cell(row=r, column=c).style = "gantt_celda"
 
         # --- Eje de tiempo ---
-        if tiempo_total >= 0:
-            c0 = 2
-            cell0 = ws.cell(row=fila_tiempo, column=c0, value=0)
-            cell0.alignment = Alignment(horizontal="left", vertical="center")
-            cell0.border = border_thin
-        for t in range(1, tiempo_total + 1):
-            col = 2 + (t - 1)   # última columna será 2 + tiempo_total - 1
-            cell = ws.cell(row=fila_tiempo, column=col, value=t)
-            cell.alignment = Alignment(horizontal="right", vertical="center")
-            cell.border = border_thin
-
-        # Borde derecho columna A
-        for r in range(primera_fila_barras, fila_tiempo + 1):
-            ca = ws.cell(row=r, column=1)
-            ca.border = Border(right=thin)
-            ca.alignment = Alignment(horizontal="center", vertical="center")
-
-        def _merge_segments(segments):
-            """Une segmentos contiguos o solapados en una sola tupla (ini, fin)."""
-            if not segments:
-                return []
-            segments = sorted(segments, key=lambda x: x[0])
-            merged = [segments[0]]
-            for ini, fin in segments[1:]:
-                last_ini, last_fin = merged[-1]
-                if ini <= last_fin:  # contiguo o solapado
-                    merged[-1] = (last_ini, max(last_fin, fin))
-                else:
-                    merged.append((ini, fin))
-            return merged
+        for col, valor, estilo in self._eje(tiempo_total):
+            cell = ws.cell(row=fila_tiempo, column=col, value=valor)
+            cell.style = estilo
 
         # Pintar barras
         for idx, pid in enumerate(orden):
             fila = primera_fila_barras + idx
-            ws.cell(row=fila, column=1, value=pid).alignment = Alignment(horizontal="center", vertical="center")
-
-            # CPU
-            color_cpu = color_cpu_por_pid.get(pid, paleta[orden_canvas.index(pid) % len(paleta)])
-            fill_cpu = PatternFill(start_color=color_cpu, end_color=color_cpu, fill_type=pattern_cpu)
+            ws.cell(row=fila, column=1, value=pid)
 
-            # Unir segmentos contiguos antes de pintarlos
-            for (ini, fin) in _merge_segments(segs_por_pid.get(pid, [])):
-                if fin <= ini:
-                    continue
-                c1 = 2 + ini
-                c2 = 2 + fin - 1
-                ws.merge_cells(start_row=fila, start_column=c1, end_row=fila, end_column=c2)
-                cell = ws.cell(row=fila, column=c1, value=pid)
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-                cell.font = fuente_cpu
-                cell.fill = fill_cpu
-                for c in range(c1, c2 + 1):
-                    ws.cell(row=fila, column=c).border = border_thin
-
-            
-                        # Arrival (sombra gris antes de que llegue el proceso)
-            if procesos:
-                proc = next((p for p in procesos if p.name == pid), None)
-                if proc and proc.arrival > 0:
-                    fill_arrival = PatternFill(start_color="A6A6A6", end_color="A6A6A6", fill_type="solid")
-                    for t in range(proc.arrival):
-                        col = 2 + t
-                        cell = ws.cell(row=fila, column=col)
-                        cell.fill = fill_arrival
-                        cell.border = border_thin
+            # CPU (los segmentos llegan ya unidos desde el planificador)
+            estilo_cpu = self._estilo_cpu(wb, estilos_cpu, color_cpu_por_pid[pid], pattern_cpu)
+            for (ini, fin) in segs_por_pid.get(pid, []):
+                self._pintar_tramo(ws, fila, ini, fin, pid, estilo_cpu)
 
+            # Arrival (sombra gris antes de que llegue el proceso)
+            for t in range(llegadas.get(pid, 0)):
+                ws.cell(row=fila, column=2 + t).style = "gantt_llegada"
 
             # I/O
-            if pid in io_por_pid:
-                fill_io = PatternFill(start_color=color_io, end_color=color_io, fill_type=pattern_io)
-                for (ini, fin) in io_por_pid[pid]:
-                    if fin <= ini:
-                        continue
-                    c1 = 2 + ini
-                    c2 = 2 + fin - 1
-                    ws.merge_cells(start_row=fila, start_column=c1, end_row=fila, end_column=c2)
-                    cell = ws.cell(row=fila, column=c1, value="IO")
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
-                    cell.font = fuente_io
-                    cell.fill = fill_io
-                    for c in range(c1, c2 + 1):
-                        ws.cell(row=fila, column=c).border = border_thin
+            for (ini, fin) in io_por_pid.get(pid, []):
+                self._pintar_tramo(ws, fila, ini, fin, "IO", "gantt_io")
 
         # Alturas
         ws.row_dimensions[1].height = 18
@@ -296,3 +332,211 @@ class ExportadorExcel:
             ws.row_dimensions[r].height = 18
 
         return ws
+
+    def _pintar_tramo(self, ws, fila: int, ini: int, fin: int, valor: str, estilo: str):
+        if fin <= ini:
+            return
+        c1 = 2 + ini
+        c2 = 2 + fin - 1
+        ws.merge_cells(start_row=fila, start_column=c1, end_row=fila, end_column=c2)
+        ws.cell(row=fila, column=c1, value=valor).style = estilo
+        for c in range(c1 + 1, c2 + 1):
+            ws.cell(row=fila, column=c).style = estilo
+
+    @staticmethod
+    def _eje(tiempo_total: int):
+        """(columna, valor, estilo) del eje de tiempo: el tick t va en la columna del tramo [t-1, t)."""
+        if tiempo_total == 0:
+            return [(2, 0, "gantt_eje_inicio")]
+        return [(1 + t, t, "gantt_eje") for t in range(1, tiempo_total + 1)]
+
+    def _crear_hojas_gantt_streaming(self, wb: Workbook, datos: tuple, procesos: Optional[List[Process]], op: dict):
+        """
+        Misma hoja que _crear_hoja_gantt_grilla, escrita fila por fila en un
+        Workbook write_only. Solo se escriben las celdas con contenido (nombre,
+        inicio de cada tramo, eje); los bordes de la grilla y la sombra de
+        llegada se aplican con formato condicional sobre rangos, así la
+        cantidad de celdas no depende de procesos × ticks.
+
+        Con 'ticks_por_columna' > 1 cada columna agrupa varios ticks (ver
+        _tramos_agrupados) y si las columnas superan 'columnas_por_hoja' el
+        horizonte se reparte en hojas "Gantt 1", "Gantt 2"... precedidas por
+        una hoja índice. Devuelve la hoja que queda activa.
+        """
+        orden_canvas, segs_por_pid, io_por_pid, tiempo_total = datos
+        orden = list(reversed(orden_canvas))                 # top-down en Excel
+        ancho, por_hoja, leyenda = self._eje_comprimido(tiempo_total, op)
+        columnas = -(-tiempo_total // ancho)
+
+        color_cpu_por_pid, llegadas = self._colores_y_llegadas(orden_canvas, procesos, op)
+        pattern_cpu = op.get("pattern_cpu", "solid")
+        estilos_cpu: Dict[str, str] = {}
+
+        # Tramos de cada fila en unidades de columna (sin recortar por hoja)
+        filas = []
+        for pid in orden:
+            estilo_cpu = self._estilo_cpu(wb, estilos_cpu, color_cpu_por_pid[pid], pattern_cpu)
+            cpu, io = segs_por_pid.get(pid, []), io_por_pid.get(pid, [])
+            llegada = min(llegadas.get(pid, 0), tiempo_total)
+            if ancho == 1:
+                tramos = [(ini, fin, pid, estilo_cpu) for ini, fin in cpu if fin > ini]
+                tramos += [(ini, fin, "IO", "gantt_io") for ini, fin in io if fin > ini]
+                tramos.sort()
+                sombra = llegada
+            else:
+                tramos, sombra = self._tramos_agrupados(cpu, io, llegada, ancho, leyenda, pid, estilo_cpu)
+            filas.append((pid, tramos, min(sombra, columnas)))
+
+        col_width = max(3, len(str(tiempo_total)) + 1)
+        if leyenda:
+            col_width = max(col_width, 2 * len(str(ancho)) + 4)
+
+        if columnas <= por_hoja:
+            ws = wb.create_sheet(title="Gantt (grilla)")
+            self._hoja_gantt_streaming(ws, filas, 0, columnas, ancho, tiempo_total, col_width)
+            return ws
+
+        indice = wb.create_sheet(title="Gantt (índice)")
+        hojas = []
+        siguiente = [0] * len(filas)    # primer tramo pendiente de cada fila
+        for n, desde in enumerate(range(0, columnas, por_hoja), start=1):
+            hasta = min(desde + por_hoja, columnas)
+            ws = wb.create_sheet(title=f"Gantt {n}")
+            self._hoja_gantt_streaming(ws, filas, desde, hasta, ancho, tiempo_total, col_width, siguiente)
+            hojas.append((ws.title, desde * ancho, min(hasta * ancho, tiempo_total)))
+        self._escribir_indice(indice, hojas, ancho, leyenda)
+        return indice
+
+    @staticmethod
+    def _eje_comprimido(tiempo_total: int, op: dict) -> Tuple[int, int, bool]:
+        """(ticks por columna, columnas por hoja, celdas con leyenda) según las opciones."""
+        por_hoja = op.get("columnas_por_hoja") or COLUMNAS_EXCEL
+        if not isinstance(por_hoja, int) or not 1 <= por_hoja <= COLUMNAS_EXCEL:
+            raise ValueError(f"columnas_por_hoja debe ser un entero entre 1 y {COLUMNAS_EXCEL}.")
+        ancho = op.get("ticks_por_columna")
+        if ancho is None:
+            # Sin indicación: lo justo para que el horizonte entre en una hoja
+            ancho = max(1, -(-tiempo_total // COLUMNAS_EXCEL))
+        if not isinstance(ancho, int) or ancho < 1:
+            raise ValueError("ticks_por_columna debe ser un entero positivo.")
+        celdas = op.get("celdas", "dominante")
+        if celdas not in ("dominante", "leyenda"):
+            raise ValueError(f"Modo de celdas desconocido: {celdas} (dominante, leyenda).")
+        return ancho, por_hoja, celdas == "leyenda" and ancho > 1
+
+    @staticmethod
+    def _tramos_agrupados(cpu, io, llegada: int, ancho: int, leyenda: bool, pid: str, estilo_cpu: str):
+        """
+        Tramos de una fila cuando cada columna agrupa 'ancho' ticks.
+
+        El estado de la columna es el dominante entre CPU y E/S (a igualdad,
+        CPU); la sombra de llegada solo cubre columnas sin CPU ni E/S. Sin
+        leyenda, las columnas seguidas con el mismo estado se unen en un tramo
+        como en la grilla de un tick por columna; con leyenda cada columna
+        muestra los ticks de cada estado ("C3 E2").
+        """
+        cuenta: Dict[int, List[int]] = {}
+        for k, segs in ((0, cpu), (1, io)):
+            for ini, fin in segs:
+                while ini < fin:
+                    col = ini // ancho
+                    hasta = min(fin, (col + 1) * ancho)
+                    cuenta.setdefault(col, [0, 0])[k] += hasta - ini
+                    ini = hasta
+
+        tramos = []
+        for col in sorted(cuenta):
+            c, e = cuenta[col]
+            estilo = estilo_cpu if c >= e else "gantt_io"
+            if leyenda:
+                valor = " ".join(f"{letra}{v}" for letra, v in (("C", c), ("E", e)) if v)
+            else:
+                valor = pid if c >= e else "IO"
+                if tramos and tramos[-1][1] == col and tramos[-1][3] == estilo:
+                    tramos[-1] = (tramos[-1][0], col + 1, valor, estilo)
+                    continue
+            tramos.append((col, col + 1, valor, estilo))
+
+        sombra = llegada // ancho
+        if llegada % ancho and sombra not in cuenta:
+            sombra += 1
+        return tramos, sombra
+
+    def _hoja_gantt_streaming(self, ws, filas: list, desde: int, hasta: int, ancho: int, tiempo_total: int,
+                              col_width: int, siguiente: Optional[List[int]] = None):
+        """Escribe las columnas [desde, hasta) de la grilla; 'siguiente' avanza entre hojas sucesivas."""
+        if siguiente is None:
+            siguiente = [0] * len(filas)
+        primera_fila_barras = 2
+        fila_tiempo = max(primera_fila_barras, primera_fila_barras + len(filas) - 1) + 1
+        columnas = hasta - desde
+        ultima_col = get_column_letter(1 + max(columnas, 1))
+
+        # Anchos/altos: en write_only van antes de escribir filas
+        ws.column_dimensions["A"].width = 12
+        if columnas:
+            ws.column_dimensions["B"] = ColumnDimension(ws, index="B", min=2, max=1 + columnas, width=col_width)
+        for r in range(1, fila_tiempo + 1):
+            ws.row_dimensions[r].height = 18
+
+        # Bordes de toda la grilla y sombra de llegada: una regla por rango,
+        # las filas con la misma llegada comparten regla
+        ws.conditional_formatting.add(
+            f"B{primera_fila_barras}:{ultima_col}{fila_tiempo}",
+            FormulaRule(formula=["TRUE"], border=_BORDE)
+        )
+        filas_por_sombra: Dict[int, List[int]] = {}
+        for idx, (_, _, sombra) in enumerate(filas):
+            sombra = min(sombra, hasta) - desde
+            if sombra > 0:
+                filas_por_sombra.setdefault(sombra, []).append(primera_fila_barras + idx)
+        fill_llegada = PatternFill(start_color=COLOR_LLEGADA, end_color=COLOR_LLEGADA, fill_type="solid")
+        for sombra, rows in filas_por_sombra.items():
+            col = get_column_letter(1 + sombra)
+            ws.conditional_formatting.add(
+                " ".join(f"B{r}:{col}{r}" for r in rows),
+                FormulaRule(formula=["TRUE"], fill=fill_llegada)
+            )
+
+        ws.append([self._celda(ws, "Proceso", "gantt_titulo")])
+
+        # Filas dispersas: None en las columnas sin contenido (write_only las omite)
+        for idx, (pid, tramos, _) in enumerate(filas):
+            fila = primera_fila_barras + idx
+            celdas: List[Any] = [self._celda(ws, pid, "gantt_nombre")]
+            i = siguiente[idx]
+            while i < len(tramos) and tramos[i][1] <= desde:
+                i += 1
+            siguiente[idx] = i
+            while i < len(tramos) and tramos[i][0] < hasta:
+                ini, fin, valor, estilo = tramos[i]
+                ini, fin = max(ini, desde) - desde, min(fin, hasta) - desde
+                celdas.extend([None] * (1 + ini - len(celdas)))
+                celdas.append(self._celda(ws, valor, estilo))
+                if fin - ini > 1:
+                    ws.merged_cells.ranges.add(CellRange(min_col=2 + ini, min_row=fila, max_col=1 + fin, max_row=fila))
+                i += 1
+            ws.append(celdas)
+
+        # Eje: cada columna se rotula con el tick en que termina
+        eje: List[Any] = [self._celda(ws, None, "gantt_nombre")]
+        if tiempo_total == 0:
+            eje.append(self._celda(ws, 0, "gantt_eje_inicio"))
+        for col in range(desde, hasta):
+            eje.append(self._celda(ws, min((col + 1) * ancho, tiempo_total), "gantt_eje"))
+        ws.append(eje)
+
+    def _escribir_indice(self, ws, hojas: List[Tuple[str, int, int]], ancho: int, leyenda: bool):
+        ws.column_dimensions["A"].width = 14
+        for letra in "BCD":
+            ws.column_dimensions[letra].width = 18
+        ws.append([self._celda(ws, h, "tabla_resumen") for h in ("Hoja", "Desde", "Hasta", "Ticks por columna")])
+        for titulo, t0, t1 in hojas:
+            enlace = self._celda(ws, titulo, "tabla")
+            enlace.hyperlink = Hyperlink(ref="", location=f"'{titulo}'!A1")
+            ws.append([enlace] + [self._celda(ws, v, "tabla") for v in (t0, t1, ancho)])
+        ws.append([])
+        if ancho > 1:
+            nota = ("Cada celda muestra los ticks de CPU (C) y de E/S (E) de la columna."
+                    if leyenda else "Cada celda muestra el estado dominante (CPU o E/S) de los ticks que agrupa.")
+            ws.append([nota])
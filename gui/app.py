@@ -2,15 +2,21 @@ import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
 from .controls import ControlsFrame
 from .process_table import ProcessTable
-from .gantt_chart import GanttChart
+from .gantt_chart import GanttChart, GanttData, load_matplotlib
 from .results_table import ResultsTable
-from ..core.models import Process
+from .worker import ScheduleJob
+from . import startup
 from ..core.scheduler_factory import SchedulerFactory
 import os
+import threading
+
+JOB_POLL_MS = 50   # cada cuánto se consulta el avance de Calcular
+
 
 class SchedulerApp(ctk.CTk):
     def __init__(self):
-        super().__init__()
+        with startup.phase("ventana (Tk)"):
+            super().__init__()
         self.title("Chronomind")
 
         screen_width = self.winfo_screenwidth()
@@ -33,31 +39,85 @@ class SchedulerApp(ctk.CTk):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=1)
 
-        self.controls = ControlsFrame(
-            self,
-            algorithms=SchedulerFactory.list_algorithms(),
-            on_calculate=self.on_calculate,
-            on_reset=self.on_reset,
-            app=self
-        )
-        self.controls.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
+        with startup.phase("ControlsFrame"):
+            self.controls = ControlsFrame(
+                self,
+                algorithms=SchedulerFactory.list_algorithms(),
+                on_calculate=self.on_calculate,
+                on_reset=self.on_reset,
+                app=self,
+                on_cancel=self.on_cancel
+            )
+            self.controls.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
 
         tables_frame = ctk.CTkFrame(self)
         tables_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
         tables_frame.grid_columnconfigure(0, weight=1)
         tables_frame.grid_columnconfigure(1, weight=1)
 
-        self.table = ProcessTable(tables_frame, initial_rows=6)
-        self.table.grid(row=0, column=0, sticky="nsew", padx=(0, 5), pady=5)
+        with startup.phase("ProcessTable"):
+            self.table = ProcessTable(tables_frame, initial_rows=6)
+            self.table.grid(row=0, column=0, sticky="nsew", padx=(0, 5), pady=5)
+
+        with startup.phase("ResultsTable"):
+            self.results = ResultsTable(tables_frame)
+            self.results.grid(row=0, column=1, sticky="nsew", padx=(5, 0), pady=5)
+
+        with startup.phase("GanttChart"):
+            self.gantt = GanttChart(self)
+            self.gantt.grid(row=2, column=0, sticky="nsew", padx=10, pady=(5, 10))
+
+        # Corrida de Calcular en curso (ver on_calculate)
+        self._job = None
+        self._job_seq = 0
+
+        # matplotlib, openpyxl y las estrategias se cargan tras el primer pintado
+        self._preload_thread = None
+        self._first_paint = False
+        self.bind("<Map>", self._on_first_map, add="+")
 
-        self.results = ResultsTable(tables_frame)
-        self.results.grid(row=0, column=1, sticky="nsew", padx=(5, 0), pady=5)
+    def _on_first_map(self, event):
+        if event.widget is not self or self._first_paint:
+            return
+        self._first_paint = True
+        self.after_idle(self._start_preload)
+
+    def _start_preload(self):
+        startup.mark("primer pintado")
+        self._preload_thread = threading.Thread(target=self._preload, name="preload", daemon=True)
+        self._preload_thread.start()
+        self.after(50, self._poll_preload)
+
+    @staticmethod
+    def _preload():
+        # Solo importes: Tk no se toca fuera del hilo principal
+        with startup.phase("precarga: matplotlib"):
+            load_matplotlib()
+        with startup.phase("precarga: estrategias"):
+            SchedulerFactory.preload()
+        with startup.phase("precarga: exportador Excel"):
+            try:
+                from ..exportacion import exportador_excel  # noqa: F401
+            except ImportError:
+                pass  # falta openpyxl: el error se informa al exportar
 
-        self.gantt = GanttChart(self)
-        self.gantt.grid(row=2, column=0, sticky="nsew", padx=10, pady=(5, 10))
+    def _poll_preload(self):
+        if self._preload_thread.is_alive():
+            self.after(50, self._poll_preload)
+            return
+        with startup.phase("figura del Gantt"):
+            self.gantt.ensure_canvas()
+        profiler = startup.active()
+        if profiler is not None:
+            profiler.mark("precarga completa")
+            profiler.report()
+            startup.disable()
 
     def show_fullscreen_gantt(self):
-        if not self.gantt._timeline:
+        # Los tramos, colores y límites ya preparados para el gráfico principal:
+        # la pantalla completa los dibuja tal cual, sin releer la tabla
+        data = self.gantt.data
+        if data is None:
             CTkMessagebox(title="Aviso", message="Primero debes calcular el gráfico.", icon="info")
             return
 
@@ -70,24 +130,10 @@ class SchedulerApp(ctk.CTk):
         gantt_container = ctk.CTkFrame(fullscreen_win)
         gantt_container.pack(fill="both", expand=True)
 
+        # Al cerrar la ventana, GanttChart.destroy libera su figura y su canvas
         gantt_full = GanttChart(gantt_container)
         gantt_full.pack(fill="both", expand=True)
-
-        processes = []
-        for row in self.table.get_data():
-            try:
-                processes.append(Process(
-                    name=row["name"].strip(),
-                    arrival=int(row["arrival"]),
-                    burst=int(row["burst"]),
-                    pattern=row["pattern"]
-                ))
-            except Exception:
-                continue
-
-        color_map = {row["name"]: row["color"] for row in self.table.get_data()}
-        gantt_full.set_colors(color_map)
-        gantt_full.draw(processes, self.gantt._timeline)
+        gantt_full.draw(data.processes, data.timeline, data)
 
         close_btn = ctk.CTkButton(fullscreen_win, text="Cerrar", command=fullscreen_win.destroy)
         close_btn.place(relx=0.98, rely=0.02, anchor="ne")
@@ -97,42 +143,18 @@ class SchedulerApp(ctk.CTk):
         fullscreen_win.grab_set()
 
     def on_reset(self):
+        self.on_cancel()
         self.table.reset()
         self.gantt.clear()
         self.results.clear()
 
     def on_calculate(self):
-        data = self.table.get_data()
-        processes = []
-
-        for row in data:
-            name = (row["name"] or "").strip()
-            if not name:
-                CTkMessagebox(title="Error", message="Hay procesos sin nombre.", icon="cancel")
-                return
-            try:
-                arrival = int(row["arrival"])
-            except ValueError:
-                CTkMessagebox(title="Error", message=f"Llegada inválida en {name}.", icon="cancel")
-                return
-
-            pattern = row["pattern"]
-            burst = int(row["burst"]) if row["burst"].isdigit() else 0
-
-            if pattern is None or burst <= 0:
-                CTkMessagebox(
-                    title="Error",
-                    message=f"Patrón inválido o vacío en {name}. Escribe algo como: 3,(2),4 o 5.",
-                    icon="cancel"
-                )
-                return
-
-            processes.append(Process(
-                name=name,
-                arrival=arrival,
-                burst=burst,
-                pattern=pattern
-            ))
+        # Directo del modelo de la tabla: lo importado ya son Process
+        try:
+            processes = self.table.get_processes()
+        except ValueError as ex:
+            CTkMessagebox(title="Error", message=str(ex), icon="cancel")
+            return
 
         def normalize_color(c: str) -> str:
             # Quitar "#", asegurar ARGB
@@ -149,20 +171,19 @@ class SchedulerApp(ctk.CTk):
         # Mapa para Excel (usa FFRRGGBB)
         excel_colors = {}
 
-        for row in data:
-            raw = row["color"]
+        for name, raw in self.table.get_colors().items():
             if raw.startswith("#"):
                 hexval = raw[1:]
             else:
                 hexval = raw
 
             if len(hexval) == 6:
-                gantt_colors[row["name"]] = "#" + hexval.upper()
-                excel_colors[row["name"]] = "FF" + hexval.upper()
+                gantt_colors[name] = "#" + hexval.upper()
+                excel_colors[name] = "FF" + hexval.upper()
             else:
                 # fallback
-                gantt_colors[row["name"]] = "#1F77B4"
-                excel_colors[row["name"]] = "FF1F77B4"
+                gantt_colors[name] = "#1F77B4"
+                excel_colors[name] = "FF1F77B4"
 
         # Colores para el gráfico
         self.gantt.set_colors(gantt_colors)
@@ -176,28 +197,50 @@ class SchedulerApp(ctk.CTk):
         if algo == "Round Robin" and (quantum is None or quantum <= 0):
             return
 
-        strategy = SchedulerFactory.create(algo)
-        try:
-            result = strategy.schedule(processes, quantum=quantum)
-
-            # --- AÑADIR: guardar último resultado y procesos para exportación ---
-            self._last_schedule_result = result
-            self._last_processes = processes
-
-            def orden_cpu(timeline):
-                seq = []
-                for sl in timeline:
-                    if sl.process.endswith("_BLOCK"):
-                        continue
-                    if not seq or seq[-1] != sl.process:
-                        seq.append(sl.process)
-                return seq
-
-            print("Orden de ejecución (sin bloques):", " > ".join(orden_cpu(result.timeline)))
+        # Planificación y preparación del Gantt en otro hilo; la ventana sigue
+        # respondiendo y un nuevo Calcular deja obsoleta la corrida anterior
+        self.on_cancel()
+        self._job_seq += 1
+        self._job = ScheduleJob(
+            self._job_seq, algo, processes, quantum,
+            prepare=lambda result: self._prepare_result(processes, result, gantt_colors)
+        ).start()
+        self.controls.show_progress("Planificando…", 0.0)
+        self.after(JOB_POLL_MS, self._poll_job, self._job)
+
+    @staticmethod
+    def _prepare_result(processes, result, colors) -> GanttData:
+        # En el hilo de la corrida: nada de Tk
+        load_matplotlib()
+        return GanttData(processes, result.timeline, colors)
+
+    def on_cancel(self):
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+            self.controls.hide_progress()
+
+    def _poll_job(self, job: ScheduleJob):
+        if job is not self._job:
+            return  # cancelada o reemplazada por otra más nueva
+        if job.is_alive():
+            planning = job.phase == "Planificando"
+            self.controls.show_progress(f"{job.phase}…", job.fraction if planning else None)
+            self.after(JOB_POLL_MS, self._poll_job, job)
+            return
 
-        except Exception as ex:
-            CTkMessagebox(title="Error", message=str(ex), icon="cancel")
+        self._job = None
+        self.controls.hide_progress()
+        if job.error is not None:
+            CTkMessagebox(title="Error", message=str(job.error), icon="cancel")
             return
+        if job.result is None:
+            return
+
+        result = job.result
+        # --- AÑADIR: guardar último resultado y procesos para exportación ---
+        self._last_schedule_result = result
+        self._last_processes = job.processes
 
-        self.gantt.draw(processes, result.timeline)
-        self.results.update(processes, result.turnaround, result.waiting, result.avg_turnaround, result.avg_waiting)
+        self.gantt.draw(job.processes, result.timeline, job.prepared)
+        self.results.update(job.processes, result.turnaround, result.waiting, result.avg_turnaround, result.avg_waiting)
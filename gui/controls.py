@@ -2,15 +2,22 @@
 from CTkMessagebox import CTkMessagebox
 import customtkinter as ctk
 import string
-import random
 import os
-from ..exportacion.exportador_excel import ExportadorExcel
+from typing import Optional
+from ..core.generator import GeneratorConfig, WorkloadGenerator
+from ..core.models import format_pattern
+
+def _rounded(value: Optional[float]):
+    # Sin procesos los promedios son None
+    return "" if value is None else round(value, 2)
+
 
 class ControlsFrame(ctk.CTkFrame):
-    def __init__(self, master, algorithms, on_calculate, on_reset, app):
+    def __init__(self, master, algorithms, on_calculate, on_reset, app, on_cancel=None):
         super().__init__(master)
         self.on_calculate = on_calculate
         self.on_reset = on_reset
+        self.on_cancel = on_cancel
         self.app = app
 
         self.grid_columnconfigure(6, weight=1)
@@ -37,6 +44,19 @@ class ControlsFrame(ctk.CTkFrame):
         self.count_box.set("6")
         self.count_box.grid(row=0, column=5, padx=5, pady=5, sticky="w")
 
+        # Avance de Calcular: visible solo mientras la corrida está en curso
+        self.progress_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.progress_frame.grid(row=0, column=6, padx=5, pady=5, sticky="ew")
+        self.progress_frame.grid_columnconfigure(1, weight=1)
+        self.progress_label = ctk.CTkLabel(self.progress_frame, text="")
+        self.progress_label.grid(row=0, column=0, padx=(0, 5), sticky="w")
+        self.progress_bar = ctk.CTkProgressBar(self.progress_frame, width=120)
+        self.progress_bar.grid(row=0, column=1, sticky="ew")
+        self.cancel_btn = ctk.CTkButton(self.progress_frame, text="Cancelar", width=80, fg_color="gray",
+                                        command=self._on_cancel)
+        self.cancel_btn.grid(row=0, column=2, padx=(5, 0))
+        self.progress_frame.grid_remove()
+
         # Botones
         self.calc_btn = ctk.CTkButton(self, text="Calcular", command=self.on_calculate)
         self.calc_btn.grid(row=0, column=7, padx=5, pady=5)
@@ -53,7 +73,7 @@ class ControlsFrame(ctk.CTkFrame):
     def _show_actions_menu(self):
         popup = ctk.CTkToplevel(self)
         popup.title("Acciones")
-        popup.geometry("260x165")
+        popup.geometry("260x205")
         popup.resizable(False, False)
         popup.transient(self)
         popup.grab_set()
@@ -93,6 +113,8 @@ class ControlsFrame(ctk.CTkFrame):
                       command=_action_then_close(self._rename_processes)).pack(pady=5)
         ctk.CTkButton(popup, text="Randomizar tiempos y patrones",
                       command=_action_then_close(self._randomize_processes)).pack(pady=5)
+        ctk.CTkButton(popup, text="Importar procesos (CSV/JSON)",
+                      command=_action_then_close(self._import_processes)).pack(pady=5)
         ctk.CTkButton(popup, text="Exportar a Excel", command=_action_then_close(self._export_excel)).pack(pady=5)
 
         try:
@@ -103,21 +125,44 @@ class ControlsFrame(ctk.CTkFrame):
 
     def _rename_processes(self):
         if hasattr(self.master, "table"):
-            for i, (name_entry, *_rest) in enumerate(self.master.table.rows):
-                name_entry.delete(0, "end")
-                name_entry.insert(0, string.ascii_uppercase[i % 26])
+            table = self.master.table
+            for i in range(table.row_count()):
+                table.set_row(i, name=string.ascii_uppercase[i % 26])
+            table.refresh()
 
     def _randomize_processes(self):
         if hasattr(self.master, "table"):
-            for (_name, arrival_frame, pattern_entry, *_rest) in self.master.table.rows:
-                arrival_frame.entry.delete(0, "end")
-                arrival_frame.entry.insert(0, str(random.randint(0, 5)))
-                a = random.randint(1, 5)
-                b = random.randint(0, 3)
-                c = random.randint(1, 5)
-                pattern = f"{a},({b}),{c}" if b > 0 else f"{a},{c}"
-                pattern_entry.delete(0, "end")
-                pattern_entry.insert(0, pattern)
+            table = self.master.table
+            # Llegadas cercanas y ráfagas cortas, con hasta un bloqueo, para una tabla legible
+            # (con tan pocas filas no vale la pena importar NumPy)
+            config = GeneratorConfig(rate=4.0, cpu_mean=3.0, io_mean=2.0, max_phases=2, max_duration=5)
+            procs = WorkloadGenerator(config, backend="python").generate(table.row_count())
+            for i, proc in enumerate(procs):
+                table.set_row(i, arrival=str(proc.arrival), pattern_raw=format_pattern(proc.pattern))
+            table.refresh()
+
+    def _import_processes(self):
+        """Carga la tabla desde un CSV/JSON/JSONL (mismo formato que la línea de comandos)."""
+        if not hasattr(self.master, "table"):
+            return
+        from tkinter import filedialog
+        ruta = filedialog.askopenfilename(
+            filetypes=[("Cargas de procesos", "*.csv *.json *.jsonl *.ndjson"), ("Todos los archivos", "*.*")],
+            title="Importar procesos"
+        )
+        if not ruta:
+            return
+        try:
+            from ..cli.formats import read_processes
+            procs = read_processes(ruta)
+        except (OSError, ValueError) as e:
+            CTkMessagebox(title="Error", message=f"No se pudo importar: {e}", icon="cancel")
+            return
+        if not procs:
+            CTkMessagebox(title="Aviso", message="El archivo no tiene procesos.", icon="info")
+            return
+        self.master.table.load_processes(procs)
+        self.count_box.set(str(len(procs)))
 
     def _on_algorithm_change(self, value):
         if value == "Round Robin":
@@ -133,6 +178,29 @@ class ControlsFrame(ctk.CTkFrame):
                 text_color="#555555"
             )
 
+    def _on_cancel(self):
+        if self.on_cancel:
+            self.on_cancel()
+
+    def show_progress(self, text: str, fraction: Optional[float] = None):
+        """Muestra el avance de Calcular; sin 'fraction', la barra queda en modo indeterminado."""
+        if not self.progress_frame.winfo_ismapped():
+            self.progress_frame.grid()
+        self.progress_label.configure(text=text)
+        if fraction is None:
+            if self.progress_bar.cget("mode") != "indeterminate":
+                self.progress_bar.configure(mode="indeterminate")
+                self.progress_bar.start()
+        else:
+            if self.progress_bar.cget("mode") != "determinate":
+                self.progress_bar.stop()
+                self.progress_bar.configure(mode="determinate")
+            self.progress_bar.set(fraction)
+
+    def hide_progress(self):
+        self.progress_bar.stop()
+        self.progress_frame.grid_remove()
+
     def _on_fullscreen(self):
         self.app.show_fullscreen_gantt()
 
@@ -170,6 +238,7 @@ class ControlsFrame(ctk.CTkFrame):
             return
 
         try:
+            from ..exportacion.exportador_excel import ExportadorExcel
             exp = ExportadorExcel()
             exp.exportar_con_gantt(
             ruta,
@@ -203,8 +272,8 @@ class ControlsFrame(ctk.CTkFrame):
                     ],
                     # Fila extra con promedios
                     {"Proceso": "PROMEDIO",
-                    "Turnaround": round(self.app._last_schedule_result.avg_turnaround, 2),
-                    "Waiting": round(self.app._last_schedule_result.avg_waiting, 2)}
+                    "Turnaround": _rounded(self.app._last_schedule_result.avg_turnaround),
+                    "Waiting": _rounded(self.app._last_schedule_result.avg_waiting)}
                 ])())
             ]
         )
@@ -1,17 +1,196 @@
+import math
 import customtkinter as ctk
-from matplotlib.figure import Figure
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backend_bases import MouseButton
-from typing import List, Dict, Tuple
-from ..core.models import ExecSlice, Process
+from typing import List, Dict, Optional, Tuple, Sequence
+from ..core.models import ExecSlice, Process, Timeline, as_timeline, SLICE_BLOCK, SLICE_RUN
+
+# matplotlib es lo más caro del arranque: se importa al crear la primera figura
+# o antes, en segundo plano, con load_matplotlib() (ver SchedulerApp).
+# NumPy llega con matplotlib (es una dependencia suya).
+Figure = MaxNLocator = FormatStrFormatter = FuncFormatter = FigureCanvasTkAgg = MouseButton = None
+PolyCollection = to_rgba = np = None
+
+BAR_HEIGHT = 0.6
+IO_ALPHA = 0.45
+LABEL_FONTSIZE = 9
+EDGE_COLOR = "#333333"
+
+# Nivel de detalle: con más tramos visibles que esto, o con más de
+# LOD_TICKS_PER_PIXEL unidades de tiempo por píxel y al menos LOD_MIN_BARS
+# tramos, se dibujan bandas de densidad por fila en lugar de barras.
+MAX_DETAIL_BARS = 5000
+LOD_MIN_BARS = 500
+LOD_TICKS_PER_PIXEL = 2.0
+MAX_LABELS = 2000
+MIN_DENSITY_ALPHA = 0.3     # alfa mínimo de una banda con actividad, para que no se pierda
+MAX_ROW_TICKS = 25          # con más filas, los nombres del eje Y se espacian solos
+MIN_SEPARATOR_PX = 6        # con filas más bajas que esto no se dibujan los separadores
+REBUILD_DELAY_MS = 120      # espera tras el último pan/zoom antes de reconstruir el detalle
+FRAME_MS = 16               # a lo sumo un cuadro por refresco de pantalla (~60 Hz) al arrastrar o hacer zoom
+
+
+def load_matplotlib():
+    """Importa lo que usa el Gantt. Seguro de llamar desde un hilo (no toca Tk)."""
+    global Figure, MaxNLocator, FormatStrFormatter, FuncFormatter, FigureCanvasTkAgg, MouseButton
+    global PolyCollection, to_rgba, np
+    if Figure is not None:
+        return
+    import numpy as _np
+    from matplotlib.ticker import (MaxNLocator as _MaxNLocator, FormatStrFormatter as _FormatStrFormatter,
+                                   FuncFormatter as _FuncFormatter)
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as _FigureCanvasTkAgg
+    from matplotlib.backend_bases import MouseButton as _MouseButton
+    from matplotlib.collections import PolyCollection as _PolyCollection
+    from matplotlib.colors import to_rgba as _to_rgba
+    from matplotlib.figure import Figure as _Figure
+    np = _np
+    MaxNLocator, FormatStrFormatter, FuncFormatter = _MaxNLocator, _FormatStrFormatter, _FuncFormatter
+    FigureCanvasTkAgg, MouseButton = _FigureCanvasTkAgg, _MouseButton
+    PolyCollection, to_rgba = _PolyCollection, _to_rgba
+    Figure = _Figure   # al final: marca la carga como completa
+
+
+def _bar(row: int, start: float, end: float):
+    """Vértices de una barra horizontal de alto BAR_HEIGHT centrada en 'row'."""
+    lo, hi = row - BAR_HEIGHT / 2, row + BAR_HEIGHT / 2
+    return ((start, lo), (start, hi), (end, hi), (end, lo))
+
+
+def _bar_verts(rows, starts, ends):
+    """_bar vectorizado: arreglo (n, 4, 2) de vértices."""
+    verts = np.empty((len(rows), 4, 2))
+    lo, hi = rows - BAR_HEIGHT / 2, rows + BAR_HEIGHT / 2
+    verts[:, 0, 0] = verts[:, 1, 0] = starts
+    verts[:, 2, 0] = verts[:, 3, 0] = ends
+    verts[:, 0, 1] = verts[:, 3, 1] = lo
+    verts[:, 1, 1] = verts[:, 2, 1] = hi
+    return verts
+
+
+class _Lanes:
+    """
+    Tramos de un mismo tipo (CPU o E/S) ordenados por (fila, inicio). Dentro de
+    una fila no se solapan, así que inicios y fines quedan ambos ordenados y
+    una ventana de tiempo se resuelve con búsqueda binaria sobre claves
+    fila * K + tiempo. Las sumas prefijas dan la ocupación por intervalo sin
+    recorrer los tramos.
+    """
+
+    def __init__(self, rows, starts, ends, n_rows: int, t0: float, K: float):
+        order = np.lexsort((starts, rows))
+        self.rows = rows[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.offsets = np.searchsorted(self.rows, np.arange(n_rows + 1))
+        self.t0, self.K = t0, K
+        self.key_start = self.rows * K + (self.starts - t0)
+        self.key_end = self.rows * K + (self.ends - t0)
+        self.cum_start = np.concatenate(([0.0], np.cumsum(self.starts - t0)))
+        self.cum_end = np.concatenate(([0.0], np.cumsum(self.ends - t0)))
+
+    def _keys(self, r0: int, r1: int, x):
+        local = np.clip(np.asarray(x, dtype=float) - self.t0, -0.5, self.K - 1.5)
+        return np.arange(r0, r1 + 1)[:, None] * self.K + local, local
+
+    def window(self, r0: int, r1: int, x0: float, x1: float):
+        """Índices de los tramos de las filas r0..r1 que intersecan (x0, x1)."""
+        keys, _ = self._keys(r0, r1, [x0, x1])
+        lo = np.searchsorted(self.key_end, keys[:, 0], side="right")
+        hi = np.maximum(np.searchsorted(self.key_start, keys[:, 1], side="left"), lo)
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        skip = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        return np.arange(total) + skip
+
+    def count(self, r0: int, r1: int, x0: float, x1: float) -> int:
+        keys, _ = self._keys(r0, r1, [x0, x1])
+        lo = np.searchsorted(self.key_end, keys[:, 0], side="right")
+        hi = np.searchsorted(self.key_start, keys[:, 1], side="left")
+        return int(np.maximum(hi - lo, 0).sum())
+
+    def coverage(self, r0: int, r1: int, edges):
+        """Fracción ocupada de cada intervalo [edges[j], edges[j+1]) por fila: (filas, bins)."""
+        keys, local = self._keys(r0, r1, edges)
+        first = self.offsets[r0:r1 + 1, None]
+        i_s = np.searchsorted(self.key_start, keys)
+        i_e = np.searchsorted(self.key_end, keys)
+        # Tiempo ocupado antes de cada borde: sum(B - s) - sum(B - e) sobre los tramos de la fila
+        busy = ((i_s - first) * local - (self.cum_start[i_s] - self.cum_start[first])
+                - (i_e - first) * local + (self.cum_end[i_e] - self.cum_end[first]))
+        return np.clip(np.diff(busy, axis=1) / np.diff(local), 0.0, 1.0)
+
+
+class GanttData:
+    """
+    Tramos del timeline por fila del gráfico, ya ordenados, colores por fila,
+    sombreado de llegadas y límites: todo lo que el Gantt calcula antes de
+    dibujar. No toca Tk ni la figura, así que puede prepararse fuera del hilo
+    principal (con load_matplotlib() hecho). Es de solo lectura: varios
+    GanttChart pueden dibujar el mismo (p. ej. la pantalla completa).
+    """
+
+    def __init__(self, processes: List[Process], timeline: Sequence[ExecSlice], colors: Dict[str, str]):
+        self.processes = processes
+        # Las estrategias ya emiten los tramos unidos: no hace falta fusionarlos aquí
+        self.timeline = tl = as_timeline(timeline or [])
+        n_rows = len(processes)
+        self.row_names = [p.name for p in processes]
+        name_to_row = {p.name: i for i, p in enumerate(processes)}
+
+        # to_rgba una vez por color distinto, no por proceso
+        palette: Dict[str, int] = {}
+        color_idx = np.array([palette.setdefault(colors.get(p.name, "#1f1f1f"), len(palette)) for p in processes],
+                             dtype=np.int64)
+        rgba = np.array([to_rgba(c, 1.0) for c in palette] or [(0.0, 0.0, 0.0, 1.0)])
+        faces = np.empty((n_rows, 2, 4))
+        faces[:, 0] = faces[:, 1] = rgba[color_idx]
+        faces[:, 1, 3] = IO_ALPHA
+        self.row_faces = faces           # (filas, 2, 4): RGBA de CPU y de E/S
+        self.edge_faces = np.array([to_rgba(EDGE_COLOR, 1.0), to_rgba(EDGE_COLOR, IO_ALPHA)])
+
+        # Columnas del timeline -> tramos por fila, sin pasar por objetos por tramo
+        # (array() en memoria o memoryview sobre el archivo de un SpilledTimeline)
+        start, end, proc, kind = (np.frombuffer(c, dtype=memoryview(c).format) if len(c)
+                                  else np.empty(0, dtype=memoryview(c).format)
+                                  for c in tl.columns())
+        row_of = np.array([name_to_row.get(name, -1) for name in tl.names] or [-1], dtype=np.int64)
+
+        plain = kind != SLICE_RUN
+        rows = [row_of[proc[plain]]]
+        starts, ends, blocks = [start[plain]], [end[plain]], [kind[plain] == SLICE_BLOCK]
+        # Los RotationRun se expanden en bloque: vuelta a vuelta, cada proceso su quantum
+        for run_row in np.flatnonzero(~plain):
+            run = tl.run(run_row)
+            order = np.array([name_to_row.get(name, -1) for name in run.order], dtype=np.int64)
+            k = len(order) * run.rounds
+            s = run.start + np.arange(k, dtype=np.int64) * run.quantum
+            rows.append(np.tile(order, run.rounds))
+            starts.append(s)
+            ends.append(s + run.quantum)
+            blocks.append(np.zeros(k, dtype=bool))
+        rows, starts, ends, blocks = (np.concatenate(c) for c in (rows, starts, ends, blocks))
+
+        keep = (rows >= 0) & (ends > starts)
+        rows, starts, ends, blocks = rows[keep], starts[keep].astype(float), ends[keep].astype(float), blocks[keep]
+        t0 = float(min(starts.min(), 0.0)) if len(starts) else 0.0
+        K = (float(ends.max()) - t0 if len(ends) else 0.0) + 2.0
+        self.lanes = (_Lanes(rows[~blocks], starts[~blocks], ends[~blocks], n_rows, t0, K),
+                      _Lanes(rows[blocks], starts[blocks], ends[blocks], n_rows, t0, K))
+
+        # Partes fijas del dibujo: llegadas sombreadas y límites "full" (todo el timeline y las filas)
+        self.shading = [_bar(i, 0, p.arrival) for i, p in enumerate(processes) if p.arrival > 0]
+        max_t = tl.end_time if len(tl) else 1.0
+        self.bounds = ((0.0, float(max_t)), (-0.5, float(n_rows) - 0.5))
+
 
 class GanttChart(ctk.CTkFrame):
     def __init__(self, master):
         super().__init__(master)
 
         self._processes: List[Process] = []
-        self._timeline: List[ExecSlice] = []
+        self._timeline: Timeline = Timeline()
+        self._data: Optional[GanttData] = None
         self._color_by_name: Dict[str, str] = {}
 
         # Zoom/pan
@@ -20,12 +199,38 @@ class GanttChart(ctk.CTkFrame):
         self._press_event = None
         self._orig_xlim: Tuple[float, float] = (0.0, 1.0)
         self._orig_ylim: Tuple[float, float] = (0.0, 1.0)
+        self._frame_job = None
+        # Mapa de bits de los ejes durante un arrastre y los límites con que se capturó
+        self._pan_region = None
+        self._pan_limits: Optional[tuple] = None
 
         # Límites “full” que reflejan TODO el timeline y filas
         self._full_xlim: Tuple[float, float] = (0.0, 1.0)
         self._full_ylim: Tuple[float, float] = (0.0, 1.0)
 
-        # Canvas / figura
+        # Tramos preparados por tipo y colores por fila (ver GanttData)
+        self._lanes: Optional[Tuple[_Lanes, _Lanes]] = None
+        self._row_faces = self._edge_faces = None
+        self._row_names: List[str] = []
+
+        # Lo construido para la vista: barras o bandas, y qué rango cubren
+        self._bars = None
+        self._density = None
+        self._built: Optional[tuple] = None    # (modo, x0, x1, r0, r1, unidades por píxel)
+        self._label_artists = []
+        self._separators = None
+        self._rebuild_job = None
+
+        # Canvas / figura: se crean en ensure_canvas(), en el primer dibujo o
+        # cuando la aplicación terminó de precargar matplotlib
+        self.figure = None
+        self.ax = None
+        self.canvas = None
+
+    def ensure_canvas(self):
+        if self.canvas is not None:
+            return
+        load_matplotlib()
         self.figure = Figure(figsize=(10, 4.5), dpi=100)
         self.ax = self.figure.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.figure, master=self)
@@ -37,107 +242,353 @@ class GanttChart(ctk.CTkFrame):
         cid('button_release_event', self._on_release)
         cid('motion_notify_event',  self._on_motion)
         cid('scroll_event',         self._on_scroll)
+        cid('resize_event',         self._on_resize)
+        self.canvas.draw_idle()
 
     def set_colors(self, color_map: Dict[str, str]):
         self._color_by_name = color_map.copy()
 
+    @property
+    def data(self) -> Optional[GanttData]:
+        """Lo que se está mostrando (None sin dibujo): otro GanttChart puede dibujarlo sin recalcular."""
+        return self._data
+
+    def destroy(self):
+        """Además del widget, libera la figura y el canvas de matplotlib y suelta los tramos."""
+        for job in (self._frame_job, self._rebuild_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._frame_job = self._rebuild_job = None
+        if self.canvas is not None:
+            idle = getattr(self.canvas, "_idle_draw_id", None)
+            if idle:
+                self.canvas.get_tk_widget().after_cancel(idle)
+            self.figure.clear()
+            self.canvas.get_tk_widget().destroy()
+            self.figure = self.ax = self.canvas = None
+        self._data = self._lanes = None
+        self._bars = self._density = self._separators = self._pan_region = None
+        self._label_artists = []
+        super().destroy()
+
     def clear(self):
         self._processes = []
-        self._timeline = []
+        self._timeline = Timeline()
+        self._data = None
         self._first_draw = True
-        self.ax.clear()
+        self._lanes = None
+        self._bars = self._density = self._built = None
+        self._label_artists = []
+        self._separators = self._pan_region = None
+        if self.canvas is not None:
+            self.ax.clear()
+            self.canvas.draw_idle()
+
+    def draw(self, processes: List[Process], timeline: Sequence[ExecSlice], data: Optional["GanttData"] = None):
+        """'data' permite pasar los tramos ya preparados (p. ej. en otro hilo) para no repetirlo aquí."""
+        if data is None:
+            load_matplotlib()
+            data = GanttData(processes, timeline, self._color_by_name)
+        self._data = data
+        self._processes = data.processes
+        self._timeline = data.timeline
+        self._lanes = data.lanes
+        self._row_faces, self._edge_faces = data.row_faces, data.edge_faces
+        self._row_names = data.row_names
+        self._redraw()
+
+    def _redraw(self):
+        """
+        Partes fijas del Gantt (sombreado de llegadas, separadores, ejes) y luego
+        solo lo que entra en la vista, ver _rebuild_view. Los tramos van en una
+        única PolyCollection con colores por cara (alfa de E/S incluido).
+        """
+        self.ensure_canvas()
+        load_matplotlib()
+        ax = self.ax
+        ax.clear()
+        self._label_artists = []
+        self._built = None
+        n_rows = len(self._processes)
+
+        shading = self._data.shading
+        if shading:
+            ax.add_collection(PolyCollection(shading, facecolors=to_rgba("black", 0.15),
+                                             edgecolors="none", zorder=0), autolim=False)
+        self._bars = PolyCollection([], linewidths=1.0)
+        ax.add_collection(self._bars, autolim=False)
+        self._density = ax.imshow(np.zeros((1, 1, 4)), aspect="auto", interpolation="nearest",
+                                  origin="lower", extent=(0, 1, 0, 1), zorder=1)
+        self._density.set_visible(False)
+
+        ax.set_xlabel("Tiempo")
+        self._full_xlim, self._full_ylim = self._data.bounds
+        ax.set_xlim(*self._full_xlim)
+        ax.set_ylim(*self._full_ylim)
+        ax.set_autoscale_on(False)
+
+        # Marcas adaptativas: enteras y espaciadas según el zoom
+        ax.xaxis.set_major_locator(MaxNLocator(nbins="auto", steps=[1, 2, 5, 10], integer=True))
+        ax.xaxis.set_major_formatter(FormatStrFormatter('%d'))
+        if n_rows <= MAX_ROW_TICKS:
+            ax.set_yticks(list(range(n_rows)))
+            ax.set_yticklabels(self._row_names)
+        else:
+            names = self._row_names
+            ax.yaxis.set_major_locator(MaxNLocator(nbins="auto", steps=[1, 2, 5, 10], integer=True))
+            ax.yaxis.set_major_formatter(FuncFormatter(
+                lambda v, _pos: names[int(v)] if v == int(v) and 0 <= v < len(names) else ""))
+        self._separators = None
+        if n_rows:
+            self._separators = ax.hlines([y + 0.5 for y in range(n_rows)], 0, 1, transform=ax.get_yaxis_transform(),
+                      colors="#cccccc", linestyles="--", linewidths=0.5, zorder=0)
+        ax.grid(True, axis="x", linestyle="--", alpha=0.3)
+
+        self.figure.tight_layout()
+        self._rebuild_view()
         self.canvas.draw_idle()
 
-    def _merge_timeline(self, timeline: List[ExecSlice]) -> List[ExecSlice]:
-        if not timeline:
-            return []
-        merged = [timeline[0]]
-        for sl in timeline[1:]:
-            last = merged[-1]
-            if sl.process == last.process and sl.start == last.end:
-                merged[-1] = type(sl)(sl.process, last.start, sl.end)
+    # — Nivel de detalle —
+
+    def _view(self):
+        """(x0, x1, r0, r1, unidades por píxel) de la vista actual; None sin filas."""
+        ax = self.ax
+        x0, x1 = ax.get_xlim()
+        y0, y1 = sorted(ax.get_ylim())
+        r0 = max(0, math.ceil(y0 - BAR_HEIGHT / 2))
+        r1 = min(len(self._processes) - 1, math.floor(y1 + BAR_HEIGHT / 2))
+        if r1 < r0:
+            return None
+        return x0, x1, r0, r1, (x1 - x0) / max(ax.bbox.width, 1.0)
+
+    def _wants_density(self, view) -> bool:
+        x0, x1, r0, r1, per_px = view
+        n = sum(lanes.count(r0, r1, x0, x1) for lanes in self._lanes)
+        return n > MAX_DETAIL_BARS or (n > LOD_MIN_BARS and per_px > LOD_TICKS_PER_PIXEL)
+
+    def _covers(self, view, density: bool) -> bool:
+        """Si lo ya construido sirve para 'view' (mismo modo, rango y, en bandas, resolución)."""
+        if self._built is None:
+            return False
+        mode, bx0, bx1, br0, br1, bpx = self._built
+        x0, x1, r0, r1, per_px = view
+        if mode != ("density" if density else "detail") or x0 < bx0 or x1 > bx1 or r0 < br0 or r1 > br1:
+            return False
+        return not density or 0.67 < per_px / bpx < 1.5
+
+    def _rebuild_view(self, coarse_only: bool = False):
+        """
+        Construye solo lo que entra en la vista (más medio ancho de margen a
+        cada lado, para que un pan corto no obligue a reconstruir): barras si
+        hay pocas, o bandas de densidad por fila. Con coarse_only, en lugar de
+        un detalle caro se dejan bandas y el detalle queda para después.
+        """
+        self._rebuild_job = None
+        if self.canvas is None or self._lanes is None:
+            return
+        view = self._view()
+        if view is None:
+            return
+        self._update_separators(view)
+        density = self._wants_density(view)
+        if not self._covers(view, density):
+            x0, x1, r0, r1, per_px = view
+            margin = (x1 - x0) / 2
+            bx0, bx1 = max(self._full_xlim[0], x0 - margin), min(self._full_xlim[1], x1 + margin)
+            br0, br1 = max(0, r0 - (r1 - r0 + 1) // 2), min(len(self._processes) - 1, r1 + (r1 - r0 + 1) // 2)
+            if density or (coarse_only and not self._cheap_detail(view)):
+                self._build_density(bx0, bx1, br0, br1, per_px)
             else:
-                merged.append(sl)
-        return merged
-
-    def draw(self, processes: List[Process], timeline: List[ExecSlice]):
-        self._processes = processes
-        self._timeline = self._merge_timeline(timeline or [])
-        self._redraw()
+                self._build_detail(bx0, bx1, br0, br1, per_px)
+                self._built = ("detail", bx0, bx1, br0, br1, per_px)
+        if not coarse_only or (self._built and self._built[0] == "detail"):
+            self._update_labels(view)
+
+    def _cheap_detail(self, view) -> bool:
+        x0, x1, r0, r1, _ = view
+        return sum(lanes.count(r0, r1, x0, x1) for lanes in self._lanes) <= LOD_MIN_BARS
+
+    def _build_detail(self, x0: float, x1: float, r0: int, r1: int, per_px: float):
+        verts, faces, edges = [], [], []
+        for is_block, lanes in enumerate(self._lanes):
+            idx = lanes.window(r0, r1, x0, x1)
+            if not len(idx):
+                continue
+            rows = lanes.rows[idx]
+            verts.append(_bar_verts(rows, lanes.starts[idx], lanes.ends[idx]))
+            faces.append(self._row_faces[rows, is_block])
+            edges.append(np.broadcast_to(self._edge_faces[is_block], (len(idx), 4)))
+        if verts:
+            self._bars.set_verts(np.concatenate(verts))
+            self._bars.set_facecolor(np.concatenate(faces))
+            self._bars.set_edgecolor(np.concatenate(edges))
+        else:
+            self._bars.set_verts([])
+        # Bordes solo si una unidad de tiempo ocupa varios píxeles; si no, taparían el color
+        self._bars.set_linewidth(1.0 if per_px < 0.25 else 0.0)
+        self._bars.set_visible(True)
+        self._density.set_visible(False)
+
+    def _build_density(self, x0: float, x1: float, r0: int, r1: int, per_px: float):
+        """
+        Bandas por fila: ocupación de CPU (más la de E/S con su alfa) de cada
+        columna de píxeles, pintada con el color del proceso en una sola imagen.
+        """
+        rows = r1 - r0 + 1
+        bins = int(min(max((x1 - x0) / max(per_px, 1e-9), 1), 8192, max(4_000_000 // rows, 16)))
+        edges = np.linspace(x0, x1, bins + 1)
+        cpu, io = (lanes.coverage(r0, r1, edges) for lanes in self._lanes)
+        band = np.empty((rows, bins, 4))
+        band[..., :3] = self._row_faces[r0:r1 + 1, 0, None, :3]
+        busy = np.clip(cpu + IO_ALPHA * io, 0.0, 1.0)
+        band[..., 3] = np.where(busy > 0, MIN_DENSITY_ALPHA + (1 - MIN_DENSITY_ALPHA) * busy, 0.0)
+        # Con pocas filas, 10 subfilas por fila para respetar el alto de las barras
+        sub = 10 if rows <= 400 else 1
+        if sub > 1:
+            img = np.zeros((rows, sub, bins, 4))
+            pad = round(sub * (1 - BAR_HEIGHT) / 2)
+            img[:, pad:sub - pad] = band[:, None]
+            band = img.reshape(rows * sub, bins, 4)
+        self._density.set_data(band)
+        self._density.set_extent((x0, x1, r0 - 0.5, r1 + 0.5))
+        self._density.set_visible(True)
+        self._bars.set_visible(False)
+        self._built = ("density", x0, x1, r0, r1, per_px)
+
+    def _update_labels(self, view=None):
+        """
+        Etiquetas solo para los tramos visibles cuyo ancho en pantalla alcanza
+        para el texto (y nunca en modo bandas); se recalculan al reconstruir la vista.
+        """
+        for artist in self._label_artists:
+            artist.remove()
+        self._label_artists = []
+        view = view or self._view()
+        if view is None or self._built is None or self._built[0] != "detail":
+            return
+        x0, x1, r0, r1, per_px = view
+        # Ancho aproximado de un carácter en píxeles (~0.6 del tamaño de la fuente)
+        char_px = 0.6 * LABEL_FONTSIZE * self.figure.dpi / 72
+        text = self.ax.text
+        for is_block, lanes in enumerate(self._lanes):
+            idx = lanes.window(r0, r1, x0, x1)
+            rows, s, e = lanes.rows[idx], lanes.starts[idx], lanes.ends[idx]
+            if is_block:
+                min_units = (2 * char_px + 4) * per_px
+                wide = (e - s) >= min_units
+            else:
+                name_len = np.array([len(n) for n in self._row_names])
+                wide = (e - s) >= (name_len[rows] * char_px + 4) * per_px
+            for r, a, b in zip(rows[wide].tolist(), s[wide].tolist(), e[wide].tolist()):
+                if len(self._label_artists) >= MAX_LABELS:
+                    return
+                label = "IO" if is_block else self._row_names[r]
+                self._label_artists.append(text((a + b) / 2, r, label, ha="center", va="center",
+                                                color="white", fontsize=LABEL_FONTSIZE, clip_on=True))
+
+    def _view_changed(self):
+        """
+        Tras un pan/zoom: si lo construido no cubre la vista, bandas enseguida
+        (su costo depende de los píxeles, no de los tramos) y el detalle en
+        cuanto el usuario se detiene.
+        """
+        view = self._view()
+        if view is not None and self._lanes is not None:
+            if self._covers(view, self._wants_density(view)):
+                self._update_separators(view)
+            else:
+                self._rebuild_view(coarse_only=True)
+        self._schedule_rebuild()
+
+    def _update_separators(self, view):
+        """Los separadores punteados solo se ven si las filas tienen alto suficiente en pantalla."""
+        if self._separators is not None:
+            _, _, r0, r1, _ = view
+            self._separators.set_visible(self.ax.bbox.height / (r1 - r0 + 1) >= MIN_SEPARATOR_PX)
+
+    def _schedule_rebuild(self):
+        if self._rebuild_job is not None:
+            self.after_cancel(self._rebuild_job)
+        self._rebuild_job = self.after(REBUILD_DELAY_MS, self._deferred_rebuild)
+
+    def _deferred_rebuild(self):
+        self._rebuild_view()
+        if self.canvas is None:
+            return
+        if self._dragging:
+            # El arrastre sigue: se dibuja ya y se recaptura, así lo que entró en la vista deja de verse vacío
+            self.canvas.draw()
+            self._capture_pan()
+        else:
+            self.canvas.draw_idle()
 
-    def _compute_full_bounds(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
-        max_t = max((sl.end for sl in self._timeline), default=1.0)
-        proc_n = len(self._processes)
-        return (0.0, float(max_t)), (-0.5, float(proc_n) - 0.5)
+    # — Cuadros de pan/zoom —
 
-    def _redraw(self):
-        self.ax.clear()
-        procs = self._processes
-        name_to_row = {p.name: i for i, p in enumerate(procs)}
-        yticks = list(range(len(procs)))
-        ylabels = [p.name for p in procs]
-        self.ax.set_yticks(yticks)
-        self.ax.set_yticklabels(ylabels)
-
-        for p in procs:
-            r = name_to_row[p.name]
-            if p.arrival > 0:
-                self.ax.barh(r, p.arrival, left=0, height=0.6,
-                             color="black", alpha=0.15, zorder=0)
-
-        for sl in self._timeline:
-            is_block = sl.process.endswith("_BLOCK")
-            base = sl.process.replace("_BLOCK", "").strip()
-            r = name_to_row.get(base)
-            if r is None:
-                continue
-            start, end = sl.start, sl.end
-            dur = max(0.0, end - start)
-            if dur == 0.0:
-                continue
+    def _request_frame(self):
+        """Los eventos solo mueven los límites; el dibujo se agrupa en un cuadro cada FRAME_MS."""
+        if self._frame_job is None:
+            self._frame_job = self.after(FRAME_MS, self._frame)
 
-            color = self._color_by_name.get(base, "#1f1f1f")
-            alpha = 0.45 if is_block else 1.0
-            self.ax.barh(r, dur, left=start, height=0.6,
-                         color=color, alpha=alpha,
-                         edgecolor="#333333", linewidth=1.0)
-            label = "IO" if is_block else base
-            self.ax.text(start + dur/2, r, label,
-                         ha="center", va="center",
-                         color="white", fontsize=9)
-
-        self.ax.set_xlabel("Tiempo")
-        self._full_xlim, self._full_ylim = self._compute_full_bounds()
-
-        cur_x0, cur_x1 = self.ax.get_xlim()
-        fx0, fx1 = self._full_xlim
-        if abs(cur_x1 - cur_x0) < 1e-6 or (cur_x0 < fx0 or cur_x1 > fx1):
-            self.ax.set_xlim(*self._full_xlim)
-        fy0, fy1 = self._full_ylim
-        self.ax.set_ylim(fy0, fy1)
-
-        self.ax.xaxis.set_major_locator(MultipleLocator(1))
-        self.ax.xaxis.set_major_formatter(FormatStrFormatter('%d'))
-        for y in yticks:
-            self.ax.axhline(y=y + 0.5,
-                            color="#cccccc",
-                            linestyle="--",
-                            linewidth=0.5,
-                            zorder=0)
-        self.ax.grid(True, axis="x", linestyle="--", alpha=0.3)
+    def _flush_frame(self):
+        if self._frame_job is not None:
+            self.after_cancel(self._frame_job)
+            self._frame()
 
-        self.figure.tight_layout()
-        self.canvas.draw_idle()
+    def _frame(self):
+        self._frame_job = None
+        if self.canvas is None:
+            return
+        if self._dragging and self._pan_region is not None and self._blit_pan():
+            self._schedule_rebuild()
+        else:
+            self._view_changed()
+            self.canvas.draw()
+
+    def _capture_pan(self):
+        """Copia de los ejes ya dibujados: durante el arrastre se desplaza en lugar de redibujar."""
+        self._pan_region = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._pan_limits = (self.ax.get_xlim(), self.ax.get_ylim())
+
+    def _blit_pan(self) -> bool:
+        """
+        Vista previa del pan: fondo de los ejes y la copia capturada corrida
+        los píxeles que se movió la vista, sin redibujar tramos ni texto (las
+        marcas de los ejes se actualizan al reconstruir). False si no aplica.
+        """
+        ax = self.ax
+        (px0, px1), (py0, py1) = self._pan_limits
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        if not (math.isclose(x1 - x0, px1 - px0) and math.isclose(y1 - y0, py1 - py0)):
+            return False
+        sx = round((px0 - x0) * ax.bbox.width / (x1 - x0))
+        sy = -round((py0 - y0) * ax.bbox.height / (y1 - y0))   # la copia cuenta filas desde arriba
+        left, top, right, bottom = self._pan_region.get_extents()
+        # Sin el borde de la copia, que lleva los ejes (spines) pintados
+        src = (left + 2 + max(0, -sx), top + 2 + max(0, -sy), right - 2 - max(0, sx), bottom - 2 - max(0, sy))
+        ax.draw_artist(ax.patch)
+        if src[0] < src[2] and src[1] < src[3]:
+            self.canvas.restore_region(self._pan_region, bbox=src, xy=(left + sx, top + sy))
+        for spine in ax.spines.values():
+            ax.draw_artist(spine)
+        self.canvas.blit(ax.bbox)
+        return True
+
+    def _on_resize(self, event):
+        self._pan_region = None
+        self._schedule_rebuild()
 
     # — Mouse handlers —
 
     def _on_press(self, event):
         if event.inaxes != self.ax or event.button != MouseButton.LEFT:
             return
+        self._flush_frame()
         self._dragging = True
         self._press_event = (event.x, event.y)  # usar píxeles
         self._orig_xlim = self.ax.get_xlim()
         self._orig_ylim = self.ax.get_ylim()
+        self._capture_pan()
 
     def _on_motion(self, event):
         if not self._dragging or event.inaxes != self.ax:
@@ -161,12 +612,14 @@ class GanttChart(ctk.CTkFrame):
 
         self.ax.set_xlim(new_l, new_r)
         self.ax.set_ylim(new_b, new_t)
-        self.canvas.draw_idle()
+        self._request_frame()
 
     def _on_release(self, event):
-        if event.button == MouseButton.LEFT:
+        if event.button == MouseButton.LEFT and self._dragging:
             self._dragging = False
             self._press_event = None
+            self._pan_region = None
+            self._request_frame()
 
     def _on_scroll(self, event):
         if event.inaxes != self.ax or event.xdata is None or event.ydata is None:
@@ -190,7 +643,7 @@ class GanttChart(ctk.CTkFrame):
 
         self.ax.set_xlim(new_l, new_r)
         self.ax.set_ylim(new_b, new_t)
-        self.canvas.draw_idle()
+        self._request_frame()
 
     def _clamp_snap(self, full: Tuple[float, float], low: float, high: float) -> Tuple[float, float]:
         full_low, full_high = full
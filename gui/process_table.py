@@ -1,30 +1,142 @@
 # app/gui/process_table.py
 
-import re
+import sys
 import customtkinter as ctk
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from ..utils import DualScrollFrame
+from ..core.models import Process, parse_pattern, format_pattern
 import tkinter.colorchooser
 
+WHEEL_ROWS = 3   # filas por paso de la rueda del ratón
+
+# Paleta de colores para procesos
+PALETTE = [
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
+    "#393b79", "#637939", "#8c6d31", "#843c39", "#7b4173",
+    "#3182bd", "#31a354", "#756bb1", "#636363", "#e6550d"
+]
+
+
+def _parse_row(raw: str):
+    pattern = parse_pattern(raw)
+    if pattern is None and raw.isdigit():
+        pattern = [("CPU", int(raw))]
+    return pattern
+
+
+class ProcessTableModel:
+    """
+    Filas de la tabla sin widgets. Lo importado queda como Process y recién se
+    pasa a texto cuando la fila se muestra; lo editado en pantalla se guarda
+    como texto (nombre, llegada, patrón) y se valida al pedir los procesos.
+    """
+
+    def __init__(self):
+        self._rows: List[Union[Process, Tuple[str, str, str]]] = []
+        self.colors: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @staticmethod
+    def _default(i: int) -> Tuple[str, str, str]:
+        return (f"P{i+1}", "0", "")
+
+    def resize(self, count: int):
+        """Recorta o completa con filas por defecto, sin tocar las que quedan."""
+        del self._rows[count:]
+        del self.colors[count:]
+        for i in range(len(self._rows), count):
+            self._rows.append(self._default(i))
+            self.colors.append(PALETTE[i % len(PALETTE)])
+
+    def load(self, processes: Sequence[Process]):
+        self._rows = list(processes)
+        self.colors = [PALETTE[i % len(PALETTE)] for i in range(len(self._rows))]
+
+    def reset(self):
+        self._rows = [self._default(i) for i in range(len(self._rows))]
+
+    def name(self, i: int) -> str:
+        row = self._rows[i]
+        return row.name if isinstance(row, Process) else row[0]
+
+    def text(self, i: int) -> Tuple[str, str, str]:
+        row = self._rows[i]
+        if isinstance(row, Process):
+            raw = format_pattern(row.pattern) if row.pattern else str(row.burst)
+            return (row.name, str(row.arrival), raw)
+        return row
+
+    def set_text(self, i: int, name: Optional[str] = None, arrival: Optional[str] = None,
+                 pattern_raw: Optional[str] = None):
+        old = self.text(i)
+        new = (old[0] if name is None else name,
+               old[1] if arrival is None else arrival,
+               old[2] if pattern_raw is None else pattern_raw)
+        if new != old:
+            self._rows[i] = new
+
+    def row_data(self, i: int) -> Dict:
+        name_val, arrival_val, pattern_raw = (v.strip() for v in self.text(i))
+        pattern = _parse_row(pattern_raw)
+        burst = sum(d for k, d in (pattern or []) if k == "CPU")
+        return {
+            "name": name_val,
+            "arrival": arrival_val,
+            "burst": str(burst),
+            "color": self.colors[i],
+            "pattern": pattern,
+            "pattern_raw": pattern_raw
+        }
+
+    def processes(self) -> List[Process]:
+        """Procesos de la tabla; ValueError con el mensaje para el usuario si una fila es inválida."""
+        out = []
+        for row in self._rows:
+            if isinstance(row, Process):
+                out.append(row)
+                continue
+            name = row[0].strip()
+            if not name:
+                raise ValueError("Hay procesos sin nombre.")
+            try:
+                arrival = int(row[1])
+            except ValueError:
+                raise ValueError(f"Llegada inválida en {name}.")
+            pattern = _parse_row(row[2].strip())
+            burst = sum(d for k, d in (pattern or []) if k == "CPU")
+            if pattern is None or burst <= 0:
+                raise ValueError(f"Patrón inválido o vacío en {name}. Escribe algo como: 3,(2),4 o 5.")
+            out.append(Process(name=name, arrival=arrival, burst=burst, pattern=pattern))
+        return out
+
+
 class ProcessTable(ctk.CTkFrame):
+    """
+    Vista de ProcessTableModel: los widgets existen solo para las filas
+    visibles y al desplazarse se rellenan con otra fila del modelo, así se
+    pueden cargar y editar miles de procesos.
+    """
+
     def __init__(self, master, initial_rows=6):
         super().__init__(master)
-        self.rows = []
-        self._color_by_index = {}  # índice → color hex
+        self.model = ProcessTableModel()
+        self.rows = []      # widgets de las filas visibles: (nombre, llegada, patrón, color)
+        self._first = 0
+        self._visible = 1
+        self._row_height = 0
 
-        # Scrollable frame para la tabla
+        # Scrollable frame para la tabla; la barra vertical recorre el modelo, no el lienzo
         self.scroll = DualScrollFrame(self, height=270)
         self.scroll.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.scroll.canvas.configure(yscrollcommand=lambda *args: None)
+        self.scroll.v_scrollbar.configure(command=self._on_scrollbar)
         self.content_frame = ctk.CTkFrame(self.scroll.inner_frame)
         self.content_frame.pack(fill="x", expand=True, pady=5)
 
-        # Paleta de colores para procesos
-        palette = [
-            "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
-            "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
-            "#393b79", "#637939", "#8c6d31", "#843c39", "#7b4173",
-            "#3182bd", "#31a354", "#756bb1", "#636363", "#e6550d"
-        ]
-        self._palette = palette
+        self._palette = PALETTE
 
         self.grid_columnconfigure(0, weight=1)
 
@@ -36,113 +148,190 @@ class ProcessTable(ctk.CTkFrame):
 
         # Encabezados
         headers = ["Proceso", "Tiempo de llegada", "Tiempo de ejecución"]
+        self._header = []
         for i, text in enumerate(headers):
-            ctk.CTkLabel(
+            lbl = ctk.CTkLabel(
                 container,
                 text=text,
                 font=ctk.CTkFont(weight="bold")
-            ).grid(
+            )
+            lbl.grid(
                 row=0,
                 column=i,
                 padx=(10 if i == 0 else 20),
                 pady=(5, 0),
                 sticky="ew"
             )
+            self._header.append(lbl)
+
+        self.scroll.canvas.bind("<Configure>", self._on_canvas_configure, add="+")
+        if "linux" in sys.platform:
+            self.bind_all("<Button-4>", self._on_wheel, add=True)
+            self.bind_all("<Button-5>", self._on_wheel, add=True)
+        else:
+            self.bind_all("<MouseWheel>", self._on_wheel, add=True)
 
         # Crear filas iniciales
         self.set_rows(initial_rows)
 
+    # — Modelo —
+
     def set_rows(self, count: int):
         """Ajusta la cantidad de filas de la tabla."""
-        # Guardar datos actuales
-        current_data = []
-        for row in self.rows:
-            name_entry, arrival_frame, pattern_entry, *_ = row
-            current_data.append({
-                "name": name_entry.get(),
-                "arrival": arrival_frame.entry.get(),
-                "pattern_raw": pattern_entry.get()
-            })
-
-        # Eliminar filas de más
-        for i in range(len(self.rows)):
-            if i >= count:
-                for w in self.rows[i]:
-                    w.destroy()
-        self.rows = self.rows[:count]
-
-        # Añadir nuevas filas si falta
-        for i in range(len(self.rows), count):
-            container = self.content_frame
-            container.grid_columnconfigure(3, weight=0)
-
-            # Campo Nombre
-            name = ctk.CTkEntry(container, width=160)
-            name.grid(row=i+1, column=0, padx=(12, 12), pady=4, sticky="nsew")
-
-            # Campo Llegada (spinbox)
-            arr = self._create_spinbox_field(container, i+1, 1, default_val=0, min_val=0)
-            arr.grid(row=i+1, column=1, padx=(8, 12), pady=4, sticky="nsew")
-
-            # Campo Patrón raw
-            pattern_entry = ctk.CTkEntry(
-                container,
-                width=220,
-                placeholder_text="Ej: 3,(2),4"
-            )
-            pattern_entry.grid(row=i+1, column=2, padx=(8, 12), pady=4, sticky="nsew")
-
-            # Autocierre de paréntesis
-            def _auto_close_paren(event):
-                if event.char == "(":
-                    entry = event.widget
-                    pos = entry.index("insert")
-                    entry.insert(pos, ")")
-                    entry.icursor(pos)
-            pattern_entry.bind("<KeyRelease>", _auto_close_paren)
-
-            # Botón selector de color
-            def choose_color(index, btn):
-                color = tkinter.colorchooser.askcolor(
-                    title=f"Color para proceso {index+1}"
-                )[1]
-                if color:
-                    self._color_by_index[index] = color
-                    btn.configure(fg_color=color)
-
-            color_btn = ctk.CTkButton(container, text="🎨", width=36)
-            color_btn.configure(
-                command=lambda idx=i, btn=color_btn: choose_color(idx, btn)
-            )
-            color_btn.grid(row=i+1, column=3, padx=(4, 12), pady=4)
-
-            # Color por defecto
-            default_color = self._palette[i % len(self._palette)]
-            self._color_by_index[i] = default_color
-            color_btn.configure(fg_color=default_color)
-
-            # Añadir fila al registro
-            self.rows.append((name, arr, pattern_entry, color_btn))
-
-        # Restaurar valores previos o por defecto
-        for i, row in enumerate(self.rows):
-            name, arr_frame, pattern_entry, _ = row
-            if i < len(current_data):
-                name.delete(0, "end")
-                name.insert(0, current_data[i]["name"])
-                arr_frame.entry.delete(0, "end")
-                arr_frame.entry.insert(0, current_data[i]["arrival"])
-                pattern_entry.delete(0, "end")
-                pattern_entry.insert(0, current_data[i]["pattern_raw"])
-            else:
-                name.delete(0, "end")
-                name.insert(0, f"P{i+1}")
-                arr_frame.entry.delete(0, "end")
-                arr_frame.entry.insert(0, "0")
-                pattern_entry.delete(0, "end")
-                pattern_entry.insert(0, "")
-
-    def _create_spinbox_field(self, container, row, col, default_val, min_val=0, max_val=999):
+        self.model.resize(count)
+        self._render()
+
+    def load_processes(self, processes: Sequence[Process]):
+        """Reemplaza la tabla por 'processes' (p. ej. importados de un archivo)."""
+        self.model.load(processes)
+        self._first = 0
+        self._render()
+
+    def row_count(self) -> int:
+        return len(self.model)
+
+    def set_row(self, i: int, name: Optional[str] = None, arrival: Optional[str] = None,
+                pattern_raw: Optional[str] = None):
+        """Cambia una fila del modelo; llamar a refresh() al terminar."""
+        self.model.set_text(i, name, arrival, pattern_raw)
+
+    def refresh(self):
+        self._render()
+
+    # — Filas visibles —
+
+    def _add_widget_row(self):
+        i = len(self.rows)
+        container = self.content_frame
+        container.grid_columnconfigure(3, weight=0)
+
+        # Campo Nombre
+        name = ctk.CTkEntry(container, width=160)
+        name.grid(row=i+1, column=0, padx=(12, 12), pady=4, sticky="nsew")
+
+        # Campo Llegada (spinbox)
+        arr = self._create_spinbox_field(container, i+1, 1, default_val=0, min_val=0,
+                                         on_change=lambda slot=i: self._store(slot))
+        arr.grid(row=i+1, column=1, padx=(8, 12), pady=4, sticky="nsew")
+
+        # Campo Patrón raw
+        pattern_entry = ctk.CTkEntry(
+            container,
+            width=220,
+            placeholder_text="Ej: 3,(2),4"
+        )
+        pattern_entry.grid(row=i+1, column=2, padx=(8, 12), pady=4, sticky="nsew")
+
+        # Autocierre de paréntesis
+        def _auto_close_paren(event):
+            if event.char == "(":
+                entry = event.widget
+                pos = entry.index("insert")
+                entry.insert(pos, ")")
+                entry.icursor(pos)
+        pattern_entry.bind("<KeyRelease>", _auto_close_paren)
+
+        # Lo tecleado o pegado va al modelo. Los eventos de pegar/cortar llegan
+        # antes de que la clase Entry modifique el texto: se guarda en after_idle.
+        # Con <FocusOut> entra cualquier otro cambio antes de salir del campo.
+        for entry in (name, arr.entry, pattern_entry):
+            entry.bind("<KeyRelease>", lambda e, slot=i: self._store(slot), add="+")
+            entry.bind("<FocusOut>", lambda e, slot=i: self._store(slot), add="+")
+            for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+                entry.bind(sequence, lambda e, slot=i: self.after_idle(self._store, slot), add="+")
+
+        # Botón selector de color
+        def choose_color(slot, btn):
+            index = self._first + slot
+            color = tkinter.colorchooser.askcolor(
+                title=f"Color para proceso {index+1}"
+            )[1]
+            if color:
+                self.model.colors[index] = color
+                btn.configure(fg_color=color)
+
+        color_btn = ctk.CTkButton(container, text="🎨", width=36)
+        color_btn.configure(
+            command=lambda slot=i, btn=color_btn: choose_color(slot, btn)
+        )
+        color_btn.grid(row=i+1, column=3, padx=(4, 12), pady=4)
+
+        # Añadir fila al registro
+        self.rows.append((name, arr, pattern_entry, color_btn))
+
+    def _store(self, slot: int):
+        index = self._first + slot
+        if index < len(self.model):
+            name, arr_frame, pattern_entry, _ = self.rows[slot]
+            self.model.set_text(index, name.get(), arr_frame.entry.get(), pattern_entry.get())
+
+    def _on_canvas_configure(self, event):
+        if not self._row_height:
+            if not self.rows:
+                self._add_widget_row()
+            self.content_frame.update_idletasks()
+            self._row_height = max(self.rows[0][1].winfo_reqheight() + 8, 1)
+        header_h = self._header[0].winfo_reqheight() + 15
+        visible = max(1, (event.height - header_h) // self._row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _render(self):
+        total = len(self.model)
+        self._first = max(0, min(self._first, total - self._visible))
+        shown = min(self._visible, total)
+        while len(self.rows) < shown:
+            self._add_widget_row()
+        for slot, (name, arr_frame, pattern_entry, color_btn) in enumerate(self.rows):
+            widgets = (name, arr_frame, pattern_entry, color_btn)
+            if slot >= shown:
+                for w in widgets:
+                    w.grid_remove()
+                continue
+            index = self._first + slot
+            name_val, arrival_val, pattern_raw = self.model.text(index)
+            for w in widgets:
+                w.grid()
+            name.delete(0, "end")
+            name.insert(0, name_val)
+            arr_frame.entry.delete(0, "end")
+            arr_frame.entry.insert(0, arrival_val)
+            pattern_entry.delete(0, "end")
+            if pattern_raw:
+                pattern_entry.insert(0, pattern_raw)
+            color_btn.configure(fg_color=self.model.colors[index])
+        if total:
+            self.scroll.v_scrollbar.set(self._first / total, min(1.0, (self._first + shown) / total))
+        else:
+            self.scroll.v_scrollbar.set(0.0, 1.0)
+
+    def _scroll_to(self, first: int):
+        first = max(0, min(first, len(self.model) - self._visible))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._scroll_to(round(float(value) * len(self.model)))
+        else:
+            step = self._visible if unit == "pages" else 1
+            self._scroll_to(self._first + int(value) * step)
+
+    def _on_wheel(self, event):
+        # bind_all: solo cuenta si el puntero está sobre esta tabla
+        if not str(event.widget).startswith(str(self)):
+            return
+        if sys.platform.startswith("win"):
+            delta = -round(event.delta / 120) * WHEEL_ROWS
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -WHEEL_ROWS if event.num == 4 else WHEEL_ROWS
+        self._scroll_to(self._first + delta)
+
+    def _create_spinbox_field(self, container, row, col, default_val, min_val=0, max_val=999, on_change=None):
         """Crea un spinbox con botones + y – para valores enteros."""
         outer_frame = ctk.CTkFrame(container)
         outer_frame.grid(row=row, column=col, padx=10, pady=4, sticky="nsew")
@@ -160,6 +349,8 @@ class ProcessTable(ctk.CTkFrame):
             except ValueError:
                 entry.delete(0, "end")
                 entry.insert(0, str(default_val))
+            if on_change:
+                on_change()
 
         minus_btn = ctk.CTkButton(
             inner_frame, text="–", width=28, height=28,
@@ -183,74 +374,21 @@ class ProcessTable(ctk.CTkFrame):
 
     @staticmethod
     def _parse_pattern(raw: str):
-        """
-        Convierte una cadena como "2, 1, 3, (2), 4, 5" en
-        [("CPU", 6), ("BLOCK", 2), ("CPU", 9)].
-        Agrupa todos los segmentos CPU consecutivos sumando sus duraciones.
-        """
-        if not raw:
-            return None
-
-        tokens = re.findall(r'\(?\d+\)?', raw)
-        if not tokens:
-            return None
-
-        pattern = []
-        cpu_accum = 0
-
-        try:
-            for tok in tokens:
-                # Si es bloqueo, primero vuelca el CPU acumulado
-                if tok.startswith('(') and tok.endswith(')'):
-                    if cpu_accum > 0:
-                        pattern.append(("CPU", cpu_accum))
-                        cpu_accum = 0
-                    pattern.append(("BLOCK", int(tok[1:-1])))
-                else:
-                    # Acumula CPU
-                    cpu_accum += int(tok)
-
-            # Al final, si quedó CPU acumulado, agregarlo
-            if cpu_accum > 0:
-                pattern.append(("CPU", cpu_accum))
-
-        except ValueError:
-            return None
-
-        return pattern
+        """Ver core.models.parse_pattern ("3,(2),4" -> [("CPU", 3), ("BLOCK", 2), ("CPU", 4)])."""
+        return parse_pattern(raw)
 
     def get_data(self):
         """Devuelve lista de dicts con name, arrival, burst, color y el pattern parseado."""
-        data = []
-        for i, (name, arr_frame, pattern_entry, _) in enumerate(self.rows):
-            name_val = name.get().strip() or ""
-            arrival_val = arr_frame.entry.get().strip()
-            pattern_raw = pattern_entry.get().strip()
-
-            pattern = self._parse_pattern(pattern_raw)
-            if pattern is None and pattern_raw.isdigit():
-                pattern = [("CPU", int(pattern_raw))]
+        return [self.model.row_data(i) for i in range(len(self.model))]
 
-            burst = sum(d for k, d in (pattern or []) if k == "CPU")
-            color = self._color_by_index.get(i, "#1f1f1f")
-
-            data.append({
-                "name": name_val,
-                "arrival": arrival_val,
-                "burst": str(burst),
-                "color": color,
-                "pattern": pattern,
-                "pattern_raw": pattern_raw
-            })
+    def get_processes(self) -> List[Process]:
+        """Procesos de la tabla, sin pasar por get_data (ValueError si una fila es inválida)."""
+        return self.model.processes()
 
-        return data
+    def get_colors(self) -> Dict[str, str]:
+        return {self.model.name(i).strip(): color for i, color in enumerate(self.model.colors)}
 
     def reset(self):
         """Restablece la tabla a nombres P1, P2..., llegadas 0 y patrón vacío."""
-        for i, (name, arr_frame, pattern_entry, _) in enumerate(self.rows):
-            name.delete(0, "end")
-            name.insert(0, f"P{i+1}")
-            arr_frame.entry.delete(0, "end")
-            arr_frame.entry.insert(0, "0")
-            pattern_entry.delete(0, "end")
-            pattern_entry.insert(0, "")
\ No newline at end of file
+        self.model.reset()
+        self._render()
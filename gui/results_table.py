@@ -1,24 +1,78 @@
 # app/gui/results_table.py
 
+import sys
 import customtkinter as ctk
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from ..core.models import Process
 
+HEADERS = ["Proceso", "Llegada", "CPU", "Salida", "TR", "TE"]
+SORTABLE = (3, 4, 5)        # Salida, TR y TE se ordenan con un clic en el encabezado
+WHEEL_ROWS = 3              # filas por paso de la rueda del ratón
+
+
 class ResultsTable(ctk.CTkFrame):
+    """
+    Tabla virtual: solo existen las celdas de las filas visibles y al
+    desplazarse se les cambia el texto, así el costo no depende de la
+    cantidad de procesos. El orden se resuelve sobre los datos.
+    """
+
     def __init__(self, master):
         super().__init__(master)
 
-        # Layout: 2 filas => 0: body (scrollable con encabezado + datos), 1: footer (fijo)
+        # Layout: 2 filas => 0: body (encabezado + filas visibles + barra), 1: footer (fijo)
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=0)
 
-        # Body (fila 0): scrollable
-        self.body = ctk.CTkScrollableFrame(self, height=200)
+        # Body (fila 0): la grilla y su barra de desplazamiento
+        self.body = ctk.CTkFrame(self, height=200)
         self.body.grid(row=0, column=0, sticky="nsew", padx=8, pady=(8, 0))
-        # Configurar columnas del body
-        for col in range(6):
-            self.body.grid_columnconfigure(col, weight=1)
+        self.body.grid_columnconfigure(0, weight=1)
+        self.body.grid_rowconfigure(0, weight=1)
+        self.body.grid_propagate(False)
+
+        self.grid_frame = ctk.CTkFrame(self.body, fg_color="transparent")
+        self.grid_frame.grid(row=0, column=0, sticky="nsew")
+        # Configurar columnas de la grilla
+        for col in range(len(HEADERS)):
+            self.grid_frame.grid_columnconfigure(col, weight=1, uniform="col")
+
+        self.scrollbar = ctk.CTkScrollbar(self.body, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns", padx=(2, 0))
+
+        # Encabezado (se muestra con el primer resultado)
+        self._header_cells: List[ctk.CTkFrame] = []
+        self._header_labels: List[ctk.CTkLabel] = []
+        for j, h in enumerate(HEADERS):
+            cell = ctk.CTkFrame(self.grid_frame, fg_color="#200a0a", corner_radius=4)
+            lbl = ctk.CTkLabel(cell, text=h, font=ctk.CTkFont(weight="bold"))
+            lbl.pack(padx=4, pady=2)
+            if j in SORTABLE:
+                for w in (cell, lbl):
+                    w.bind("<Button-1>", lambda e, col=j: self._on_header_click(col))
+                lbl.configure(cursor="hand2")
+            self._header_cells.append(cell)
+            self._header_labels.append(lbl)
+
+        # Filas reutilizables: celdas y lo que muestra cada una
+        self._pool: List[Tuple[List[ctk.CTkFrame], List[ctk.CTkLabel]]] = []
+        self._pool_shown: List[Optional[tuple]] = []
+        self._row_height = 0
+
+        # Datos: filas en orden original y en el orden mostrado
+        self._data: List[tuple] = []
+        self._rows: List[tuple] = []
+        self._sort: Optional[Tuple[int, bool]] = None   # (columna, descendente)
+        self._first = 0
+        self._visible = 0
+
+        self.grid_frame.bind("<Configure>", lambda e: self._layout())
+        if "linux" in sys.platform:
+            self.bind_all("<Button-4>", self._on_wheel, add=True)
+            self.bind_all("<Button-5>", self._on_wheel, add=True)
+        else:
+            self.bind_all("<MouseWheel>", self._on_wheel, add=True)
 
         # Footer (fila 1): promedios
         self.footer = ctk.CTkFrame(
@@ -29,14 +83,24 @@ class ResultsTable(ctk.CTkFrame):
         )
         self.footer.grid(row=1, column=0, sticky="ew", padx=8, pady=(0, 8))
         self.footer.grid_propagate(False)
+        self._footer_cells: List[ctk.CTkFrame] = []
+        self._footer_labels: List[ctk.CTkLabel] = []
+        for j in range(len(HEADERS)):
+            cell = ctk.CTkFrame(self.footer, fg_color="#af53ab", corner_radius=4)
+            font = ctk.CTkFont(weight="bold") if j == 0 else None
+            lbl = ctk.CTkLabel(cell, text="", font=font)
+            lbl.pack(padx=4, pady=2)
+            self.footer.grid_columnconfigure(j, weight=1)
+            self._footer_cells.append(cell)
+            self._footer_labels.append(lbl)
 
     def clear(self):
-        # Borra filas (incluyendo encabezado) del body
-        for w in self.body.winfo_children():
-            w.destroy()
-        # Borra footer (promedios)
-        for w in self.footer.winfo_children():
-            w.destroy()
+        self._data = []
+        self._rows = []
+        self._first = 0
+        for cell in self._header_cells + self._footer_cells:
+            cell.grid_remove()
+        self._render()
 
     def update(
         self,
@@ -46,38 +110,20 @@ class ResultsTable(ctk.CTkFrame):
         avg_tr: float,
         avg_te: float
     ):
-        self.clear()
-
-        # 1) Encabezado dentro del scrollable body
-        headers = ["Proceso", "Llegada", "CPU", "Salida", "TR", "TE"]
-        for j, h in enumerate(headers):
-            cell = ctk.CTkFrame(
-                self.body,
-                fg_color="#200a0a",
-                corner_radius=4
-            )
-            cell.grid(row=0, column=j, padx=1, pady=1, sticky="nsew")
-            lbl = ctk.CTkLabel(cell, text=h, font=ctk.CTkFont(weight="bold"))
-            lbl.pack(padx=4, pady=2)
-
-        # 2) Filas de datos
-        for i, p in enumerate(processes, start=1):
+        # 1) Filas de datos (solo valores; las celdas se reutilizan)
+        data = []
+        for p in processes:
             tr_val = max(0, tr.get(p.name, 0))
             te_val = max(0, te.get(p.name, 0))
             salida = p.arrival + tr_val
-            fila_vals = [
-                p.name, p.arrival, p.burst,
-                salida, tr_val, te_val
-            ]
-            for j, val in enumerate(fila_vals):
-                cell = ctk.CTkFrame(
-                    self.body,
-                    fg_color="#2e2e2e",
-                    corner_radius=4
-                )
-                cell.grid(row=i, column=j, padx=1, pady=1, sticky="nsew")
-                lbl = ctk.CTkLabel(cell, text=str(val))
-                lbl.pack(padx=4, pady=2)
+            data.append((p.name, p.arrival, p.burst, salida, tr_val, te_val))
+        self._data = data
+        self._first = 0
+        self._apply_sort()
+
+        # 2) Encabezado
+        for j, cell in enumerate(self._header_cells):
+            cell.grid(row=0, column=j, padx=1, pady=1, sticky="nsew")
 
         # 3) Footer con promedio (permanece fijo)
         avg_tr_disp = max(0.0, avg_tr or 0.0)
@@ -86,14 +132,110 @@ class ResultsTable(ctk.CTkFrame):
             "Promedio", "—", "—", "—",
             f"{avg_tr_disp:.2f}", f"{avg_te_disp:.2f}"
         ]
-        for j, val in enumerate(footer_vals):
-            cell = ctk.CTkFrame(
-                self.footer,
-                fg_color="#af53ab",
-                corner_radius=4
-            )
+        for j, (cell, lbl) in enumerate(zip(self._footer_cells, self._footer_labels)):
+            lbl.configure(text=str(footer_vals[j]))
             cell.grid(row=0, column=j, padx=1, pady=1, sticky="nsew")
-            font = ctk.CTkFont(weight="bold") if j == 0 else None
-            lbl = ctk.CTkLabel(cell, text=str(val), font=font)
+
+        self._layout()
+
+    # — Orden —
+
+    def _on_header_click(self, col: int):
+        # Ascendente -> descendente -> orden original
+        if self._sort is None or self._sort[0] != col:
+            self._sort = (col, False)
+        elif not self._sort[1]:
+            self._sort = (col, True)
+        else:
+            self._sort = None
+        self._first = 0
+        self._apply_sort()
+        self._render()
+
+    def _apply_sort(self):
+        if self._sort is None:
+            self._rows = self._data
+        else:
+            col, desc = self._sort
+            self._rows = sorted(self._data, key=lambda row: row[col], reverse=desc)
+        for j, lbl in enumerate(self._header_labels):
+            mark = ""
+            if self._sort is not None and self._sort[0] == j:
+                mark = " ▼" if self._sort[1] else " ▲"
+            lbl.configure(text=HEADERS[j] + mark)
+
+    # — Filas visibles —
+
+    def _layout(self):
+        """Ajusta la cantidad de filas reutilizables al alto disponible."""
+        if not self._pool:
+            self._add_pool_row()
+            self.grid_frame.update_idletasks()
+            self._row_height = max(self._pool[0][0][0].winfo_reqheight() + 2, 1)
+        header_h = self._header_cells[0].winfo_reqheight() + 2 if self._data else 0
+        height = self.grid_frame.winfo_height()
+        visible = max(1, (height - header_h) // self._row_height)
+        while len(self._pool) < visible:
+            self._add_pool_row()
+        self._visible = visible
+        self._render()
+
+    def _add_pool_row(self):
+        cells, labels = [], []
+        for _ in HEADERS:
+            cell = ctk.CTkFrame(self.grid_frame, fg_color="#2e2e2e", corner_radius=4)
+            lbl = ctk.CTkLabel(cell, text="")
             lbl.pack(padx=4, pady=2)
-            self.footer.grid_columnconfigure(j, weight=1)
+            cells.append(cell)
+            labels.append(lbl)
+        self._pool.append((cells, labels))
+        self._pool_shown.append(None)
+
+    def _render(self):
+        total = len(self._rows)
+        self._first = max(0, min(self._first, total - self._visible))
+        for i, (cells, labels) in enumerate(self._pool):
+            idx = self._first + i
+            row = self._rows[idx] if i < self._visible and idx < total else None
+            if row is None:
+                if self._pool_shown[i] is not None:
+                    for cell in cells:
+                        cell.grid_remove()
+                    self._pool_shown[i] = None
+                continue
+            if self._pool_shown[i] is None:
+                for j, cell in enumerate(cells):
+                    cell.grid(row=i + 1, column=j, padx=1, pady=1, sticky="nsew")
+            if self._pool_shown[i] != row:
+                for lbl, val in zip(labels, row):
+                    lbl.configure(text=str(val))
+                self._pool_shown[i] = row
+        if total:
+            self.scrollbar.set(self._first / total, min(1.0, (self._first + self._visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _scroll_to(self, first: int):
+        first = max(0, min(first, len(self._rows) - self._visible))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._scroll_to(round(float(value) * len(self._rows)))
+        else:
+            step = self._visible if unit == "pages" else 1
+            self._scroll_to(self._first + int(value) * step)
+
+    def _on_wheel(self, event):
+        # bind_all: solo cuenta si el puntero está sobre esta tabla
+        if not str(event.widget).startswith(str(self.body)):
+            return
+        if sys.platform.startswith("win"):
+            delta = -round(event.delta / 120) * WHEEL_ROWS
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -WHEEL_ROWS if event.num == 4 else WHEEL_ROWS
+        self._scroll_to(self._first + delta)
@@ -0,0 +1,130 @@
+"""
+Medición del arranque de la interfaz (main.py --startup-profile).
+
+enable() instala un finder en sys.meta_path que cronometra la ejecución de
+cada módulo importado desde ese momento (tiempo propio, sin sus importes
+anidados, como -X importtime) y deja activas las fases de phase(). Al final
+report() imprime en stderr los importes agrupados por paquete y las fases
+(construcción de widgets, primer pintado, precarga en segundo plano).
+Sin enable(), phase() y mark() no hacen nada.
+"""
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from importlib.machinery import ExtensionFileLoader, SourceFileLoader, SourcelessFileLoader
+from typing import Dict, List, Optional, Tuple
+
+_profiler: Optional["StartupProfiler"] = None
+
+# Loaders con una instancia por módulo: se les puede envolver exec_module sin
+# afectar a otros (los de builtins y frozen son la clase misma y se ignoran).
+_PER_MODULE_LOADERS = (SourceFileLoader, SourcelessFileLoader, ExtensionFileLoader)
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.imports: Dict[str, float] = {}          # módulo -> tiempo propio (s)
+        self.phases: List[Tuple[str, float, float]] = []  # (nombre, inicio relativo, duración)
+        self._local = threading.local()               # pila de importes por hilo
+        self._lock = threading.Lock()
+
+    # --- Importes ---
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if isinstance(spec.loader, _PER_MODULE_LOADERS):
+                    self._wrap(spec.loader, name)
+                return spec
+        return None
+
+    def _wrap(self, loader, name: str):
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module):
+            stack = self._local.__dict__.setdefault("stack", [])
+            stack.append(0.0)                 # tiempo de los importes anidados
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                total = time.perf_counter() - start
+                nested = stack.pop()
+                if stack:
+                    stack[-1] += total
+                with self._lock:
+                    self.imports[name] = self.imports.get(name, 0.0) + total - nested
+
+        loader.exec_module = timed_exec_module
+
+    # --- Fases ---
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name, start)
+
+    def mark(self, name: str, start: Optional[float] = None):
+        """Registra una fase que empezó en 'start' (o un instante, desde el arranque)."""
+        now = time.perf_counter()
+        start = self.t0 if start is None else start
+        with self._lock:
+            self.phases.append((name, start - self.t0, now - start))
+
+    def report(self, file=None, top: int = 15):
+        file = file or sys.stderr
+        by_package: Dict[str, float] = {}
+        for name, t in self.imports.items():
+            root = name.split(".")[0]
+            # El propio paquete se desglosa por subpaquete (app.gui, app.core, ...)
+            key = ".".join(name.split(".")[:2]) if root == __name__.split(".")[0] else root
+            by_package[key] = by_package.get(key, 0.0) + t
+
+        print("== Arranque (ms) ==", file=file)
+        print(f"Importes: {sum(self.imports.values()) * 1000:.1f} en {len(self.imports)} módulos", file=file)
+        for key, t in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+            print(f"  {key:<32} {t * 1000:9.1f}", file=file)
+        print("Fases (inicio, duración):", file=file)
+        for name, start, dur in self.phases:
+            print(f"  {name:<32} {start * 1000:9.1f} {dur * 1000:9.1f}", file=file)
+
+
+def enable() -> StartupProfiler:
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+        sys.meta_path.insert(0, _profiler)
+    return _profiler
+
+
+def disable():
+    global _profiler
+    if _profiler is not None and _profiler in sys.meta_path:
+        sys.meta_path.remove(_profiler)
+    _profiler = None
+
+
+def active() -> Optional[StartupProfiler]:
+    return _profiler
+
+
+@contextmanager
+def phase(name: str):
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.phase(name):
+            yield
+
+
+def mark(name: str, start: Optional[float] = None):
+    if _profiler is not None:
+        _profiler.mark(name, start)
@@ -0,0 +1,82 @@
+"""
+Corridas de Calcular fuera del hilo de Tk.
+
+ScheduleJob planifica (y prepara lo que haga falta para mostrar el resultado)
+en un hilo aparte. El hilo no toca Tk: deja el avance y el resultado en
+atributos que la aplicación consulta con after(). Cancelar es cooperativo:
+el aviso de progreso de SchedulerStrategy.schedule levanta JobCancelled y la
+corrida se abandona en el siguiente aviso.
+
+Se usa un hilo y no un proceso: el Timeline resultante y los datos del Gantt
+no tienen que serializarse, y en Windows un proceso nuevo vuelve a importar
+todo el paquete.
+"""
+import threading
+from typing import Any, Callable, List, Optional
+
+from ..core.models import Process, ScheduleResult
+from ..core.scheduler_factory import SchedulerFactory
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class ScheduleJob:
+    def __init__(self, job_id: int, algorithm: str, processes: List[Process], quantum: Optional[int],
+                 prepare: Optional[Callable[[ScheduleResult], Any]] = None):
+        self.id = job_id
+        self.algorithm = algorithm
+        self.processes = processes
+        self.quantum = quantum
+        self._prepare = prepare
+
+        # Escritos por el hilo, leídos desde Tk
+        self.phase = "Planificando"
+        self.done = 0
+        self.total = len(processes)
+        self.result: Optional[ScheduleResult] = None
+        self.prepared: Any = None         # lo que devolvió 'prepare'
+        self.error: Optional[BaseException] = None
+
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"calcular-{job_id}", daemon=True)
+
+    def start(self) -> "ScheduleJob":
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Avance de la planificación entre 0 y 1 (None si no hay procesos)."""
+        return self.done / self.total if self.total else None
+
+    def _progress(self, done: int, total: int):
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.done, self.total = done, total
+
+    def _run(self):
+        try:
+            strategy = SchedulerFactory.create(self.algorithm)
+            result = strategy.schedule(self.processes, quantum=self.quantum, progress=self._progress)
+            if self._prepare is not None:
+                self.phase = "Preparando gráfico"
+                prepared = self._prepare(result)
+                self._progress(self.total, self.total)
+                self.prepared = prepared
+            self.result = result
+        except JobCancelled:
+            pass
+        except Exception as ex:
+            self.error = ex
@@ -1,7 +1,19 @@
 import os, sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from app.gui.app import SchedulerApp
 
 if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args != ["--startup-profile"]:
+        # Con argumentos: línea de comandos (chronomind), sin importar Tk ni matplotlib
+        from app.cli.commands import main
+        sys.exit(main(args))
+    if args:
+        # Tiempos de importes y construcción de widgets, en stderr tras la precarga
+        from app.gui import startup
+        startup.enable()
+        with startup.phase("import app.gui.app"):
+            from app.gui.app import SchedulerApp
+    else:
+        from app.gui.app import SchedulerApp
     app = SchedulerApp()
-    app.mainloop()
\ No newline at end of file
+    app.mainloop()
@@ -0,0 +1,30 @@
+"""
+Casos de regresión de la comparación de benchmarks contra un baseline:
+
+    python -m unittest app.tests.test_benchmarks
+"""
+import unittest
+
+from ..benchmarks.runner import compare
+
+
+def _case(n, wall_time=None, skipped=False):
+    return {"algorithm": "FIFO", "io": False, "quantum": None, "n": n,
+            "wall_time": wall_time, "slices": None if skipped else n, "skipped": skipped}
+
+
+class CompareTest(unittest.TestCase):
+    def test_salteado_por_presupuesto_es_regresion(self):
+        baseline = {"cases": [_case(1000, 0.01), _case(10000, 0.1)]}
+        report = {"cases": [_case(1000, 0.011), _case(10000, skipped=True)]}
+        self.assertEqual(compare(report, baseline),
+                         ["FIFO|cpu n=10000: salteado por presupuesto, base 0.1000 s"])
+
+    def test_salteado_tambien_en_la_base(self):
+        baseline = {"cases": [_case(1000, 0.01), _case(10000, skipped=True)]}
+        report = {"cases": [_case(1000, 0.011), _case(10000, skipped=True)]}
+        self.assertEqual(compare(report, baseline), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
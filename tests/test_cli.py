@@ -0,0 +1,36 @@
+"""
+Casos de regresión de la línea de comandos (lectura de cargas y exportación):
+
+    python -m unittest app.tests.test_cli
+"""
+import os
+import tempfile
+import unittest
+
+from ..cli.commands import main
+from ..cli.formats import parse_processes
+
+
+class LecturaTest(unittest.TestCase):
+    def test_nombres_repetidos(self):
+        with self.assertRaisesRegex(ValueError, r"<stdin>:3: nombre repetido 'A'"):
+            parse_processes("name,arrival,burst\nA,0,3\nA,1,1\n", "csv")
+        with self.assertRaisesRegex(ValueError, r"<stdin>\[1\]: nombre repetido"):
+            parse_processes('[{"name": "A", "burst": 3}, {"name": "A", "burst": 1}]', "json")
+
+
+class ExportacionTest(unittest.TestCase):
+    def test_excel_sin_procesos(self):
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            self.skipTest("falta openpyxl")
+        with tempfile.TemporaryDirectory() as d:
+            carga = os.path.join(d, "vacia.csv")
+            with open(carga, "w", encoding="utf-8") as f:
+                f.write("name,arrival,burst\n")
+            self.assertEqual(main(["export", carga, "-a", "FIFO", "-o", os.path.join(d, "e.xlsx")]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
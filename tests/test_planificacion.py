@@ -0,0 +1,81 @@
+"""
+Casos de regresión de las estrategias. Se corren desde el directorio que
+contiene el paquete:
+
+    python -m unittest app.tests.test_planificacion
+"""
+import unittest
+
+from ..core.models import Process, ExecSlice, SLICE_RUN, as_timeline
+from ..core.scheduler_factory import SchedulerFactory
+from ..core.timeline_store import SpilledTimeline
+
+
+def _schedule(algorithm, processes, quantum=2):
+    return SchedulerFactory.create(algorithm, cache=False).schedule(processes, quantum=quantum)
+
+
+class TramosTest(unittest.TestCase):
+    def test_bloqueo_de_duracion_cero_no_extiende_el_tramo_por_encima(self):
+        procs = [Process("A", 0, 3, [("CPU", 2), ("BLOCK", 0), ("CPU", 1)])]
+        for algorithm in SchedulerFactory.list_algorithms():
+            with self.subTest(algorithm=algorithm):
+                result = _schedule(algorithm, procs)
+                rows = [(name, kind, start, end) for name, kind, start, end in as_timeline(result.timeline).rows()]
+                self.assertEqual(rows, [("A", 0, 0, 3)])
+                self.assertEqual(dict(result.turnaround), {"A": 3})
+                self.assertEqual(dict(result.waiting), {"A": 0})
+
+
+class MetricasTest(unittest.TestCase):
+    def test_rafaga_cpu_de_duracion_cero_completa_al_llegar(self):
+        procs = [Process("A", 0, 0, [("CPU", 0)]), Process("B", 0, 3)]
+        for algorithm in ("SJF", "SRTF", "Round Robin"):
+            with self.subTest(algorithm=algorithm):
+                result = _schedule(algorithm, procs)
+                self.assertEqual(dict(result.turnaround), {"A": 0, "B": 3})
+                self.assertEqual(dict(result.waiting), {"A": 0, "B": 0})
+
+
+class RoundRobinTest(unittest.TestCase):
+    # Tres procesos con CPU de sobra: las vueltas completas se saltan como RotationRun
+    PROCS = [Process("A", 0, 6), Process("B", 0, 6), Process("C", 0, 6), Process("D", 20, 1)]
+    CPU = [("A", 0, 2), ("B", 2, 4), ("C", 4, 6), ("A", 6, 8), ("B", 8, 10), ("C", 10, 12),
+           ("A", 12, 14), ("B", 14, 16), ("C", 16, 18), ("D", 20, 21)]
+
+    def test_vueltas_compactas_equivalen_al_paso_a_paso(self):
+        result = _schedule("Round Robin", self.PROCS)
+        self.assertIn(SLICE_RUN, result.timeline.columns()[3])
+        rows = [(name, start, end) for name, kind, start, end in result.timeline.rows()]
+        self.assertEqual(rows, self.CPU)
+        self.assertEqual(dict(result.turnaround), {"A": 14, "B": 16, "C": 18, "D": 1})
+        self.assertEqual(dict(result.waiting), {"A": 8, "B": 10, "C": 12, "D": 0})
+
+    def test_indexado_de_filas_compactas(self):
+        timeline = _schedule("Round Robin", self.PROCS).timeline
+        expected = [ExecSlice(*row) for row in self.CPU]
+        self.assertEqual(len(timeline), len(expected))
+        self.assertEqual([timeline[i] for i in range(len(timeline))], expected)
+        self.assertEqual(list(timeline), expected)
+        self.assertEqual(timeline[-1], expected[-1])
+        self.assertEqual(timeline[2:7], expected[2:7])
+        with self.assertRaises(IndexError):
+            timeline[len(expected)]
+
+
+class SpilledTimelineTest(unittest.TestCase):
+    def test_close_deja_el_timeline_vacio(self):
+        procs = [Process(f"P{i}", 0, 50) for i in range(4)]
+        result = SchedulerFactory.create("Round Robin", cache=False).schedule(procs, quantum=1, spill=True)
+        timeline = result.timeline
+        self.assertIsInstance(timeline, SpilledTimeline)
+        self.assertEqual(len(timeline), 200)
+        timeline.close()
+        self.assertEqual(len(timeline), 0)
+        self.assertEqual(list(timeline.rows()), [])
+        with self.assertRaises(IndexError):
+            timeline[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Casos de regresión de la caché de resultados (core/result_cache.py):
+
+    python -m unittest app.tests.test_result_cache
+"""
+import os
+import tempfile
+import unittest
+
+from ..core.models import Process, RotationRun, Workload
+from ..core.result_cache import CACHE_VERSION, ResultCache, _HEADER, _decode, cache_key
+from ..core.scheduler_factory import SchedulerFactory
+
+# Vueltas completas de Round Robin (RotationRun) y un bloqueo
+PROCS = [
+    Process("A", 0, 9),
+    Process("B", 0, 9),
+    Process("C", 0, 9),
+    Process("D", 1, 4, [("CPU", 2), ("BLOCK", 3), ("CPU", 2)]),
+]
+
+
+def _resumen(result):
+    runs = [r for r in result.timeline.runs() if isinstance(r, RotationRun)]
+    return (list(result.timeline.rows()), runs, dict(result.turnaround), dict(result.waiting),
+            result.avg_turnaround, result.avg_waiting)
+
+
+class DiscoTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.result = SchedulerFactory.create("Round Robin", cache=False).schedule(PROCS, quantum=1)
+        self.key = cache_key("Round Robin", 1, Workload(PROCS))
+        ResultCache(disk_dir=self.dir).put(self.key, self.result)
+        self.path = os.path.join(self.dir, self.key + ".result")
+
+    def test_ida_y_vuelta(self):
+        with open(self.path, "rb") as f:
+            decoded = _decode(f.read())
+        self.assertTrue(_resumen(self.result)[1], "la carga debe producir RotationRun")
+        self.assertEqual(_resumen(decoded), _resumen(self.result))
+        # Otra caché sobre el mismo directorio (memoria vacía) lo lee del disco
+        cache = ResultCache(disk_dir=self.dir)
+        self.assertEqual(_resumen(cache.get(self.key)), _resumen(self.result))
+        self.assertEqual(cache.hits, 1)
+
+    def _reescribir(self, data: bytes):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def test_archivo_truncado_se_descarta(self):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for size in (len(data) - 1, _HEADER.size + 1, 3):
+            with self.subTest(size=size):
+                self._reescribir(data[:size])
+                self.assertIsNone(ResultCache(disk_dir=self.dir).get(self.key))
+                self.assertFalse(os.path.exists(self.path))
+
+    def test_version_anterior_se_descarta(self):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        magic, _, header_len = _HEADER.unpack_from(data)
+        self._reescribir(_HEADER.pack(magic, CACHE_VERSION - 1, header_len) + data[_HEADER.size:])
+        self.assertIsNone(ResultCache(disk_dir=self.dir).get(self.key))
+        self.assertFalse(os.path.exists(self.path))
+
+
+class ClaveTest(unittest.TestCase):
+    def test_sin_patron_equivale_a_una_rafaga_cpu(self):
+        sin_patron = Workload([Process("A", 0, 3), Process("B", 1, 2)])
+        con_patron = Workload([Process("A", 0, 3, [("CPU", 3)]), Process("B", 1, 2, [("CPU", 2)])])
+        self.assertEqual(cache_key("SJF", None, sin_patron), cache_key("SJF", None, con_patron))
+
+    def test_quantum_solo_cuenta_en_round_robin(self):
+        for algorithm, entradas in (("FIFO", 1), ("SJF", 1), ("SRTF", 1), ("Round Robin", 2)):
+            with self.subTest(algorithm=algorithm):
+                strategy = SchedulerFactory.create(algorithm, cache=False)
+                strategy.cache = cache = ResultCache()
+                first = strategy.schedule(PROCS, quantum=1)
+                second = strategy.schedule(PROCS, quantum=3)
+                self.assertEqual(len(cache), entradas)
+                self.assertEqual(first is second, entradas == 1)
+
+
+if __name__ == "__main__":
+    unittest.main()